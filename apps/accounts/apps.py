@@ -4,3 +4,11 @@ from django.apps import AppConfig
 class AccountsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.accounts'
+
+    def ready(self):
+        from django.contrib.auth.signals import user_logged_in
+        from .backends import update_last_login
+
+        # Django's receiver would try to UPDATE a SQLite row that Mongo-backed users don't have.
+        user_logged_in.disconnect(dispatch_uid="update_last_login")
+        user_logged_in.connect(update_last_login, dispatch_uid="update_last_login")
@@ -0,0 +1,42 @@
+# apps/accounts/backends.py
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import update_last_login as update_sql_last_login
+from django.utils import timezone
+
+from .models import MongoUser
+
+
+class MongoUserBackend:
+    """Authenticate against `MongoUser` accounts; SQLite is never read or written."""
+
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        if username is None or password is None:
+            return None
+        account = MongoUser.objects(username=username).first()
+        if account is None:
+            # Hash anyway so unknown usernames take as long as wrong passwords.
+            make_password(password)
+            return None
+        if account.is_active and account.check_password(password):
+            return account.as_auth_user()
+        return None
+
+    def get_user(self, user_id):
+        account = MongoUser.objects(id=user_id, is_active=True).first()
+        return account.as_auth_user() if account else None
+
+    def has_perm(self, user_obj, perm, obj=None):
+        return user_obj.is_active and user_obj.is_superuser
+
+    def has_module_perms(self, user_obj, app_label):
+        return user_obj.is_active and user_obj.is_superuser
+
+
+def update_last_login(sender, user, **kwargs):
+    """Replaces Django's receiver so Mongo-backed users get `last_login` stored in MongoDB."""
+
+    if getattr(user, "mongo_backed", False):
+        MongoUser.objects(id=user.pk).update_one(set__last_login=timezone.now())
+    else:
+        update_sql_last_login(sender, user, **kwargs)
@@ -0,0 +1,31 @@
+# apps/accounts/management/commands/import_sqlite_users.py
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+
+from apps.accounts.models import MongoUser
+
+
+class Command(BaseCommand):
+    help = "Copy Django auth users (with their password hashes) from SQLite into MongoDB."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--overwrite", action="store_true", help="Update accounts that already exist in MongoDB.")
+
+    def handle(self, *args, **options):
+        created = updated = skipped = 0
+        for user in User.objects.order_by("id"):
+            account = MongoUser.objects(username=user.username).first()
+            if account is not None and not options["overwrite"]:
+                skipped += 1
+                continue
+            if account is None:
+                account = MongoUser(username=user.username)
+                created += 1
+            else:
+                updated += 1
+            for field in ("password", "email", "first_name", "last_name", "is_active", "is_staff",
+                          "is_superuser", "last_login", "date_joined"):
+                setattr(account, field, getattr(user, field))
+            account.save()
+        self.stdout.write(f"Users imported: {created} created, {updated} updated, {skipped} skipped.")
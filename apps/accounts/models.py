@@ -1,3 +1,64 @@
-from django.db import models
+# apps/accounts/models.py
 
-# Create your models here.
+from django.contrib.auth.hashers import check_password, make_password
+from django.contrib.auth.models import User
+from django.utils import timezone
+from mongoengine import BooleanField, DateTimeField, Document, SequenceField, StringField
+
+
+class MongoUser(Document):
+    """Admin account stored in MongoDB instead of the SQLite `auth_user` table.
+
+    `id` is an integer sequence so sessions and `request.user.pk` look exactly like
+    they did with Django's user model.
+    """
+
+    id = SequenceField(primary_key=True)
+    username = StringField(max_length=150, required=True, unique=True)
+    password = StringField(max_length=128, required=True)
+    email = StringField(default="")
+    first_name = StringField(max_length=150, default="")
+    last_name = StringField(max_length=150, default="")
+    is_active = BooleanField(default=True)
+    is_staff = BooleanField(default=True)
+    is_superuser = BooleanField(default=False)
+    last_login = DateTimeField()
+    date_joined = DateTimeField(default=timezone.now)
+
+    meta = {"collection": "admin_users"}
+
+    def __str__(self):
+        return self.username
+
+    def set_password(self, raw_password):
+        self.password = make_password(raw_password)
+
+    def check_password(self, raw_password):
+        def upgrade(raw_password):
+            # The hasher settings changed since this hash was made; store the new one.
+            self.set_password(raw_password)
+            MongoUser.objects(id=self.id).update_one(set__password=self.password)
+
+        return check_password(raw_password, self.password, upgrade)
+
+    def as_auth_user(self):
+        """An unsaved `User` mirroring this account, used as `request.user`.
+
+        It is never written to SQLite; `mongo_backed` marks it for the login signal.
+        """
+
+        user = User(
+            id=self.id,
+            username=self.username,
+            password=self.password,
+            email=self.email,
+            first_name=self.first_name,
+            last_name=self.last_name,
+            is_active=self.is_active,
+            is_staff=self.is_staff,
+            is_superuser=self.is_superuser,
+            last_login=self.last_login,
+            date_joined=self.date_joined,
+        )
+        user.mongo_backed = True
+        return user
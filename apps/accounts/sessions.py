@@ -0,0 +1,88 @@
+# apps/accounts/sessions.py
+
+from django.contrib.sessions.backends.base import CreateError, SessionBase, UpdateError
+from django.utils import timezone
+from mongoengine import DateTimeField, Document, StringField
+from pymongo.errors import DuplicateKeyError
+
+
+class MongoSession(Document):
+    """One session; MongoDB's TTL monitor removes it once `expire_date` passes."""
+
+    session_key = StringField(primary_key=True, max_length=40)
+    session_data = StringField()
+    expire_date = DateTimeField()
+
+    meta = {
+        "collection": "sessions",
+        "indexes": [{"fields": ["expire_date"], "expireAfterSeconds": 0}],
+    }
+
+
+class SessionStore(SessionBase):
+    """Session engine storing sessions in MongoDB (`SESSION_ENGINE = "apps.accounts.sessions"`).
+
+    Each load is one `_id` lookup and each save one upsert, so workers and instances
+    share sessions without SQLite's single-writer lock.
+    """
+
+    @classmethod
+    def get_model_class(cls):
+        return MongoSession
+
+    @staticmethod
+    def _collection():
+        return MongoSession._get_collection()
+
+    def load(self):
+        row = self._collection().find_one(
+            {"_id": self.session_key, "expire_date": {"$gt": timezone.now()}},
+            {"session_data": 1},
+        )
+        if row is None:
+            self._session_key = None
+            return {}
+        return self.decode(row["session_data"])
+
+    def exists(self, session_key):
+        return self._collection().count_documents({"_id": session_key}, limit=1) > 0
+
+    def create(self):
+        while True:
+            self._session_key = self._get_new_session_key()
+            try:
+                self.save(must_create=True)
+            except CreateError:
+                continue
+            self.modified = True
+            return
+
+    def save(self, must_create=False):
+        if self.session_key is None:
+            return self.create()
+        fields = {
+            "session_data": self.encode(self._get_session(no_load=must_create)),
+            "expire_date": self.get_expiry_date(),
+        }
+        if must_create:
+            try:
+                self._collection().insert_one(dict(fields, _id=self._session_key))
+            except DuplicateKeyError:
+                raise CreateError
+            return
+        result = self._collection().update_one({"_id": self._session_key}, {"$set": fields})
+        if not result.matched_count:
+            # Deleted or expired concurrently (e.g. a logout in another tab).
+            raise UpdateError
+
+    def delete(self, session_key=None):
+        if session_key is None:
+            if self.session_key is None:
+                return
+            session_key = self.session_key
+        self._collection().delete_one({"_id": session_key})
+
+    @classmethod
+    def clear_expired(cls):
+        # The TTL index does this continuously; kept for `manage.py clearsessions`.
+        cls._collection().delete_many({"expire_date": {"$lt": timezone.now()}})
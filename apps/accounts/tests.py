@@ -1,3 +1,65 @@
-from django.test import TestCase
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth import authenticate
+from django.test import Client, override_settings
+from django.urls import reverse
+
+from apps.public.ratelimit import MemoryBackend
+from apps.public.testing import MongoTestCase
+
+from .models import MongoUser
+
+
+class MongoUserBackendTests(MongoTestCase):
+    def setUp(self):
+        super().setUp()
+        self.account = MongoUser(username="admin", is_superuser=True)
+        self.account.set_password("secret")
+        self.account.save()
+
+    def test_authenticates_against_mongo_accounts(self):
+        user = authenticate(username="admin", password="secret")
+
+        self.assertEqual(user.pk, self.account.id)
+        self.assertTrue(user.mongo_backed)
+        self.assertIsNone(authenticate(username="admin", password="wrong"))
+        self.assertIsNone(authenticate(username="nobody", password="secret"))
+
+    def test_inactive_accounts_cannot_log_in(self):
+        self.account.is_active = False
+        self.account.save()
+
+        self.assertIsNone(authenticate(username="admin", password="secret"))
+
+    # The manifest storage needs `collectstatic`, which tests do not run.
+    @override_settings(STATICFILES_STORAGE="django.contrib.staticfiles.storage.StaticFilesStorage")
+    def test_logged_in_client_reaches_the_admin(self):
+        client = Client()
+
+        self.assertTrue(client.login(username="admin", password="secret"))
+        self.assertEqual(client.get(reverse("admin_dashboard"), secure=True).status_code, 200)
+        self.assertIsNotNone(MongoUser.objects.get(id=self.account.id).last_login)
+
+    @override_settings(
+        STATICFILES_STORAGE="django.contrib.staticfiles.storage.StaticFilesStorage",
+        RATELIMIT_ENABLED=True,
+        RATELIMIT_PROXY_COUNT=0,
+    )
+    def test_only_failed_logins_count_and_only_from_the_same_client(self):
+        def login(password, address="203.0.113.7"):
+            return Client().post(
+                reverse("admin_login"),
+                {"username": "admin", "password": password},
+                secure=True,
+                REMOTE_ADDR=address,
+            )
+
+        with mock.patch("apps.public.ratelimit._backend", MemoryBackend()):
+            for _ in range(4):
+                self.assertEqual(login("secret").status_code, 302)
+            for _ in range(5):
+                self.assertEqual(login("wrong").status_code, 200)
+            self.assertEqual(login("secret").status_code, 429)
+
+            # Someone else's failures never lock the admin out of their own address.
+            self.assertEqual(login("secret", address="198.51.100.4").status_code, 302)
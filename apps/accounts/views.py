@@ -5,6 +5,13 @@ from django.contrib.auth import authenticate, login, logout
 from django.contrib import messages
 from django.urls import reverse
 
+from apps.public.ratelimit import FailureLimit, post_field_and_ip, rate_limit, rate_limited_response
+
+# Wrong passwords per username and client; successful logins are never counted.
+login_failures = FailureLimit("login-username", "5/5m", key=post_field_and_ip("username"))
+
+
+@rate_limit("login-ip", "10/5m")
 def admin_login(request):
     """Admin login view"""
     if request.user.is_authenticated:
@@ -13,7 +20,11 @@ def admin_login(request):
     if request.method == 'POST':
         username = request.POST.get('username')
         password = request.POST.get('password')
-        
+
+        wait = login_failures.check(request)
+        if wait:
+            return rate_limited_response(request, wait)
+
         user = authenticate(request, username=username, password=password)
         
         if user is not None:
@@ -25,6 +36,7 @@ def admin_login(request):
                 return redirect(next_page)
             return redirect(reverse('admin_dashboard'))
         else:
+            login_failures.fail(request)
             messages.error(request, 'Invalid username or password')
     
     return render(request, 'admin/login.html')
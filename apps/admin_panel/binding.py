@@ -0,0 +1,62 @@
+# apps/admin_panel/binding.py
+
+from datetime import timezone as dt_timezone
+
+from django.utils import timezone
+
+
+def _is_empty(value):
+    return value is None or value == "" or value == []
+
+
+def _normalize(field, value):
+    """The value as the field stores it, so a submitted "5" compares equal to a stored 5."""
+
+    if value is None:
+        return None
+    try:
+        value = field.to_python(value)
+    except (TypeError, ValueError):
+        return value
+    if hasattr(value, "tzinfo") and timezone.is_aware(value):
+        # Stored datetimes come back naive UTC with millisecond precision.
+        value = timezone.make_naive(value, dt_timezone.utc)
+        value = value.replace(microsecond=value.microsecond // 1000 * 1000)
+    return value
+
+
+def bind(document, values):
+    """Assign each of `values` that differs from the document's current value.
+
+    Values are normalized through the field first and empty values (None, "", [])
+    are treated as equal, so re-submitting an unchanged form assigns nothing. Returns
+    the names of the fields that changed.
+    """
+
+    changed = []
+    for name, value in values.items():
+        field = document._fields[name]
+        value = _normalize(field, value)
+        current = _normalize(field, getattr(document, name))
+        if current == value or (_is_empty(current) and _is_empty(value)):
+            continue
+        setattr(document, name, value)
+        changed.append(name)
+    return changed
+
+
+def save_changes(document, values=None):
+    """Bind `values` and save only if something changed; returns the changed fields.
+
+    MongoEngine then writes a `$set` of just those fields. Changes assigned directly
+    beforehand (e.g. an uploaded image) count too. When nothing changed the document is
+    not written, so `updated_at` and the content versions stay put and caches keyed on
+    them survive.
+    """
+
+    if values:
+        bind(document, values)
+    changed = document._get_changed_fields()
+    if changed:
+        document.save()
+    return changed
@@ -0,0 +1,226 @@
+# apps/admin_panel/bulk.py
+
+from bson import ObjectId
+from bson.errors import InvalidId
+from django.utils import timezone
+from pymongo import UpdateMany
+
+from apps.common_utils import delete_stored_files
+from apps.public.counters import bump_content_version, delete_deltas, increment, update_deltas
+from apps.public import rollups as contact_rollups
+from apps.public.models import Blog, ContactSubmission, Project, Skill
+from apps.public.related import RelatedContentMixin, detach_related, rebuild_related, refresh_related
+from apps.public.slugs import slug_ids
+
+
+# Above this many documents, related lists are rebuilt in one pass instead of patched one by one.
+RELATED_REBUILD_THRESHOLD = 50
+
+
+class BulkActionError(Exception):
+    """The bulk request names an unknown action or invalid ids."""
+
+
+class BulkAction:
+    """A named `$set` (or a delete) applied to every selected document.
+
+    `stamp` lists fields set to the current time only where they are still empty,
+    e.g. `published_date` when publishing.
+    """
+
+    def __init__(self, label, values=None, stamp=(), delete=False):
+        self.label = label
+        self.values = values or {}
+        self.stamp = stamp
+        self.delete = delete
+
+
+class BulkTarget:
+    """`rollups` is a module with `update_deltas`, `delete_deltas` and `apply_deltas`
+    for daily rollups kept alongside the site counters (see `apps.public.rollups`)."""
+
+    def __init__(self, document_class, list_url, actions, media_fields=(), rollups=None):
+        self.document_class = document_class
+        self.list_url = list_url
+        self.actions = actions
+        self.media_fields = media_fields
+        self.rollups = rollups
+
+
+class BulkResult:
+    def __init__(self, action, requested, matched=0, modified=0, files_deleted=0):
+        self.action = action
+        self.requested = requested
+        self.matched = matched
+        self.modified = modified
+        self.files_deleted = files_deleted
+
+    @property
+    def message(self):
+        if self.action.delete:
+            message = f"{self.action.label}: {self.modified} of {self.requested} deleted"
+            if self.files_deleted:
+                message += f", {self.files_deleted} file(s) removed"
+            return message + "."
+        return f"{self.action.label}: {self.matched} matched, {self.modified} modified."
+
+
+BULK_TARGETS = {
+    "blogs": BulkTarget(
+        Blog,
+        "admin_blogs_list",
+        {
+            "publish": BulkAction("Publish", {"status": "published"}, stamp=("published_date",)),
+            "unpublish": BulkAction("Unpublish", {"status": "draft"}),
+            "activate": BulkAction("Activate", {"is_active": True}),
+            "deactivate": BulkAction("Deactivate", {"is_active": False}),
+            "delete": BulkAction("Delete", delete=True),
+        },
+        media_fields=("cover_image_path",),
+    ),
+    "projects": BulkTarget(
+        Project,
+        "admin_project_manager",
+        {
+            "activate": BulkAction("Activate", {"is_active": True}),
+            "deactivate": BulkAction("Deactivate", {"is_active": False}),
+            "feature": BulkAction("Feature", {"is_featured": True}),
+            "unfeature": BulkAction("Unfeature", {"is_featured": False}),
+            "delete": BulkAction("Delete", delete=True),
+        },
+        media_fields=("image_path",),
+    ),
+    "skills": BulkTarget(
+        Skill,
+        "admin_skills_manager",
+        {
+            "activate": BulkAction("Activate", {"is_active": True}),
+            "deactivate": BulkAction("Deactivate", {"is_active": False}),
+            "delete": BulkAction("Delete", delete=True),
+        },
+    ),
+    "contact-submissions": BulkTarget(
+        ContactSubmission,
+        "admin_contact_submissions",
+        {
+            "mark_read": BulkAction("Mark read", {"is_read": True}),
+            "mark_unread": BulkAction("Mark unread", {"is_read": False}),
+            "delete": BulkAction("Delete", delete=True),
+        },
+        rollups=contact_rollups,
+    ),
+}
+
+
+def bulk_action_choices(collection):
+    """(value, label) pairs for the bulk action bar of a list view."""
+
+    return [(name, action.label) for name, action in BULK_TARGETS[collection].actions.items()]
+
+
+def _object_ids(values):
+    try:
+        return list({ObjectId(value) for value in values})
+    except (InvalidId, TypeError):
+        raise BulkActionError("Invalid document id in selection.")
+
+
+def _sync_related(document_class, document_ids, deleted):
+    if not issubclass(document_class, RelatedContentMixin):
+        return
+    if len(document_ids) > RELATED_REBUILD_THRESHOLD:
+        rebuild_related(document_class)
+        return
+    for document_id in document_ids:
+        if deleted:
+            detach_related(document_class, document_id)
+        else:
+            refresh_related(document_class, document_id)
+
+
+def _run_delete(target, action, document_ids):
+    document_class = target.document_class
+    collection = document_class._get_collection()
+    raw_filter = {"_id": {"$in": document_ids}}
+    has_slug = "slug" in document_class._fields
+
+    projection = {field: 1 for field in target.media_fields}
+    if has_slug:
+        projection["slug"] = 1
+    rows = list(collection.find(raw_filter, projection or {"_id": 1}))
+
+    deltas = delete_deltas(document_class, raw_filter)
+    rollup_deltas = target.rollups.delete_deltas(raw_filter) if target.rollups else None
+    result = collection.delete_many(raw_filter)
+    increment(**deltas)
+    if rollup_deltas:
+        target.rollups.apply_deltas(rollup_deltas)
+    if result.deleted_count:
+        bump_content_version(document_class._get_collection_name())
+
+    if has_slug:
+        for row in rows:
+            if row.get("slug"):
+                slug_ids.discard(document_class._get_collection_name(), row["slug"])
+    _sync_related(document_class, [row["_id"] for row in rows], deleted=True)
+    files_deleted = delete_stored_files(row.get(field) for row in rows for field in target.media_fields)
+    return BulkResult(action, len(document_ids), len(rows), result.deleted_count, files_deleted)
+
+
+def _run_update(target, action, document_ids):
+    document_class = target.document_class
+    collection = document_class._get_collection()
+    raw_filter = {"_id": {"$in": document_ids}}
+    values = action.values
+
+    # Only documents that actually differ are written, so `modified` is exact even
+    # though `updated_at` is refreshed on every write.
+    differs = {"$or": [{field: {"$ne": value}} for field, value in values.items()]}
+    now = timezone.now()
+    update = dict(values)
+    if "updated_at" in document_class._fields:
+        update["updated_at"] = now
+
+    operations = []
+    if action.stamp:
+        missing = {"$or": [{field: None} for field in action.stamp]}
+        present = {field: {"$ne": None} for field in action.stamp}
+        operations.append(UpdateMany(
+            {"$and": [raw_filter, differs, missing]},
+            {"$set": dict(update, **{field: now for field in action.stamp})},
+        ))
+        operations.append(UpdateMany({"$and": [raw_filter, differs, present]}, {"$set": update}))
+    else:
+        operations.append(UpdateMany({"$and": [raw_filter, differs]}, {"$set": update}))
+
+    matched = collection.count_documents(raw_filter)
+    deltas = update_deltas(document_class, raw_filter, values)
+    rollup_deltas = target.rollups.update_deltas(raw_filter, values) if target.rollups else None
+    result = collection.bulk_write(operations, ordered=False)
+    increment(**deltas)
+    if rollup_deltas:
+        target.rollups.apply_deltas(rollup_deltas)
+    if result.modified_count:
+        bump_content_version(document_class._get_collection_name())
+        watched = set(getattr(document_class, "related_features", ())) | set(getattr(document_class, "related_filters", ()))
+        if watched & set(values):
+            _sync_related(document_class, document_ids, deleted=False)
+    return BulkResult(action, len(document_ids), matched, result.modified_count)
+
+
+def run_bulk_action(target, action_name, ids):
+    """Apply `action_name` to the selected ids of `target` with one write round trip.
+
+    Site counters, content versions and related lists are kept in step; deletes also
+    remove the documents' media in a single storage pass.
+    """
+
+    action = target.actions.get(action_name)
+    if action is None:
+        raise BulkActionError(f"Unknown action: {action_name!r}.")
+    document_ids = _object_ids(ids)
+    if not document_ids:
+        raise BulkActionError("No items selected.")
+    if action.delete:
+        return _run_delete(target, action, document_ids)
+    return _run_update(target, action, document_ids)
@@ -0,0 +1,138 @@
+# apps/admin_panel/reorder.py
+
+from datetime import datetime
+
+from bson import ObjectId
+from bson.errors import InvalidId
+from django.utils import timezone
+from pymongo import UpdateOne
+
+from apps.public.counters import bump_content_version
+from apps.public.models import (
+    version_token,
+    Achievement,
+    CoreValue,
+    Education,
+    Experience,
+    Interest,
+    ResearchCategory,
+    SkillCategory,
+)
+
+
+# URL key -> document class for every collection ordered by an `order` field.
+REORDERABLE_DOCUMENTS = {
+    "education": Education,
+    "experiences": Experience,
+    "achievements": Achievement,
+    "interests": Interest,
+    "values": CoreValue,
+    "research-categories": ResearchCategory,
+    "skill-categories": SkillCategory,
+}
+
+
+class ReorderError(Exception):
+    """The submitted ordering is malformed or incomplete."""
+
+
+class ReorderConflict(Exception):
+    """Some documents changed since the ordering was rendered."""
+
+    def __init__(self, versions):
+        super().__init__("The list was changed by someone else. Reload and try again.")
+        self.versions = versions
+
+
+def _parse_token(token):
+    if not token:
+        return None
+    try:
+        return datetime.fromisoformat(token)
+    except (TypeError, ValueError):
+        raise ReorderError(f"Invalid version token: {token!r}.")
+
+
+def _is_descending(document_class):
+    return "-order" in document_class._meta.get("ordering", [])
+
+
+def apply_ordering(document_class, items):
+    """Persist a complete ordering of `document_class` with one `bulk_write`.
+
+    `items` lists `{"id", "updated_at"}` in display order. Every document of the
+    collection must appear exactly once, and each `updated_at` must still match the
+    stored one; otherwise nothing is written. Each update is also guarded on its
+    `updated_at`; if a writer races between the check and the write, the updates
+    that did apply are rolled back and `ReorderConflict` carries the stored versions.
+    Returns the new version tokens keyed by id.
+    """
+
+    try:
+        ids = [ObjectId(item["id"]) for item in items]
+        tokens = [_parse_token(item.get("updated_at")) for item in items]
+    except (KeyError, TypeError, InvalidId):
+        raise ReorderError("Each item needs a valid id.")
+    if len(set(ids)) != len(ids):
+        raise ReorderError("The ordering lists a document more than once.")
+
+    collection = document_class._get_collection()
+    current = {
+        row["_id"]: row
+        for row in collection.find({}, {"order": 1, "updated_at": 1})
+    }
+    if set(ids) != set(current):
+        raise ReorderError("The ordering must list every document exactly once.")
+
+    # Documents saved before `updated_at` existed have no stored version to compare.
+    stale = {
+        str(document_id): version_token(current[document_id].get("updated_at"))
+        for document_id, token in zip(ids, tokens)
+        if current[document_id].get("updated_at") not in (None, token)
+    }
+    if stale:
+        raise ReorderConflict(stale)
+
+    count = len(ids)
+    now = timezone.now()
+    # MongoDB stores milliseconds; truncate so the rollback filter below matches.
+    now = now.replace(microsecond=now.microsecond // 1000 * 1000)
+    operations = []
+    changed_ids = []
+    for position, document_id in enumerate(ids):
+        order = count - 1 - position if _is_descending(document_class) else position
+        if current[document_id].get("order") == order:
+            continue
+        changed_ids.append(document_id)
+        operations.append(UpdateOne(
+            {"_id": document_id, "updated_at": current[document_id].get("updated_at")},
+            {"$set": {"order": order, "updated_at": now}},
+        ))
+
+    if not operations:
+        return {str(document_id): version_token(current[document_id].get("updated_at")) for document_id in ids}
+
+    result = collection.bulk_write(operations, ordered=False)
+    if result.matched_count != len(operations):
+        # Another writer won some documents between the check and the write. Undo the
+        # updates that did apply (those still carrying our timestamp), so the stored
+        # order is never a mix of the two, and hand back the real versions.
+        collection.bulk_write([
+            UpdateOne(
+                {"_id": document_id, "updated_at": now},
+                {"$set": {
+                    "order": current[document_id].get("order"),
+                    "updated_at": current[document_id].get("updated_at"),
+                }},
+            )
+            for document_id in changed_ids
+        ], ordered=False)
+        raise ReorderConflict({
+            str(row["_id"]): version_token(row.get("updated_at"))
+            for row in collection.find({"_id": {"$in": ids}}, {"updated_at": 1})
+        })
+
+    bump_content_version(document_class._get_collection_name())
+    versions = {str(document_id): version_token(current[document_id].get("updated_at")) for document_id in ids}
+    versions.update({str(document_id): version_token(now) for document_id in changed_ids})
+    return versions
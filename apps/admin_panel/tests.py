@@ -1,3 +1,161 @@
-from django.test import TestCase
+from datetime import datetime, timezone as dt_timezone
+from unittest import mock
 
-# Create your tests here.
+from apps.public.models import Blog, Interest, Project, SiteCounters, Skill, version_token
+from apps.public.slugs import slug_ids
+from apps.public.testing import MongoTestCase
+
+from .binding import bind, save_changes
+from .bulk import BULK_TARGETS, BulkActionError, run_bulk_action
+from .reorder import ReorderConflict, ReorderError, apply_ordering
+
+
+class ReorderTests(MongoTestCase):
+    def setUp(self):
+        super().setUp()
+        self.interests = []
+        for index in range(3):
+            interest = Interest(title=f"Interest {index}", order=index)
+            interest.save()
+            self.interests.append(interest)
+
+    def _items(self, interests):
+        return [{"id": str(item.id), "updated_at": version_token(item.updated_at)} for item in interests]
+
+    def _titles(self):
+        return [interest.title for interest in Interest.objects.order_by("order")]
+
+    def test_applies_complete_ordering(self):
+        versions = apply_ordering(Interest, self._items(reversed(self.interests)))
+
+        self.assertEqual(self._titles(), ["Interest 2", "Interest 1", "Interest 0"])
+        for interest in Interest.objects:
+            self.assertEqual(versions[str(interest.id)], version_token(interest.updated_at))
+
+    def test_rejects_incomplete_or_duplicated_ordering(self):
+        with self.assertRaises(ReorderError):
+            apply_ordering(Interest, self._items(self.interests[:2]))
+        with self.assertRaises(ReorderError):
+            apply_ordering(Interest, self._items(self.interests + self.interests[:1]))
+
+    def test_stale_version_writes_nothing(self):
+        items = self._items(reversed(self.interests))
+        Interest.objects(id=self.interests[0].id).update_one(set__updated_at=datetime(2030, 1, 1))
+
+        with self.assertRaises(ReorderConflict) as raised:
+            apply_ordering(Interest, items)
+
+        self.assertEqual(raised.exception.versions, {str(self.interests[0].id): "2030-01-01T00:00:00.000"})
+        self.assertEqual(self._titles(), ["Interest 0", "Interest 1", "Interest 2"])
+
+    def test_writer_racing_the_bulk_write_rolls_back_applied_updates(self):
+        items = self._items(reversed(self.interests))
+        collection = Interest._get_collection()
+        bulk_write = collection.bulk_write
+        raced = self.interests[0].id
+        version = SiteCounters.objects.get().content_version
+
+        def racing_bulk_write(operations, **kwargs):
+            # Another admin saves one of the documents between the check and the write.
+            collection.update_one({"_id": raced}, {"$set": {"updated_at": datetime(2030, 1, 1)}})
+            return bulk_write(operations, **kwargs)
+
+        with mock.patch.object(collection, "bulk_write", side_effect=racing_bulk_write):
+            with self.assertRaises(ReorderConflict) as raised:
+                apply_ordering(Interest, items)
+
+        self.assertEqual(self._titles(), ["Interest 0", "Interest 1", "Interest 2"])
+        stored = {str(interest.id): version_token(interest.updated_at) for interest in Interest.objects}
+        self.assertEqual(raised.exception.versions, stored)
+        self.assertEqual(stored[str(raced)], "2030-01-01T00:00:00.000")
+        self.assertEqual(SiteCounters.objects.get().content_version, version)
+
+
+class BulkActionTests(MongoTestCase):
+    def _blogs(self, count, **fields):
+        blogs = [Blog(title=f"Post {index}", content="x", **fields) for index in range(count)]
+        for blog in blogs:
+            blog.save()
+        return blogs
+
+    def test_publish_stamps_only_missing_dates_and_counts_modified(self):
+        drafts = self._blogs(2, status="draft")
+        dated = Blog(title="Dated", content="x", status="draft", published_date=datetime(2020, 1, 1))
+        dated.save()
+        published = self._blogs(1, status="published")
+
+        result = run_bulk_action(BULK_TARGETS["blogs"], "publish", [str(blog.id) for blog in drafts + [dated] + published])
+
+        self.assertEqual((result.requested, result.matched, result.modified), (4, 4, 3))
+        self.assertTrue(all(blog.published_date for blog in Blog.objects(id__in=[draft.id for draft in drafts])))
+        self.assertEqual(Blog.objects.get(id=dated.id).published_date, datetime(2020, 1, 1))
+        counters = SiteCounters.objects.get()
+        self.assertEqual((counters.blogs_published, counters.blogs_draft), (4, 0))
+
+    def test_delete_updates_counters_and_slug_cache(self):
+        blogs = self._blogs(3, status="published")
+        slug_ids.set(Blog._get_collection_name(), blogs[0].slug, blogs[0].id)
+
+        result = run_bulk_action(BULK_TARGETS["blogs"], "delete", [str(blogs[0].id), str(blogs[1].id)])
+
+        self.assertEqual(result.modified, 2)
+        self.assertEqual(Blog.objects.count(), 1)
+        self.assertIsNone(slug_ids.get(Blog._get_collection_name(), blogs[0].slug))
+        counters = SiteCounters.objects.get()
+        self.assertEqual((counters.blogs_total, counters.blogs_published), (1, 1))
+
+    def test_rejects_unknown_actions_and_ids(self):
+        target = BULK_TARGETS["blogs"]
+        with self.assertRaises(BulkActionError):
+            run_bulk_action(target, "archive", [])
+        with self.assertRaises(BulkActionError):
+            run_bulk_action(target, "publish", ["not-an-id"])
+        with self.assertRaises(BulkActionError):
+            run_bulk_action(target, "publish", [])
+
+
+class BindingTests(MongoTestCase):
+    def setUp(self):
+        super().setUp()
+        project = Project(title="Portfolio", tech_stack=["django"], github_link="")
+        project.save()
+        self.project = Project.objects.get(id=project.id)
+
+    def test_unchanged_submission_assigns_nothing(self):
+        changed = bind(self.project, {
+            "title": "Portfolio",
+            "tech_stack": ["django"],
+            "github_link": None,
+            "demo_link": "",
+            "is_featured": False,
+        })
+
+        self.assertEqual(changed, [])
+        self.assertEqual(self.project._get_changed_fields(), [])
+
+    def test_values_are_normalized_through_the_field(self):
+        skill = Skill(name="Python", proficiency=80)
+        skill.save()
+        skill = Skill.objects.get(id=skill.id)
+
+        self.assertEqual(bind(skill, {"proficiency": "80"}), [])
+        self.assertEqual(bind(skill, {"proficiency": "90"}), ["proficiency"])
+        self.assertEqual(skill.proficiency, 90)
+
+    def test_aware_datetimes_compare_with_stored_ones(self):
+        blog = Blog(title="Post", content="x", published_date=datetime(2024, 1, 1, 12, 0, 0, 123000))
+        blog.save()
+        blog = Blog.objects.get(id=blog.id)
+
+        aware = datetime(2024, 1, 1, 12, 0, 0, 123456, tzinfo=dt_timezone.utc)
+
+        self.assertEqual(bind(blog, {"published_date": aware}), [])
+
+    def test_save_changes_skips_no_op_saves(self):
+        updated_at = self.project.updated_at
+
+        self.assertEqual(save_changes(self.project, {"title": "Portfolio"}), [])
+        self.assertEqual(Project.objects.get(id=self.project.id).updated_at, updated_at)
+
+        self.assertEqual(save_changes(self.project, {"title": "Portfolio v2"}), ["title"])
+        self.assertEqual(Project.objects.get(id=self.project.id).title, "Portfolio v2")
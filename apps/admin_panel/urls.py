@@ -45,6 +45,7 @@ urlpatterns = [
     # Page Content Management
     path('pages/home/', views.home_page_manager, name='admin_home_page_manager'),
     path('pages/about/', views.about_page_manager, name='admin_about_page_manager'),
+    path('pages/about/sections/<str:section>/', views.about_fragment, name='admin_about_fragment'),
     path('pages/contact/', views.contact_page_manager, name='admin_contact_page_manager'),
     
     # Education Management
@@ -76,6 +77,13 @@ urlpatterns = [
     path('pages/about/research-categories/<str:id>/edit/', views.research_category_edit, name='admin_research_category_edit'),
     path('pages/about/research-categories/<str:id>/delete/', views.research_category_delete, name='admin_research_category_delete'),
     path('pages/about/research-categories/<str:id>/toggle-active/', views.research_category_toggle_active, name='admin_research_category_toggle_active'),
+    path('uploads/', views.upload_start, name='admin_upload_start'),
+    path('uploads/direct/', views.upload_direct, name='admin_upload_direct'),
+    path('uploads/<str:id>/', views.upload_session, name='admin_upload_session'),
+    path('uploads/<str:id>/complete/', views.upload_complete, name='admin_upload_complete'),
+    path('bulk/<str:collection>/', views.bulk_action, name='admin_bulk_action'),
+    path('reorder/<str:collection>/', views.reorder_collection, name='admin_reorder'),
+    path('metrics/templates/', views.template_metrics_view, name='admin_template_metrics'),
     path('pages/about/research-entries/create/', views.research_entry_create, name='admin_research_entry_create'),
     path('pages/about/research-entries/<str:id>/edit/', views.research_entry_edit, name='admin_research_entry_edit'),
     path('pages/about/research-entries/<str:id>/toggle-active/', views.research_entry_toggle_active, name='admin_research_entry_toggle_active'),
@@ -106,8 +114,8 @@ urlpatterns = [
     # Profile Management
     path('profile/', views.profile_manager, name='admin_profile_manager'),
     path('contact-submissions/', views.contact_submissions, name='admin_contact_submissions'),
+    path('contact-submissions/bulk-action/', views.contact_submissions_bulk_action, name='admin_contact_submissions_bulk_action'),
     path('contact-submissions/<str:id>/', views.contact_submission_detail, name='admin_contact_submission_detail'),
     path('contact-submissions/<str:id>/delete/', views.contact_submission_delete, name='admin_contact_submission_delete'),
     path('contact-submissions/<str:id>/mark-read/', views.contact_submission_mark_read, name='admin_contact_submission_mark_read'),
-    path('contact-submissions/bulk-action/', views.contact_submissions_bulk_action, name='admin_contact_submissions_bulk_action'),
 ]
@@ -1,24 +1,39 @@
 
 # apps/admin_panel/views.py
 
+import hashlib
+import json
+import os
+
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.core.paginator import Paginator
-from django.http import JsonResponse
+from django.http import Http404, HttpResponseNotModified, JsonResponse
+from django.middleware.csrf import get_token
 from django.shortcuts import render, redirect
+from django.utils.cache import patch_cache_control, quote_etag
 from django.utils import timezone
 from django.core.files.storage import default_storage
 
+from bson import ObjectId
 from mongoengine.queryset.visitor import Q
 
-from apps.common_utils import get_document_or_404, get_singleton_document, skill_sort_key
+from apps.common_utils import delete_stored_files, etag_matches, get_document_or_404, get_singleton_document, skill_sort_key
+from apps.public.counters import counted_update, get_site_counters
+from apps.public.retention import archive_months, archived_count, search_archive
+from apps.public.rollups import daily_activity
+from apps.public.template_loading import template_metrics
+from apps.public.uploads import UPLOAD_CHUNK_SIZE, UploadRejected, check_declared, check_uploaded_file
+from .binding import save_changes
+from .bulk import BULK_TARGETS, BulkActionError, bulk_action_choices, run_bulk_action
+from .reorder import REORDERABLE_DOCUMENTS, ReorderConflict, ReorderError, apply_ordering
 
 from apps.public.models import (
     Profile, Skill, Project, Blog,
     HomePage, AboutPage, ContactPage,
     Education, Experience, Interest, Achievement, CoreValue,
     ResearchCategory, ResearchEntry,
-    ContactSubmission, SkillCategory,
+    ContactSubmission, SkillCategory, UploadSession,
 )
 # ============================================
 # DASHBOARD
@@ -52,15 +67,16 @@ from apps.public.models import (
 @login_required
 def dashboard(request):
     """Admin dashboard"""
-    projects_count = Project.objects.count()
-    blogs_count = Blog.objects.count()
-    published_blogs = Blog.objects.filter(status='published').count()
-    draft_blogs = Blog.objects.filter(status='draft').count()
-    skills_count = Skill.objects.count()
+    counters = get_site_counters()
+    projects_count = counters.projects_total
+    blogs_count = counters.blogs_total
+    published_blogs = counters.blogs_published
+    draft_blogs = counters.blogs_draft
+    skills_count = counters.skills_total
     
     # Contact submissions
-    total_submissions = ContactSubmission.objects.count()
-    unread_submissions = ContactSubmission.objects.filter(is_read=False).count()
+    total_submissions = counters.submissions_total
+    unread_submissions = counters.submissions_unread
     
     # Recent projects
     recent_projects = Project.objects.all().order_by('-created_at')[:5]
@@ -71,6 +87,13 @@ def dashboard(request):
     # Recent contact submissions
     recent_submissions = ContactSubmission.objects.all().order_by('-submitted_at')[:5]
     
+    # Contact activity, one small rollup document per day
+    activity = daily_activity(365)
+    busiest = max(activity, key=lambda day: day['submissions'])
+    peak = busiest['submissions'] or 1
+    for day in activity:
+        day['height'] = round(day['submissions'] * 100 / peak)
+    
     context = {
         'projects_count': projects_count,
         'blogs_count': blogs_count,
@@ -82,6 +105,10 @@ def dashboard(request):
         'recent_projects': recent_projects,
         'recent_blogs': recent_blogs,
         'recent_submissions': recent_submissions,
+        'activity': activity,
+        'activity_total': sum(day['submissions'] for day in activity),
+        'activity_last_30': sum(day['submissions'] for day in activity[-30:]),
+        'activity_busiest': busiest if busiest['submissions'] else None,
     }
     return render(request, 'admin/dashboard.html', context)
 
@@ -99,15 +126,18 @@ def blogs_list(request):
     else:
         blogs = Blog.objects.all().order_by('-created_at')
     
-    blogs_count = Blog.objects.count()
-    published_blogs = Blog.objects.filter(status='published').count()
-    draft_blogs = Blog.objects.filter(status='draft').count()
+    counters = get_site_counters()
+    blogs_count = counters.blogs_total
+    published_blogs = counters.blogs_published
+    draft_blogs = counters.blogs_draft
     
     context = {
         'blogs': blogs,
         'blogs_count': blogs_count,
         'published_blogs': published_blogs,
         'draft_blogs': draft_blogs,
+        'bulk_collection': 'blogs',
+        'bulk_actions': bulk_action_choices('blogs'),
     }
     return render(request, 'admin/blog_list.html', context)
 
@@ -123,7 +153,7 @@ def blog_editor(request):
         tags = [tag.strip() for tag in tags_input.split(',') if tag.strip()]
         status = request.POST.get('status', 'draft')
         read_time = request.POST.get('read_time', 5)
-        cover_image = request.FILES.get('cover_image')
+        cover_image = _uploaded_file(request, 'cover_image', 'blog_cover')
         is_active = request.POST.get('is_active') == 'on'
         
         # Determine status based on action button
@@ -158,31 +188,38 @@ def blog_edit(request, id):
     blog = get_document_or_404(Blog, id=id)
     
     if request.method == 'POST':
-        blog.title = request.POST.get('title')
-        blog.content = request.POST.get('content')
-        blog.preview = request.POST.get('preview', '')[:300]
-        
         tags_input = request.POST.get('tags', '')
-        blog.tags = [tag.strip() for tag in tags_input.split(',') if tag.strip()]
+        values = {
+            'title': request.POST.get('title'),
+            'content': request.POST.get('content'),
+            'preview': request.POST.get('preview', '')[:300],
+            'tags': [tag.strip() for tag in tags_input.split(',') if tag.strip()],
+            'read_time': request.POST.get('read_time', 5),
+            'is_active': request.POST.get('is_active') == 'on',
+        }
         
         # Determine status based on action button
         action = request.POST.get('action', 'draft')
         if action == 'publish':
-            blog.status = 'published'
+            values['status'] = 'published'
             if not blog.published_date:
-                blog.published_date = timezone.now()
+                values['published_date'] = timezone.now()
         else:
-            blog.status = request.POST.get('status', 'draft')
-        
-        blog.read_time = request.POST.get('read_time', 5)
-        blog.is_active = request.POST.get('is_active') == 'on'
+            values['status'] = request.POST.get('status', 'draft')
         
-        if request.FILES.get('cover_image'):
-            blog.cover_image = request.FILES.get('cover_image')
+        previous_cover = blog.cover_image_path
+        cover_image = _uploaded_file(request, 'cover_image', 'blog_cover')
+        if cover_image:
+            blog.cover_image = cover_image
         
-        blog.save()
+        changed = save_changes(blog, values)
+        if blog.cover_image_path != previous_cover:
+            delete_stored_files([previous_cover])
         
-        messages.success(request, f'Blog "{blog.title}" updated successfully!')
+        if changed:
+            messages.success(request, f'Blog "{blog.title}" updated successfully!')
+        else:
+            messages.info(request, f'No changes to save for "{blog.title}".')
         return redirect('admin_blogs_list')
     
     context = {
@@ -198,9 +235,8 @@ def blog_delete(request, id):
     
     if request.method == 'POST':
         title = blog.title
-        if blog.cover_image_path:
-            default_storage.delete(blog.cover_image_path)
         blog.delete()
+        delete_stored_files([blog.cover_image_path])
         messages.success(request, f'Blog "{title}" deleted successfully!')
         return redirect('admin_blogs_list')
     
@@ -218,6 +254,8 @@ def project_manager(request):
     
     context = {
         'projects': projects,
+        'bulk_collection': 'projects',
+        'bulk_actions': bulk_action_choices('projects'),
     }
     return render(request, 'admin/project_manager.html', context)
 
@@ -232,7 +270,7 @@ def project_form(request):
         tech_stack_input = request.POST.get('tech_stack', '')
         tech_stack = [tech.strip() for tech in tech_stack_input.split(',') if tech.strip()]
         
-        image = request.FILES.get('image')
+        image = _uploaded_file(request, 'image', 'project_image')
         github_link = request.POST.get('github_link', '')
         demo_link = request.POST.get('demo_link', '')
         is_featured = request.POST.get('is_featured') == 'on'
@@ -263,23 +301,29 @@ def project_edit(request, id):
     project = get_document_or_404(Project, id=id)
     
     if request.method == 'POST':
-        project.title = request.POST.get('title')
-        project.description = request.POST.get('description')
-        
         tech_stack_input = request.POST.get('tech_stack', '')
-        project.tech_stack = [tech.strip() for tech in tech_stack_input.split(',') if tech.strip()]
-        
-        if request.FILES.get('image'):
-            project.image = request.FILES.get('image')
         
-        project.github_link = request.POST.get('github_link', '')
-        project.demo_link = request.POST.get('demo_link', '')
-        project.is_featured = request.POST.get('is_featured') == 'on'
-        project.is_active = request.POST.get('is_active') == 'on'
+        previous_image = project.image_path
+        image = _uploaded_file(request, 'image', 'project_image')
+        if image:
+            project.image = image
         
-        project.save()
+        changed = save_changes(project, {
+            'title': request.POST.get('title'),
+            'description': request.POST.get('description'),
+            'tech_stack': [tech.strip() for tech in tech_stack_input.split(',') if tech.strip()],
+            'github_link': request.POST.get('github_link', ''),
+            'demo_link': request.POST.get('demo_link', ''),
+            'is_featured': request.POST.get('is_featured') == 'on',
+            'is_active': request.POST.get('is_active') == 'on',
+        })
+        if project.image_path != previous_image:
+            delete_stored_files([previous_image])
         
-        messages.success(request, f'Project "{project.title}" updated successfully!')
+        if changed:
+            messages.success(request, f'Project "{project.title}" updated successfully!')
+        else:
+            messages.info(request, f'No changes to save for "{project.title}".')
         return redirect('admin_project_manager')
     
     context = {
@@ -295,9 +339,8 @@ def project_delete(request, id):
     
     if request.method == 'POST':
         title = project.title
-        if project.image_path:
-            default_storage.delete(project.image_path)
         project.delete()
+        delete_stored_files([project.image_path])
         messages.success(request, f'Project "{title}" deleted successfully!')
         return redirect('admin_project_manager')
     
@@ -318,6 +361,8 @@ def skills_manager(request):
     context = {
         'skills': skills,
         'categories': categories,
+        'bulk_collection': 'skills',
+        'bulk_actions': bulk_action_choices('skills'),
     }
     return render(request, 'admin/skills_manager.html', context)
 
@@ -385,7 +430,7 @@ def skill_category_toggle_active(request, id):
     category.is_active = not category.is_active
     category.save()
     if not category.is_active:
-        Skill.objects.filter(category=category).update(is_active=False)
+        counted_update(Skill.objects.filter(category=category), {"is_active": False})
     status = 'active' if category.is_active else 'inactive'
     messages.success(request, f'Category "{category.name}" is now {status}.')
     return redirect('admin_skills_manager')
@@ -397,7 +442,7 @@ def skill_category_delete(request, id):
     category = get_document_or_404(SkillCategory, id=id)
 
     if request.method == 'POST':
-        Skill.objects.filter(category=category).update(category=None)
+        counted_update(Skill.objects.filter(category=category), {"category": None})
         category.delete()
         messages.success(request, f'Category "{category.name}" deleted successfully.')
     else:
@@ -517,14 +562,16 @@ def profile_manager(request):
             profile.linkedin = linkedin
             profile.twitter = twitter
             
-            if request.FILES.get('image'):
+            image = _uploaded_file(request, 'image', 'profile_image')
+            if image:
                 if profile.image_path:
                     default_storage.delete(profile.image_path)
-                profile.image = request.FILES.get('image')
-            if request.FILES.get('resume'):
+                profile.image = image
+            resume = _uploaded_file(request, 'resume', 'profile_resume')
+            if resume:
                 if profile.resume_path:
                     default_storage.delete(profile.resume_path)
-                profile.resume = request.FILES.get('resume')
+                profile.resume = resume
             
             profile.save()
             messages.success(request, 'Profile updated successfully!')
@@ -540,10 +587,12 @@ def profile_manager(request):
                 linkedin=linkedin,
                 twitter=twitter,
             )
-            if request.FILES.get('image'):
-                profile.image = request.FILES.get('image')
-            if request.FILES.get('resume'):
-                profile.resume = request.FILES.get('resume')
+            image = _uploaded_file(request, 'image', 'profile_image')
+            if image:
+                profile.image = image
+            resume = _uploaded_file(request, 'resume', 'profile_resume')
+            if resume:
+                profile.resume = resume
             profile.save()
             messages.success(request, 'Profile created successfully!')
         
@@ -565,23 +614,25 @@ def home_page_manager(request):
     )
     
     if request.method == 'POST':
-        home_page.hero_title = request.POST.get('hero_title')
-        home_page.hero_subtitle = request.POST.get('hero_subtitle')
-        home_page.hero_description = request.POST.get('hero_description')
-        home_page.show_hero_title = request.POST.get('show_hero_title') == 'on'
-        home_page.show_hero_subtitle = request.POST.get('show_hero_subtitle') == 'on'
-        home_page.show_hero_description = request.POST.get('show_hero_description') == 'on'
-        home_page.show_stats = request.POST.get('show_stats') == 'on'
-        home_page.custom_stat_label = request.POST.get('custom_stat_label')
-        home_page.custom_stat_value = request.POST.get('custom_stat_value')
-        home_page.show_skills_summary = request.POST.get('show_skills_summary') == 'on'
-        home_page.cta_title = request.POST.get('cta_title')
-        home_page.cta_description = request.POST.get('cta_description')
-        home_page.cta_button_text = request.POST.get('cta_button_text')
-        home_page.show_cta_section = request.POST.get('show_cta_section') == 'on'
-        
-        home_page.save()
-        messages.success(request, 'Home page content updated successfully!')
+        if save_changes(home_page, {
+            'hero_title': request.POST.get('hero_title'),
+            'hero_subtitle': request.POST.get('hero_subtitle'),
+            'hero_description': request.POST.get('hero_description'),
+            'show_hero_title': request.POST.get('show_hero_title') == 'on',
+            'show_hero_subtitle': request.POST.get('show_hero_subtitle') == 'on',
+            'show_hero_description': request.POST.get('show_hero_description') == 'on',
+            'show_stats': request.POST.get('show_stats') == 'on',
+            'custom_stat_label': request.POST.get('custom_stat_label'),
+            'custom_stat_value': request.POST.get('custom_stat_value'),
+            'show_skills_summary': request.POST.get('show_skills_summary') == 'on',
+            'cta_title': request.POST.get('cta_title'),
+            'cta_description': request.POST.get('cta_description'),
+            'cta_button_text': request.POST.get('cta_button_text'),
+            'show_cta_section': request.POST.get('show_cta_section') == 'on',
+        }):
+            messages.success(request, 'Home page content updated successfully!')
+        else:
+            messages.info(request, 'No changes to save.')
         return redirect('admin_home_page_manager')
     
     context = {
@@ -607,35 +658,61 @@ def about_page_manager(request):
     )
     
     if request.method == 'POST':
-        about_page.page_title = request.POST.get('page_title')
-        about_page.introduction = request.POST.get('introduction')
-        about_page.show_education = request.POST.get('show_education') == 'on'
-        about_page.interests_title = request.POST.get('interests_title')
-        about_page.interests_subtitle = request.POST.get('interests_subtitle')
-        about_page.values_title = request.POST.get('values_title')
-        about_page.values_subtitle = request.POST.get('values_subtitle')
-        about_page.experiences_title = request.POST.get('experiences_title')
-        about_page.experiences_description = request.POST.get('experiences_description')
-        about_page.achievements_title = request.POST.get('achievements_title')
-        about_page.achievements_description = request.POST.get('achievements_description')
-        about_page.show_page_title = request.POST.get('show_page_title') == 'on'
-        about_page.show_introduction = request.POST.get('show_introduction') == 'on'
-        about_page.show_stats_section = request.POST.get('show_stats_section') == 'on'
-        about_page.show_interests = request.POST.get('show_interests') == 'on'
-        about_page.show_values = request.POST.get('show_values') == 'on'
-        about_page.show_experiences_section = request.POST.get('show_experiences_section') == 'on'
-        about_page.show_achievements_section = request.POST.get('show_achievements_section') == 'on'
-        
-        about_page.save()
-        messages.success(request, 'About page content updated successfully!')
+        if save_changes(about_page, {
+            'page_title': request.POST.get('page_title'),
+            'introduction': request.POST.get('introduction'),
+            'show_education': request.POST.get('show_education') == 'on',
+            'interests_title': request.POST.get('interests_title'),
+            'interests_subtitle': request.POST.get('interests_subtitle'),
+            'values_title': request.POST.get('values_title'),
+            'values_subtitle': request.POST.get('values_subtitle'),
+            'experiences_title': request.POST.get('experiences_title'),
+            'experiences_description': request.POST.get('experiences_description'),
+            'achievements_title': request.POST.get('achievements_title'),
+            'achievements_description': request.POST.get('achievements_description'),
+            'show_page_title': request.POST.get('show_page_title') == 'on',
+            'show_introduction': request.POST.get('show_introduction') == 'on',
+            'show_stats_section': request.POST.get('show_stats_section') == 'on',
+            'show_interests': request.POST.get('show_interests') == 'on',
+            'show_values': request.POST.get('show_values') == 'on',
+            'show_experiences_section': request.POST.get('show_experiences_section') == 'on',
+            'show_achievements_section': request.POST.get('show_achievements_section') == 'on',
+        }):
+            messages.success(request, 'About page content updated successfully!')
+        else:
+            messages.info(request, 'No changes to save.')
         return redirect('admin_about_page_manager')
     
-    # Get related data
-    education_list = Education.objects.all()
-    experiences_list = Experience.objects.order_by("order", "-created_at")
-    achievements_list = Achievement.objects.order_by("order", "-created_at")
-    interests_list = Interest.objects.all()
-    values_list = CoreValue.objects.all()
+    context = {
+        'about_page': about_page,
+        'research_query': request.GET.urlencode(),
+    }
+    return render(request, 'admin/about_page_manager.html', context)
+
+
+# Section -> collections whose content version invalidates the section's fragment.
+ABOUT_FRAGMENTS = {
+    'experiences': ('experiences',),
+    'achievements': ('achievements',),
+    'research': ('research_categories', 'research_entries'),
+    'education': ('education',),
+    'interests': ('interests',),
+    'values': ('core_values',),
+}
+
+
+def _about_fragment_context(request, section):
+    if section == 'experiences':
+        return {'experiences_list': Experience.objects.order_by("order", "-created_at")}
+    if section == 'achievements':
+        return {'achievements_list': Achievement.objects.order_by("order", "-created_at")}
+    if section == 'education':
+        return {'education_list': Education.objects.all()}
+    if section == 'interests':
+        return {'interests_list': Interest.objects.all()}
+    if section == 'values':
+        return {'values_list': CoreValue.objects.all()}
+
     research_categories = ResearchCategory.objects.all()
     research_entries_qs = ResearchEntry.objects.order_by('-created_at')
     research_category_filter = request.GET.get('research_category', '')
@@ -654,24 +731,60 @@ def about_page_manager(request):
     paginator = Paginator(research_entries_qs, 6)
     research_page_number = request.GET.get('research_page')
     research_entries_page = paginator.get_page(research_page_number)
-    research_entries_total = research_entries_qs.count()
-    
-    context = {
-        'about_page': about_page,
-        'education_list': education_list,
-        'interests_list': interests_list,
-        'values_list': values_list,
-        'experiences_list': experiences_list,
-        'achievements_list': achievements_list,
+    return {
         'research_categories': research_categories,
         'research_entries': research_entries_page,
-        'research_entries_total': research_entries_total,
+        'research_entries_total': paginator.count,
         'research_paginator': paginator,
         'research_page_obj': research_entries_page,
         'research_category_filter': research_category_filter,
         'research_search': research_search,
     }
-    return render(request, 'admin/about_page_manager.html', context)
+
+
+def _about_fragment_etag(request, section):
+    """Changes whenever the section's collections change, or the query, user or CSRF secret do."""
+
+    versions = get_site_counters().collection_versions or {}
+    get_token(request)
+    parts = [section, request.GET.urlencode(), str(request.user.pk), request.META.get('CSRF_COOKIE', '')]
+    parts.extend(f"{name}:{versions.get(name, 0)}" for name in ABOUT_FRAGMENTS[section])
+    return quote_etag(hashlib.md5("|".join(parts).encode()).hexdigest())
+
+
+def _render_about_fragment(request, section, show_messages=False):
+    context = _about_fragment_context(request, section)
+    context.update({
+        'fragment_template': f'admin/about_fragments/{section}.html',
+        'show_messages': show_messages,
+    })
+    response = render(request, 'admin/about_fragment.html', context)
+    response['X-Fragment'] = section
+    return response
+
+
+def _about_response(request, section):
+    """After an About-section change: the re-rendered fragment for XHR, else the full page."""
+
+    if request.headers.get('x-requested-with') == 'XMLHttpRequest':
+        return _render_about_fragment(request, section, show_messages=True)
+    return redirect('admin_about_page_manager')
+
+
+@login_required
+def about_fragment(request, section):
+    """One About-manager section, loaded on demand and revalidated with its ETag."""
+
+    if section not in ABOUT_FRAGMENTS:
+        raise Http404("Unknown section.")
+    etag = _about_fragment_etag(request, section)
+    if etag_matches(request, etag):
+        response = HttpResponseNotModified()
+    else:
+        response = _render_about_fragment(request, section)
+    response['ETag'] = etag
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
 
 
 # Education CRUD
@@ -687,23 +800,26 @@ def education_create(request):
         )
         education.save()
         messages.success(request, 'Education entry added!')
-        return redirect('admin_about_page_manager')
-    return redirect('admin_about_page_manager')
+        return _about_response(request, 'education')
+    return _about_response(request, 'education')
 
 
 @login_required
 def education_edit(request, id):
     education = get_document_or_404(Education, id=id)
     if request.method == 'POST':
-        education.degree = request.POST.get('degree')
-        education.institution = request.POST.get('institution')
-        education.year = request.POST.get('year')
-        education.description = request.POST.get('description')
-        education.order = request.POST.get('order', 0)
-        education.save()
-        messages.success(request, 'Education entry updated!')
-        return redirect('admin_about_page_manager')
-    return redirect('admin_about_page_manager')
+        if save_changes(education, {
+            'degree': request.POST.get('degree'),
+            'institution': request.POST.get('institution'),
+            'year': request.POST.get('year'),
+            'description': request.POST.get('description'),
+            'order': request.POST.get('order', 0),
+        }):
+            messages.success(request, 'Education entry updated!')
+        else:
+            messages.info(request, 'No changes to save.')
+        return _about_response(request, 'education')
+    return _about_response(request, 'education')
 
 
 @login_required
@@ -712,7 +828,7 @@ def education_delete(request, id):
     if request.method == 'POST':
         education.delete()
         messages.success(request, 'Education entry deleted!')
-    return redirect('admin_about_page_manager')
+    return _about_response(request, 'education')
 
 
 @login_required
@@ -725,7 +841,7 @@ def education_toggle_active(request, id):
         messages.success(request, f'Education entry "{education.degree}" {status}.')
     else:
         messages.error(request, 'Invalid request method.')
-    return redirect('admin_about_page_manager')
+    return _about_response(request, 'education')
 
 
 # Experience CRUD
@@ -746,25 +862,29 @@ def experience_create(request):
         )
         experience.save()
         messages.success(request, 'Experience entry added!')
-    return redirect('admin_about_page_manager')
+    return _about_response(request, 'experiences')
 
 
 @login_required
 def experience_edit(request, id):
     experience = get_document_or_404(Experience, id=id)
     if request.method == 'POST':
-        experience.title = request.POST.get('title')
-        experience.organization = request.POST.get('organization', '')
-        experience.period = request.POST.get('period', '')
-        experience.description = request.POST.get('description', '')
         try:
-            experience.order = int(request.POST.get('order', 0))
+            order = int(request.POST.get('order', 0))
         except (TypeError, ValueError):
-            experience.order = 0
-        experience.is_active = request.POST.get('is_active') == 'on'
-        experience.save()
-        messages.success(request, 'Experience entry updated!')
-    return redirect('admin_about_page_manager')
+            order = 0
+        if save_changes(experience, {
+            'title': request.POST.get('title'),
+            'organization': request.POST.get('organization', ''),
+            'period': request.POST.get('period', ''),
+            'description': request.POST.get('description', ''),
+            'order': order,
+            'is_active': request.POST.get('is_active') == 'on',
+        }):
+            messages.success(request, 'Experience entry updated!')
+        else:
+            messages.info(request, 'No changes to save.')
+    return _about_response(request, 'experiences')
 
 
 @login_required
@@ -773,7 +893,7 @@ def experience_delete(request, id):
     if request.method == 'POST':
         experience.delete()
         messages.success(request, 'Experience entry deleted!')
-    return redirect('admin_about_page_manager')
+    return _about_response(request, 'experiences')
 
 
 @login_required
@@ -786,7 +906,7 @@ def experience_toggle_active(request, id):
         messages.success(request, f'Experience "{experience.title}" {status}.')
     else:
         messages.error(request, 'Invalid request method.')
-    return redirect('admin_about_page_manager')
+    return _about_response(request, 'experiences')
 
 
 # Achievement CRUD
@@ -807,25 +927,29 @@ def achievement_create(request):
         )
         achievement.save()
         messages.success(request, 'Achievement added!')
-    return redirect('admin_about_page_manager')
+    return _about_response(request, 'achievements')
 
 
 @login_required
 def achievement_edit(request, id):
     achievement = get_document_or_404(Achievement, id=id)
     if request.method == 'POST':
-        achievement.title = request.POST.get('title')
-        achievement.description = request.POST.get('description', '')
-        achievement.year = request.POST.get('year', '')
-        achievement.link = request.POST.get('link', '')
         try:
-            achievement.order = int(request.POST.get('order', 0))
+            order = int(request.POST.get('order', 0))
         except (TypeError, ValueError):
-            achievement.order = 0
-        achievement.is_active = request.POST.get('is_active') == 'on'
-        achievement.save()
-        messages.success(request, 'Achievement updated!')
-    return redirect('admin_about_page_manager')
+            order = 0
+        if save_changes(achievement, {
+            'title': request.POST.get('title'),
+            'description': request.POST.get('description', ''),
+            'year': request.POST.get('year', ''),
+            'link': request.POST.get('link', ''),
+            'order': order,
+            'is_active': request.POST.get('is_active') == 'on',
+        }):
+            messages.success(request, 'Achievement updated!')
+        else:
+            messages.info(request, 'No changes to save.')
+    return _about_response(request, 'achievements')
 
 
 @login_required
@@ -834,7 +958,7 @@ def achievement_delete(request, id):
     if request.method == 'POST':
         achievement.delete()
         messages.success(request, 'Achievement deleted!')
-    return redirect('admin_about_page_manager')
+    return _about_response(request, 'achievements')
 
 
 @login_required
@@ -847,7 +971,7 @@ def achievement_toggle_active(request, id):
         messages.success(request, f'Achievement "{achievement.title}" {status}.')
     else:
         messages.error(request, 'Invalid request method.')
-    return redirect('admin_about_page_manager')
+    return _about_response(request, 'achievements')
 
 
 # Interest CRUD
@@ -863,23 +987,26 @@ def interest_create(request):
         )
         interest.save()
         messages.success(request, 'Interest added!')
-        return redirect('admin_about_page_manager')
-    return redirect('admin_about_page_manager')
+        return _about_response(request, 'interests')
+    return _about_response(request, 'interests')
 
 
 @login_required
 def interest_edit(request, id):
     interest = get_document_or_404(Interest, id=id)
     if request.method == 'POST':
-        interest.title = request.POST.get('title')
-        interest.description = request.POST.get('description')
-        interest.icon = request.POST.get('icon')
-        interest.color = request.POST.get('color', 'accent-primary')
-        interest.order = request.POST.get('order', 0)
-        interest.save()
-        messages.success(request, 'Interest updated!')
-        return redirect('admin_about_page_manager')
-    return redirect('admin_about_page_manager')
+        if save_changes(interest, {
+            'title': request.POST.get('title'),
+            'description': request.POST.get('description'),
+            'icon': request.POST.get('icon'),
+            'color': request.POST.get('color', 'accent-primary'),
+            'order': request.POST.get('order', 0),
+        }):
+            messages.success(request, 'Interest updated!')
+        else:
+            messages.info(request, 'No changes to save.')
+        return _about_response(request, 'interests')
+    return _about_response(request, 'interests')
 
 
 @login_required
@@ -888,7 +1015,7 @@ def interest_delete(request, id):
     if request.method == 'POST':
         interest.delete()
         messages.success(request, 'Interest deleted!')
-    return redirect('admin_about_page_manager')
+    return _about_response(request, 'interests')
 
 
 @login_required
@@ -901,7 +1028,7 @@ def interest_toggle_active(request, id):
         messages.success(request, f'Interest "{interest.title}" {status}.')
     else:
         messages.error(request, 'Invalid request method.')
-    return redirect('admin_about_page_manager')
+    return _about_response(request, 'interests')
 
 
 # Core Value CRUD
@@ -917,23 +1044,26 @@ def value_create(request):
         )
         core_value.save()
         messages.success(request, 'Core value added!')
-        return redirect('admin_about_page_manager')
-    return redirect('admin_about_page_manager')
+        return _about_response(request, 'values')
+    return _about_response(request, 'values')
 
 
 @login_required
 def value_edit(request, id):
     value = get_document_or_404(CoreValue, id=id)
     if request.method == 'POST':
-        value.title = request.POST.get('title')
-        value.description = request.POST.get('description')
-        value.icon = request.POST.get('icon')
-        value.color = request.POST.get('color', 'accent-primary')
-        value.order = request.POST.get('order', 0)
-        value.save()
-        messages.success(request, 'Core value updated!')
-        return redirect('admin_about_page_manager')
-    return redirect('admin_about_page_manager')
+        if save_changes(value, {
+            'title': request.POST.get('title'),
+            'description': request.POST.get('description'),
+            'icon': request.POST.get('icon'),
+            'color': request.POST.get('color', 'accent-primary'),
+            'order': request.POST.get('order', 0),
+        }):
+            messages.success(request, 'Core value updated!')
+        else:
+            messages.info(request, 'No changes to save.')
+        return _about_response(request, 'values')
+    return _about_response(request, 'values')
 
 
 @login_required
@@ -942,7 +1072,7 @@ def value_delete(request, id):
     if request.method == 'POST':
         value.delete()
         messages.success(request, 'Core value deleted!')
-    return redirect('admin_about_page_manager')
+    return _about_response(request, 'values')
 
 
 @login_required
@@ -955,7 +1085,7 @@ def value_toggle_active(request, id):
         messages.success(request, f'Core value "{value.title}" {status}.')
     else:
         messages.error(request, 'Invalid request method.')
-    return redirect('admin_about_page_manager')
+    return _about_response(request, 'values')
 
 
 @login_required
@@ -974,33 +1104,37 @@ def research_category_create(request):
         )
         category.save()
         messages.success(request, 'Research category added!')
-    return redirect('admin_about_page_manager')
+    return _about_response(request, 'research')
 
 
 @login_required
 def research_category_edit(request, id):
     category = get_document_or_404(ResearchCategory, id=id)
     if request.method == 'POST':
-        category.name = request.POST.get('name')
-        category.description = request.POST.get('description', '')
         try:
-            category.order = int(request.POST.get('order', 0))
+            order = int(request.POST.get('order', 0))
         except (TypeError, ValueError):
-            category.order = 0
-        category.is_active = request.POST.get('is_active') == 'on'
-        category.save()
-        messages.success(request, 'Research category updated!')
-    return redirect('admin_about_page_manager')
+            order = 0
+        if save_changes(category, {
+            'name': request.POST.get('name'),
+            'description': request.POST.get('description', ''),
+            'order': order,
+            'is_active': request.POST.get('is_active') == 'on',
+        }):
+            messages.success(request, 'Research category updated!')
+        else:
+            messages.info(request, 'No changes to save.')
+    return _about_response(request, 'research')
 
 
 @login_required
 def research_category_delete(request, id):
     category = get_document_or_404(ResearchCategory, id=id)
     if request.method == 'POST':
-        ResearchEntry.objects.filter(category=category).update(category=None)
+        counted_update(ResearchEntry.objects.filter(category=category), {"category": None})
         category.delete()
         messages.success(request, 'Research category deleted!')
-    return redirect('admin_about_page_manager')
+    return _about_response(request, 'research')
 
 
 @login_required
@@ -1008,10 +1142,10 @@ def research_category_toggle_active(request, id):
     category = get_document_or_404(ResearchCategory, id=id)
     category.is_active = not category.is_active
     category.save()
-    ResearchEntry.objects.filter(category=category).update(set__is_active=category.is_active)
+    counted_update(ResearchEntry.objects.filter(category=category), {"is_active": category.is_active})
     status = 'activated' if category.is_active else 'deactivated'
     messages.success(request, f'Research category \"{category.name}\" {status}.')
-    return redirect('admin_about_page_manager')
+    return _about_response(request, 'research')
 
 
 @login_required
@@ -1026,21 +1160,24 @@ def research_entry_create(request):
         )
         entry.save()
         messages.success(request, 'Research entry added!')
-    return redirect('admin_about_page_manager')
+    return _about_response(request, 'research')
 
 
 @login_required
 def research_entry_edit(request, id):
     entry = get_document_or_404(ResearchEntry, id=id)
     if request.method == 'POST':
-        entry.title = request.POST.get('title')
-        entry.description = request.POST.get('description', '')
-        entry.publication = request.POST.get('publication', '')
-        entry.link = request.POST.get('link', '')
-        entry.category = ResearchCategory.objects.filter(id=request.POST.get('category_id')).first()
-        entry.save()
-        messages.success(request, 'Research entry updated!')
-    return redirect('admin_about_page_manager')
+        if save_changes(entry, {
+            'title': request.POST.get('title'),
+            'description': request.POST.get('description', ''),
+            'publication': request.POST.get('publication', ''),
+            'link': request.POST.get('link', ''),
+            'category': ResearchCategory.objects.filter(id=request.POST.get('category_id')).first(),
+        }):
+            messages.success(request, 'Research entry updated!')
+        else:
+            messages.info(request, 'No changes to save.')
+    return _about_response(request, 'research')
 
 
 @login_required
@@ -1049,12 +1186,12 @@ def research_entry_toggle_active(request, id):
     target = not entry.is_active
     if target and entry.category and not entry.category.is_active:
         messages.warning(request, f'Research entry \"{entry.title}\" cannot be activated while its category is inactive.')
-        return redirect('admin_about_page_manager')
+        return _about_response(request, 'research')
     entry.is_active = target
     entry.save()
     status = 'activated' if entry.is_active else 'deactivated'
     messages.success(request, f'Research entry \"{entry.title}\" {status}.')
-    return redirect('admin_about_page_manager')
+    return _about_response(request, 'research')
 
 @login_required
 def research_entry_delete(request, id):
@@ -1062,7 +1199,188 @@ def research_entry_delete(request, id):
     if request.method == 'POST':
         entry.delete()
         messages.success(request, 'Research entry deleted!')
-    return redirect('admin_about_page_manager')
+    return _about_response(request, 'research')
+
+
+# ============================================
+# CHUNKED UPLOADS
+# ============================================
+
+def _uploaded_file(request, field, rule_key):
+    """Return the storage path of a finished chunked upload, or a validated multipart file.
+
+    Forms post the upload session id in a hidden `<field>_upload` input; the session
+    is consumed so its file cannot be claimed twice. Rejected uploads add an error
+    message and return None.
+    """
+    session_id = request.POST.get(f'{field}_upload')
+    if session_id:
+        session = UploadSession.objects(
+            id=session_id if ObjectId.is_valid(session_id) else None,
+            rule=rule_key,
+            owner_id=str(request.user.pk),
+        ).first()
+        if session is None or not session.is_complete:
+            messages.error(request, 'The uploaded file expired or did not finish. Please upload it again.')
+            return None
+        path = session.path
+        session.delete()
+        return path
+
+    uploaded = request.FILES.get(field)
+    if not uploaded:
+        return None
+    try:
+        check_uploaded_file(rule_key, uploaded)
+    except UploadRejected as exc:
+        messages.error(request, f'{uploaded.name}: {exc}')
+        return None
+    return uploaded
+
+
+def _upload_status(session):
+    return {
+        'success': True,
+        'id': str(session.id),
+        'size': session.size,
+        'received': session.received,
+        'complete': session.is_complete,
+        'chunk_size': UPLOAD_CHUNK_SIZE,
+    }
+
+
+@login_required
+def upload_start(request):
+    """Open a resumable upload after checking the declared size and type"""
+    if request.method != 'POST':
+        return JsonResponse({'success': False, 'message': 'POST required.'}, status=405)
+    try:
+        payload = json.loads(request.body or b'{}')
+        rule_key = payload.get('field')
+        check_declared(rule_key, payload.get('filename'), payload.get('size'), payload.get('content_type'))
+    except (ValueError, AttributeError):
+        return JsonResponse({'success': False, 'message': 'Invalid JSON body.'}, status=400)
+    except UploadRejected as exc:
+        return JsonResponse({'success': False, 'message': str(exc)}, status=exc.status)
+
+    session = UploadSession(
+        rule=rule_key,
+        filename=payload['filename'],
+        content_type=payload['content_type'],
+        size=payload['size'],
+        owner_id=str(request.user.pk),
+    )
+    session.save()
+    return JsonResponse(_upload_status(session), status=201)
+
+
+@login_required
+def upload_direct(request):
+    """Presign a browser-to-bucket upload after checking the declared size and type"""
+    if request.method != 'POST':
+        return JsonResponse({'success': False, 'message': 'POST required.'}, status=405)
+    if not hasattr(default_storage, 'presigned_post'):
+        # The client falls back to chunked uploads through the app.
+        return JsonResponse({'success': False, 'message': 'Direct uploads are not available.'}, status=404)
+    try:
+        payload = json.loads(request.body or b'{}')
+        rule_key = payload.get('field')
+        check_declared(rule_key, payload.get('filename'), payload.get('size'), payload.get('content_type'))
+    except (ValueError, AttributeError):
+        return JsonResponse({'success': False, 'message': 'Invalid JSON body.'}, status=400)
+    except UploadRejected as exc:
+        return JsonResponse({'success': False, 'message': str(exc)}, status=exc.status)
+
+    session = UploadSession(
+        rule=rule_key,
+        filename=payload['filename'],
+        content_type=payload['content_type'],
+        size=payload['size'],
+        owner_id=str(request.user.pk),
+    )
+    form = session.start_direct()
+    return JsonResponse({'success': True, 'id': str(session.id), 'url': form['url'], 'fields': form['fields']}, status=201)
+
+
+@login_required
+def upload_complete(request, id):
+    """Verify a direct upload once the browser has posted it to the bucket"""
+    if request.method != 'POST':
+        return JsonResponse({'success': False, 'message': 'POST required.'}, status=405)
+    session = UploadSession.objects(
+        id=id if ObjectId.is_valid(id) else None, owner_id=str(request.user.pk)
+    ).first()
+    if session is None:
+        return JsonResponse({'success': False, 'message': 'Upload not found or expired.'}, status=404)
+    try:
+        session.verify_direct()
+    except UploadRejected as exc:
+        if exc.status != 409:
+            session.discard()
+        return JsonResponse({'success': False, 'message': str(exc)}, status=exc.status)
+    return JsonResponse(_upload_status(session))
+
+
+@login_required
+def upload_session(request, id):
+    """Report progress (GET), append a chunk at ?offset= (POST/PUT) or cancel (DELETE)"""
+    session = UploadSession.objects(
+        id=id if ObjectId.is_valid(id) else None, owner_id=str(request.user.pk)
+    ).first()
+    if session is None:
+        return JsonResponse({'success': False, 'message': 'Upload not found or expired.'}, status=404)
+
+    if request.method == 'GET':
+        return JsonResponse(_upload_status(session))
+    if request.method == 'DELETE':
+        session.discard()
+        return JsonResponse({'success': True})
+    if request.method not in ('POST', 'PUT'):
+        return JsonResponse({'success': False, 'message': 'Method not allowed.'}, status=405)
+
+    try:
+        offset = int(request.GET.get('offset', ''))
+        length = int(request.META.get('CONTENT_LENGTH') or 0)
+    except ValueError:
+        return JsonResponse({'success': False, 'message': 'offset and Content-Length are required.'}, status=400)
+    # Refuse oversized chunks before reading them, then read at most one chunk.
+    if length > UPLOAD_CHUNK_SIZE:
+        return JsonResponse({'success': False, 'message': 'Chunk too large.'}, status=413)
+    try:
+        session.append(offset, request.read(UPLOAD_CHUNK_SIZE))
+    except UploadRejected as exc:
+        if exc.status == 415:
+            session.discard()
+        return JsonResponse(dict(_upload_status(session), success=False, message=str(exc)), status=exc.status)
+    return JsonResponse(_upload_status(session))
+
+
+# ============================================
+# DRAG-AND-DROP REORDERING
+# ============================================
+
+@login_required
+def reorder_collection(request, collection):
+    """Apply a complete drag-and-drop ordering posted as JSON"""
+    document_class = REORDERABLE_DOCUMENTS.get(collection)
+    if document_class is None:
+        return JsonResponse({'success': False, 'message': 'Unknown collection.'}, status=404)
+    if request.method != 'POST':
+        return JsonResponse({'success': False, 'message': 'POST required.'}, status=405)
+
+    try:
+        items = json.loads(request.body or b'{}').get('items')
+        if not isinstance(items, list):
+            raise ReorderError('Expected an "items" list.')
+        versions = apply_ordering(document_class, items)
+    except (ValueError, AttributeError):
+        return JsonResponse({'success': False, 'message': 'Invalid JSON body.'}, status=400)
+    except ReorderError as exc:
+        return JsonResponse({'success': False, 'message': str(exc)}, status=400)
+    except ReorderConflict as exc:
+        return JsonResponse({'success': False, 'message': str(exc), 'versions': exc.versions}, status=409)
+
+    return JsonResponse({'success': True, 'message': 'Order saved.', 'versions': versions})
 
 
 # ============================================
@@ -1080,25 +1398,27 @@ def contact_page_manager(request):
     )
     
     if request.method == 'POST':
-        contact_page.page_title = request.POST.get('page_title')
-        contact_page.page_subtitle = request.POST.get('page_subtitle')
-        contact_page.connect_title = request.POST.get('connect_title')
-        contact_page.connect_description = request.POST.get('connect_description')
-        contact_page.cta_title = request.POST.get('cta_title')
-        contact_page.cta_description = request.POST.get('cta_description')
-        contact_page.cta_button_text = request.POST.get('cta_button_text')
-        contact_page.show_phone = request.POST.get('show_phone') == 'on'
-        contact_page.show_location = request.POST.get('show_location') == 'on'
-        contact_page.location_text = request.POST.get('location_text')
-        contact_page.show_page_title = request.POST.get('show_page_title') == 'on'
-        contact_page.show_page_subtitle = request.POST.get('show_page_subtitle') == 'on'
-        contact_page.show_connect_section = request.POST.get('show_connect_section') == 'on'
-        contact_page.show_contact_info = request.POST.get('show_contact_info') == 'on'
-        contact_page.show_contact_form = request.POST.get('show_contact_form') == 'on'
-        contact_page.show_cta_section = request.POST.get('show_cta_section') == 'on'
-        
-        contact_page.save()
-        messages.success(request, 'Contact page content updated successfully!')
+        if save_changes(contact_page, {
+            'page_title': request.POST.get('page_title'),
+            'page_subtitle': request.POST.get('page_subtitle'),
+            'connect_title': request.POST.get('connect_title'),
+            'connect_description': request.POST.get('connect_description'),
+            'cta_title': request.POST.get('cta_title'),
+            'cta_description': request.POST.get('cta_description'),
+            'cta_button_text': request.POST.get('cta_button_text'),
+            'show_phone': request.POST.get('show_phone') == 'on',
+            'show_location': request.POST.get('show_location') == 'on',
+            'location_text': request.POST.get('location_text'),
+            'show_page_title': request.POST.get('show_page_title') == 'on',
+            'show_page_subtitle': request.POST.get('show_page_subtitle') == 'on',
+            'show_connect_section': request.POST.get('show_connect_section') == 'on',
+            'show_contact_info': request.POST.get('show_contact_info') == 'on',
+            'show_contact_form': request.POST.get('show_contact_form') == 'on',
+            'show_cta_section': request.POST.get('show_cta_section') == 'on',
+        }):
+            messages.success(request, 'Contact page content updated successfully!')
+        else:
+            messages.info(request, 'No changes to save.')
         return redirect('admin_contact_page_manager')
     
     context = {
@@ -1113,16 +1433,21 @@ def contact_submissions(request):
     filter_status = request.GET.get('status', 'all')
     search_query = request.GET.get('search', '')
     
+    archive_month = request.GET.get('month', '')
+    
     submissions = ContactSubmission.objects.all()
     
     # Apply filters
-    if filter_status == 'unread':
+    if filter_status == 'archived':
+        # Decompressed on demand from the archive blocks; already filtered by the search
+        submissions = search_archive(search_query, month=archive_month or None)
+    elif filter_status == 'unread':
         submissions = submissions.filter(is_read=False)
     elif filter_status == 'read':
         submissions = submissions.filter(is_read=True)
     
     # Search
-    if search_query:
+    if search_query and filter_status != 'archived':
         submissions = submissions.filter(
             Q(name__icontains=search_query) |
             Q(email__icontains=search_query) |
@@ -1137,15 +1462,19 @@ def contact_submissions(request):
     submissions_page = paginator.get_page(page_number)
     
     # Stats
-    total_submissions = ContactSubmission.objects.count()
-    unread_count = ContactSubmission.objects.filter(is_read=False).count()
-    read_count = ContactSubmission.objects.filter(is_read=True).count()
+    counters = get_site_counters()
+    total_submissions = counters.submissions_total
+    unread_count = counters.submissions_unread
+    read_count = counters.submissions_read
     
     context = {
         'submissions': submissions_page,
         'total_submissions': total_submissions,
         'unread_count': unread_count,
         'read_count': read_count,
+        'archived_count': archived_count(),
+        'archive_months': archive_months() if filter_status == 'archived' else [],
+        'archive_month': archive_month,
         'filter_status': filter_status,
         'search_query': search_query,
     }
@@ -1204,26 +1533,61 @@ def contact_submission_mark_read(request, id):
 def contact_submissions_bulk_action(request):
     """Handle bulk actions"""
     if request.method == 'POST':
-        action = request.POST.get('action')
         submission_ids = request.POST.getlist('submission_ids')
         
         if not submission_ids:
             messages.error(request, 'No submissions selected!')
             return redirect('admin_contact_submissions')
         
-        submissions = ContactSubmission.objects.filter(id__in=submission_ids)
-        
-        if action == 'mark_read':
-            submissions.update(is_read=True)
-            messages.success(request, f'{len(submission_ids)} messages marked as read!')
-        elif action == 'mark_unread':
-            submissions.update(is_read=False)
-            messages.success(request, f'{len(submission_ids)} messages marked as unread!')
-        elif action == 'delete':
-            count = submissions.count()
-            submissions.delete()
-            messages.success(request, f'{count} messages deleted!')
-        
-        return redirect('admin_contact_submissions')
+        try:
+            result = run_bulk_action(BULK_TARGETS['contact-submissions'], request.POST.get('action'), submission_ids)
+            messages.success(request, result.message)
+        except BulkActionError as exc:
+            messages.error(request, str(exc))
     
     return redirect('admin_contact_submissions')
+
+
+# ============================================
+# BULK ACTIONS
+# ============================================
+
+@login_required
+def bulk_action(request, collection):
+    """Apply one action to many selected blogs, projects or skills"""
+    target = BULK_TARGETS.get(collection)
+    if target is None:
+        return JsonResponse({'success': False, 'message': 'Unknown collection.'}, status=404)
+    if request.method != 'POST':
+        return redirect(target.list_url)
+
+    is_ajax = request.headers.get('X-Requested-With') == 'XMLHttpRequest'
+    try:
+        result = run_bulk_action(target, request.POST.get('action'), request.POST.getlist('ids'))
+    except BulkActionError as exc:
+        if is_ajax:
+            return JsonResponse({'success': False, 'message': str(exc)}, status=400)
+        messages.error(request, str(exc))
+        return redirect(target.list_url)
+
+    if is_ajax:
+        return JsonResponse({
+            'success': True,
+            'message': result.message,
+            'requested': result.requested,
+            'matched': result.matched,
+            'modified': result.modified,
+            'files_deleted': result.files_deleted,
+        })
+    messages.success(request, result.message)
+    return redirect(target.list_url)
+
+
+# ============================================
+# METRICS
+# ============================================
+
+@login_required
+def template_metrics_view(request):
+    """Template compile/render timings recorded by this worker"""
+    return JsonResponse({'success': True, 'pid': os.getpid(), 'templates': template_metrics()})
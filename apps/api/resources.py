@@ -0,0 +1,267 @@
+# apps/api/resources.py
+
+import base64
+import binascii
+import json
+from datetime import datetime
+
+from bson import ObjectId, json_util
+from bson.errors import InvalidId
+from django.core.files.storage import default_storage
+
+from apps.public.models import (
+    AboutPage,
+    Blog,
+    ContactPage,
+    Education,
+    Experience,
+    HomePage,
+    Profile,
+    Project,
+    ResearchEntry,
+    Skill,
+    SkillCategory,
+)
+
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+class ApiError(Exception):
+    """A malformed API request; `status` is the HTTP status to answer with."""
+
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+
+class ApiResource:
+    """A read-only collection exposed by the API.
+
+    `fields` is the public allowlist (stored field names), `media_fields` the subset
+    holding storage paths, served as URLs. `public_filter` is a raw Mongo filter, or a
+    callable returning one, that hides unpublished content. `ordering` is one stored
+    field and a direction; `_id` breaks ties so cursors are stable. `depends_on` lists
+    further collections whose changes alter the output (e.g. through `public_filter`).
+    """
+
+    def __init__(self, document_class, fields, ordering, public_filter=None, lookup_field=None,
+                 media_fields=(), depends_on=()):
+        self.document_class = document_class
+        self.fields = fields
+        self.ordering = ordering
+        self.public_filter = public_filter or {}
+        self.lookup_field = lookup_field
+        self.media_fields = media_fields
+        self.depends_on = depends_on
+
+    @property
+    def collections(self):
+        return (self.document_class._get_collection_name(),) + tuple(self.depends_on)
+
+    def query(self):
+        if callable(self.public_filter):
+            return self.public_filter()
+        return dict(self.public_filter)
+
+
+def _active_skill_filter():
+    # Mirrors the skills page: active skills in active categories only.
+    category_ids = SkillCategory.objects(is_active=True).distinct("id")
+    return {"is_active": True, "category": {"$in": category_ids}}
+
+
+API_RESOURCES = {
+    "projects": ApiResource(
+        Project,
+        ("title", "slug", "description", "tech_stack", "image_path", "github_link", "demo_link",
+         "is_featured", "created_at", "updated_at"),
+        ordering=("created_at", -1),
+        public_filter={"is_active": True},
+        lookup_field="slug",
+        media_fields=("image_path",),
+    ),
+    "blogs": ApiResource(
+        Blog,
+        ("title", "slug", "preview", "content", "cover_image_path", "tags", "read_time",
+         "author_display_name", "published_date", "updated_at"),
+        ordering=("published_date", -1),
+        public_filter={"status": "published", "is_active": True},
+        lookup_field="slug",
+        media_fields=("cover_image_path",),
+    ),
+    "skills": ApiResource(
+        Skill,
+        ("name", "category", "proficiency", "icon", "updated_at"),
+        ordering=("proficiency", -1),
+        public_filter=_active_skill_filter,
+        depends_on=("skill_categories",),
+    ),
+    "skill-categories": ApiResource(
+        SkillCategory,
+        ("name", "slug", "description", "order", "updated_at"),
+        ordering=("order", -1),
+        public_filter={"is_active": True},
+        lookup_field="slug",
+    ),
+    "education": ApiResource(
+        Education,
+        ("degree", "institution", "year", "description", "order", "updated_at"),
+        ordering=("order", 1),
+        public_filter={"is_active": True},
+    ),
+    "experiences": ApiResource(
+        Experience,
+        ("title", "organization", "period", "description", "order", "updated_at"),
+        ordering=("order", 1),
+        public_filter={"is_active": True},
+    ),
+    "research": ApiResource(
+        ResearchEntry,
+        ("title", "description", "publication", "link", "category", "created_at", "updated_at"),
+        ordering=("created_at", -1),
+        # Entries saved before `is_active` existed are shown publicly.
+        public_filter={"is_active": {"$ne": False}},
+    ),
+}
+
+API_PAGES = {
+    "home": HomePage,
+    "about": AboutPage,
+    "contact": ContactPage,
+    "profile": Profile,
+}
+
+PAGE_MEDIA_FIELDS = ("image_path", "resume_path")
+
+
+def parse_fields(resource, value):
+    """Sparse fieldset from `?fields=a,b`; every public field when omitted."""
+
+    if not value:
+        return list(resource.fields)
+    requested = [name.strip() for name in value.split(",") if name.strip()]
+    unknown = [name for name in requested if name != "id" and name not in resource.fields]
+    if unknown:
+        raise ApiError(f"Unknown field(s): {', '.join(unknown)}.")
+    return [name for name in requested if name != "id"]
+
+
+def parse_limit(value):
+    if not value:
+        return DEFAULT_PAGE_SIZE
+    try:
+        limit = int(value)
+    except ValueError:
+        raise ApiError("limit must be an integer.")
+    if not 1 <= limit <= MAX_PAGE_SIZE:
+        raise ApiError(f"limit must be between 1 and {MAX_PAGE_SIZE}.")
+    return limit
+
+
+def encode_cursor(row, field):
+    raw = json_util.dumps([row.get(field), row["_id"]])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor):
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        value, last_id = json_util.loads(raw)
+    except (binascii.Error, ValueError, TypeError):
+        raise ApiError("Invalid cursor.")
+    if not isinstance(last_id, ObjectId):
+        raise ApiError("Invalid cursor.")
+    return value, last_id
+
+
+def _after_cursor(field, direction, value, last_id):
+    """Filter for rows sorting strictly after (value, last_id) under (field, _id) ordering."""
+
+    operator = "$gt" if direction > 0 else "$lt"
+    tie = {field: value, "_id": {operator: last_id}}
+    # Missing values sort first ascending and last descending.
+    if value is None:
+        if direction > 0:
+            return {"$or": [tie, {field: {"$ne": None}}]}
+        return tie
+    clauses = [{field: {operator: value}}, tie]
+    if direction < 0:
+        clauses.append({field: None})
+    return {"$or": clauses}
+
+
+def _plain(value):
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, datetime):
+        # PyMongo hands back naive UTC.
+        return value.isoformat(timespec="milliseconds") + "Z"
+    if isinstance(value, list):
+        return [_plain(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _plain(item) for key, item in value.items()}
+    return value
+
+
+def serialize_row(row, fields, media_fields=()):
+    """Plain JSON-ready dict from an `as_pymongo()` row, in `fields` order."""
+
+    item = {"id": str(row["_id"])}
+    for name in fields:
+        value = row.get(name)
+        if name in media_fields:
+            value = default_storage.url(value) if value else None
+        item[name] = _plain(value)
+    return item
+
+
+def list_rows(resource, fields, limit, cursor=None):
+    """One page of rows and the cursor for the next page (None on the last page)."""
+
+    field, direction = resource.ordering
+    query = resource.query()
+    if cursor:
+        value, last_id = decode_cursor(cursor)
+        query = {"$and": [query, _after_cursor(field, direction, value, last_id)]}
+    sign = "-" if direction < 0 else "+"
+    rows = list(
+        resource.document_class.objects(__raw__=query)
+        .only(*set(fields) | {field})
+        .order_by(f"{sign}{field}", f"{sign}id")
+        .limit(limit + 1)
+        .as_pymongo()
+    )
+    next_cursor = encode_cursor(rows[limit - 1], field) if len(rows) > limit else None
+    return rows[:limit], next_cursor
+
+
+def get_row(resource, fields, lookup):
+    """The public row matching `lookup` (slug, or id for legacy URLs), or None."""
+
+    clauses = []
+    if resource.lookup_field:
+        clauses.append({resource.lookup_field: lookup})
+    try:
+        clauses.append({"_id": ObjectId(lookup)})
+    except (InvalidId, TypeError):
+        pass
+    if not clauses:
+        return None
+    query = {"$and": [resource.query(), {"$or": clauses}]}
+    return resource.document_class.objects(__raw__=query).only(*fields).as_pymongo().first()
+
+
+def get_page_row(document_class):
+    return document_class.objects.as_pymongo().first()
+
+
+def page_fields(document_class):
+    return [name for name in document_class._fields if name != "id"]
+
+
+def render_json(payload):
+    """Compact, deterministic JSON so equal content always yields equal bytes (strong ETags)."""
+
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
@@ -0,0 +1,115 @@
+import json
+from unittest import mock
+
+from bson import ObjectId
+from django.test import RequestFactory
+
+from apps.public.models import Education, Project
+from apps.public.object_storage import S3Storage
+from apps.public.testing import MongoTestCase
+
+from .resources import API_RESOURCES, ApiError, ApiResource, list_rows, parse_fields
+from .views import _etag
+
+
+class ListRowsTests(MongoTestCase):
+    def _insert(self, orders):
+        # Explicit ids, inserted out of order, so ties must be broken by `_id`, not insertion.
+        rows = []
+        for index, order in reversed(list(enumerate(orders))):
+            row = {"_id": ObjectId(f"{index:024x}"), "degree": f"Degree {index}", "is_active": True}
+            if order is not None:
+                row["order"] = order
+            rows.append(row)
+        Education._get_collection().insert_many(rows)
+
+    def _expected(self, orders, direction):
+        # Missing values sort first ascending and last descending, ties by id.
+        present = sorted((order, index) for index, order in enumerate(orders) if order is not None)
+        missing = [index for index, order in enumerate(orders) if order is None]
+        if direction > 0:
+            return missing + [index for _, index in present]
+        return [index for _, index in reversed(present)] + list(reversed(missing))
+
+    def _page_through(self, resource, limit):
+        seen, cursor = [], None
+        while True:
+            rows, cursor = list_rows(resource, ["degree", "order"], limit, cursor)
+            seen += [int(str(row["_id"]), 16) for row in rows]
+            if cursor is None:
+                return seen
+
+    def test_pages_cover_ties_and_missing_values_in_both_directions(self):
+        orders = [2, None, 1, 2, None, 1, 3, 2]
+        self._insert(orders)
+        for direction in (1, -1):
+            resource = ApiResource(Education, ("degree", "order"), ordering=("order", direction),
+                                   public_filter={"is_active": True})
+            for limit in (1, 2, 3, len(orders)):
+                with self.subTest(direction=direction, limit=limit):
+                    self.assertEqual(self._page_through(resource, limit), self._expected(orders, direction))
+
+    def test_sparse_fieldset(self):
+        resource = API_RESOURCES["education"]
+
+        self.assertEqual(parse_fields(resource, "degree, id"), ["degree"])
+        self.assertEqual(parse_fields(resource, ""), list(resource.fields))
+        with self.assertRaises(ApiError):
+            parse_fields(resource, "degree,secret")
+
+
+class ResourceViewTests(MongoTestCase):
+    def _get(self, path, **headers):
+        return self.client.get(path, secure=True, **headers)
+
+    def test_bad_requests_answer_400(self):
+        for query in ("cursor=not-a-cursor", "limit=0", "limit=abc", "fields=title,password"):
+            with self.subTest(query=query):
+                response = self._get(f"/api/v1/projects/?{query}")
+                self.assertEqual(response.status_code, 400)
+                self.assertFalse(json.loads(response.content)["success"])
+
+    def test_fields_projection(self):
+        Project(title="Portfolio", tech_stack=["django"], description="Long text").save()
+
+        data = json.loads(self._get("/api/v1/projects/?fields=title,slug").content)["data"]
+
+        self.assertEqual(len(data), 1)
+        self.assertEqual(set(data[0]), {"id", "title", "slug"})
+
+    def test_etag_revalidates_until_a_save(self):
+        project = Project(title="Portfolio")
+        project.save()
+        first = self._get("/api/v1/projects/")
+        etag = first["ETag"]
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(self._get("/api/v1/projects/", HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        self.assertEqual(self._get("/api/v1/projects/", HTTP_IF_NONE_MATCH=f"W/{etag}").status_code, 304)
+
+        project.title = "Portfolio v2"
+        project.save()
+        changed = self._get("/api/v1/projects/", HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(changed.status_code, 200)
+        self.assertNotEqual(changed["ETag"], etag)
+        self.assertEqual(json.loads(changed.content)["data"][0]["title"], "Portfolio v2")
+
+
+class ETagTests(MongoTestCase):
+    def test_presigned_urls_roll_the_etag(self):
+        request = RequestFactory().get("/api/projects/")
+        storage = S3Storage(bucket="media", url_expire=3600)
+        public = S3Storage(bucket="media", public_url="https://cdn.example.com")
+
+        with mock.patch("apps.public.fragments.default_storage", public):
+            stable = _etag(request, ("projects",))
+        with mock.patch("apps.public.fragments.default_storage", storage):
+            with mock.patch("apps.public.object_storage.time.time", return_value=1800 * 10):
+                first = _etag(request, ("projects",))
+            with mock.patch("apps.public.object_storage.time.time", return_value=1800 * 10 + 1799):
+                self.assertEqual(_etag(request, ("projects",)), first)
+            with mock.patch("apps.public.object_storage.time.time", return_value=1800 * 11):
+                self.assertNotEqual(_etag(request, ("projects",)), first)
+
+        self.assertNotEqual(first, stable)
@@ -0,0 +1,10 @@
+# apps/api/urls.py
+
+from django.urls import path
+from . import views
+
+urlpatterns = [
+    path('pages/<str:page>/', views.page_detail, name='api_page_detail'),
+    path('<str:resource>/', views.resource_list, name='api_resource_list'),
+    path('<str:resource>/<str:lookup>/', views.resource_detail, name='api_resource_detail'),
+]
@@ -0,0 +1,117 @@
+# apps/api/views.py
+
+import hashlib
+
+from django.http import HttpResponse, HttpResponseNotModified, JsonResponse
+from django.utils.cache import patch_cache_control, quote_etag
+from django.views.decorators.http import require_safe
+
+from apps.common_utils import etag_matches
+from apps.public.counters import get_site_counters
+from apps.public.fragments import url_epoch
+from .resources import (
+    API_PAGES,
+    API_RESOURCES,
+    PAGE_MEDIA_FIELDS,
+    ApiError,
+    get_page_row,
+    get_row,
+    list_rows,
+    page_fields,
+    parse_fields,
+    parse_limit,
+    render_json,
+    serialize_row,
+)
+
+
+def _error(message, status):
+    return JsonResponse({'success': False, 'message': message}, status=status)
+
+
+def _etag(request, collections):
+    """Strong validator from the collections' content versions and the exact request URL.
+
+    It is known before any content is read, so a matching `If-None-Match` costs one
+    counters lookup instead of a query. Presigned media URLs in the payload expire, so
+    the storage's URL epoch is part of it too.
+    """
+
+    versions = get_site_counters().collection_versions or {}
+    parts = [request.get_full_path()]
+    parts.extend(f"{name}:{versions.get(name, 0)}" for name in collections)
+    epoch = url_epoch()
+    if epoch is not None:
+        parts.append(f"media:{epoch}")
+    return quote_etag(hashlib.sha1("|".join(parts).encode()).hexdigest())
+
+
+def _conditional(request, collections, build):
+    """Answer 304 when the client's ETag is current, otherwise the JSON built by `build()`."""
+
+    etag = _etag(request, collections)
+    if etag_matches(request, etag):
+        response = HttpResponseNotModified()
+    else:
+        try:
+            payload = build()
+        except ApiError as exc:
+            return _error(str(exc), exc.status)
+        response = HttpResponse(render_json(payload), content_type='application/json')
+    response['ETag'] = etag
+    patch_cache_control(response, public=True, no_cache=True)
+    return response
+
+
+@require_safe
+def resource_list(request, resource):
+    api_resource = API_RESOURCES.get(resource)
+    if api_resource is None:
+        return _error('Unknown resource.', 404)
+
+    def build():
+        fields = parse_fields(api_resource, request.GET.get('fields'))
+        limit = parse_limit(request.GET.get('limit'))
+        rows, next_cursor = list_rows(api_resource, fields, limit, request.GET.get('cursor'))
+        next_url = None
+        if next_cursor:
+            params = request.GET.copy()
+            params['cursor'] = next_cursor
+            next_url = f"{request.path}?{params.urlencode()}"
+        return {
+            'data': [serialize_row(row, fields, api_resource.media_fields) for row in rows],
+            'next': next_url,
+        }
+
+    return _conditional(request, api_resource.collections, build)
+
+
+@require_safe
+def resource_detail(request, resource, lookup):
+    api_resource = API_RESOURCES.get(resource)
+    if api_resource is None:
+        return _error('Unknown resource.', 404)
+
+    def build():
+        fields = parse_fields(api_resource, request.GET.get('fields'))
+        row = get_row(api_resource, fields, lookup)
+        if row is None:
+            raise ApiError('Not found.', status=404)
+        return {'data': serialize_row(row, fields, api_resource.media_fields)}
+
+    return _conditional(request, api_resource.collections, build)
+
+
+@require_safe
+def page_detail(request, page):
+    document_class = API_PAGES.get(page)
+    if document_class is None:
+        return _error('Unknown page.', 404)
+
+    def build():
+        row = get_page_row(document_class)
+        if row is None:
+            raise ApiError('Not found.', status=404)
+        return {'data': serialize_row(row, page_fields(document_class), PAGE_MEDIA_FIELDS)}
+
+    return _conditional(request, (document_class._get_collection_name(),), build)
@@ -1,6 +1,15 @@
+import logging
+
+from bson import ObjectId
+from django.core.files.storage import default_storage
 from django.http import Http404
+from django.utils.http import parse_etags
 
 from apps.public.models import SkillCategory
+from apps.public.slugs import find_by_slug
+
+
+logger = logging.getLogger(__name__)
 
 
 def get_document_or_404(document_class, **filters):
@@ -12,6 +21,17 @@ def get_document_or_404(document_class, **filters):
         raise Http404(f"{document_class.__name__} not found.")
 
 
+def get_document_by_slug_or_404(document_class, value, **filters):
+    """Resolve a document by its indexed slug, accepting legacy ObjectId URLs as a fallback."""
+
+    document = find_by_slug(document_class, value, **filters)
+    if document is None and ObjectId.is_valid(value):
+        document = document_class.objects(id=value, **filters).first()
+    if document is None:
+        raise Http404(f"{document_class.__name__} not found.")
+    return document
+
+
 def get_active_skill_categories():
     """Return currently active skill categories as a list."""
 
@@ -36,3 +56,36 @@ def get_singleton_document(document_class, defaults=None):
     document = document_class(**defaults)
     document.save()
     return document
+
+
+def delete_stored_files(paths, storage=None):
+    """Delete stored media files in one pass; returns how many were removed.
+
+    Empty and duplicate paths are skipped. Backends exposing `delete_many` (e.g. an
+    object store with batch deletes) get a single call; otherwise files are removed
+    one by one and failures are logged instead of aborting the pass.
+    """
+
+    storage = storage or default_storage
+    paths = sorted({path for path in paths if path})
+    if not paths:
+        return 0
+    delete_many = getattr(storage, "delete_many", None)
+    if delete_many is not None:
+        return delete_many(paths)
+
+    deleted = 0
+    for path in paths:
+        try:
+            storage.delete(path)
+            deleted += 1
+        except OSError:
+            logger.warning("Could not delete stored file %s", path, exc_info=True)
+    return deleted
+
+
+def etag_matches(request, etag):
+    """Weak `If-None-Match` comparison, so compressed (weakened) variants still match."""
+
+    tags = parse_etags(request.headers.get("If-None-Match", ""))
+    return "*" in tags or any(tag.removeprefix("W/") == etag for tag in tags)
@@ -0,0 +1,444 @@
+# apps/public/benchmarks.py
+
+import json
+import math
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+import mongoengine
+from django.conf import settings
+from django.template import engines
+from django.urls import URLResolver, get_resolver, reverse
+from pymongo import monitoring
+
+from .counters import reconcile
+from .models import (
+    AboutPage,
+    Achievement,
+    Blog,
+    ContactPage,
+    ContactSubmission,
+    CoreValue,
+    Education,
+    Experience,
+    HomePage,
+    Interest,
+    Profile,
+    Project,
+    ResearchCategory,
+    ResearchEntry,
+    SiteCounters,
+    Skill,
+    SkillCategory,
+)
+from .readmodels import BlogCard, ProjectCard, SkillRow
+from .related import rebuild_related
+from .synthetic import SyntheticContent, insert_chunked
+
+
+BENCHMARK_URLCONFS = ("apps.public.urls", "apps.admin_panel.urls")
+
+DEFAULT_SCALES = (10, 100, 1000)
+
+# Routes that change data (most of them even on GET) or only accept POST; timing them
+# would toggle, delete or re-upload seeded documents between samples.
+MUTATING_ROUTE_SUFFIXES = ("_delete", "_toggle_active", "_mark_read", "_bulk_action")
+MUTATING_ROUTES = frozenset({
+    "admin_bulk_action",
+    "admin_reorder",
+    "admin_upload_start",
+    "admin_upload_direct",
+    "admin_upload_session",
+    "admin_upload_complete",
+})
+
+RESULTS_VERSION = 1
+
+# Route name prefix -> (document class, filters used to pick the URL arguments).
+# Longer prefixes must come first so `admin_skill_category_` wins over `admin_skill_`.
+ROUTE_TARGETS = (
+    ("project_detail", Project, {"is_active": True}),
+    ("blog_detail", Blog, {"status": "published", "is_active": True}),
+    ("admin_blog_", Blog, {}),
+    ("admin_project_", Project, {}),
+    ("admin_skill_category_", SkillCategory, {}),
+    ("admin_skill", Skill, {}),
+    ("admin_education_", Education, {}),
+    ("admin_experience_", Experience, {}),
+    ("admin_achievement_", Achievement, {}),
+    ("admin_interest_", Interest, {}),
+    ("admin_value_", CoreValue, {}),
+    ("admin_research_category_", ResearchCategory, {}),
+    ("admin_research_entry_", ResearchEntry, {}),
+    ("admin_contact_submission", ContactSubmission, {}),
+)
+
+# Collections the benchmark seeds; dropped before every scale so runs are reproducible.
+SEEDED_DOCUMENTS = (
+    Profile, HomePage, AboutPage, ContactPage,
+    SkillCategory, Skill, Project, Blog,
+    Education, Experience, Achievement, Interest, CoreValue,
+    ResearchCategory, ResearchEntry, ContactSubmission, SiteCounters,
+)
+
+# Listing markup reduced to the attribute accesses of the real cards (projects.html,
+# blog_list.html, skills.html), rendered without the fragment cache.
+READ_MODEL_TEMPLATES = {
+    "projects": (
+        "{% for project in items %}{% if project.image %}{{ project.image.url }}{{ project.title }}{% endif %}"
+        "{% if project.github_link %}{{ project.github_link }}{% endif %}{% if project.demo_link %}{{ project.demo_link }}{% endif %}"
+        "{% if project.is_featured %}*{% endif %}{{ project.title }}{{ project.description }}"
+        "{% for tech in project.tech_stack|slice:':4' %}{{ tech }}{% endfor %}{{ project.tech_stack|length }}"
+        "{% url 'project_detail' project.url_key %}{% endfor %}"
+    ),
+    "blogs": (
+        "{% for blog in items %}{% if blog.cover_image %}{{ blog.cover_image.url }}{{ blog.title }}{% endif %}"
+        "{{ blog.published_date|date:'M d, Y' }}{{ blog.read_time }}{{ blog.title }}{{ blog.preview }}"
+        "{% for tag in blog.tags|slice:':3' %}{{ tag }}{% endfor %}{{ blog.tags|length }}"
+        "{{ blog.author.get_full_name }}{% url 'blog_detail' blog.url_key %}{% endfor %}"
+    ),
+    "skills": (
+        "{% for skill in items %}{% if skill.icon %}{{ skill.icon }}{% endif %}{{ skill.name }}"
+        "{{ skill.category_name }}{{ skill.proficiency_percent }}{{ skill.proficiency_percent }}{% endfor %}"
+    ),
+}
+
+
+def _category_names():
+    return {category.id: category.name for category in SkillCategory.objects(is_active=True)}
+
+
+# Label -> (template, Document path, read model path); each path loads every listed row.
+READ_MODEL_CASES = {
+    "projects": (
+        "projects",
+        lambda: list(Project.objects(is_active=True).order_by("-created_at")),
+        lambda: ProjectCard.load(Project.objects(is_active=True).order_by("-created_at")),
+    ),
+    "blogs": (
+        "blogs",
+        lambda: list(Blog.objects(status="published", is_active=True).order_by("-published_date")),
+        lambda: BlogCard.load(Blog.objects(status="published", is_active=True).order_by("-published_date")),
+    ),
+    "skills": (
+        "skills",
+        lambda: list(Skill.objects(is_active=True)),
+        lambda: SkillRow.load(Skill.objects(is_active=True), category_names=_category_names()),
+    ),
+}
+
+
+class CommandCounter(monitoring.CommandListener):
+    """pymongo command listener that counts commands sent by the current client."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.count = 0
+
+    def started(self, event):
+        with self._lock:
+            self.count += 1
+
+    def succeeded(self, event):
+        pass
+
+    def failed(self, event):
+        pass
+
+
+class MongomockOperationCounter:
+    """Counts top-level collection calls on mongomock, which has no command monitoring."""
+
+    METHODS = (
+        "find", "find_one", "count_documents", "estimated_document_count",
+        "aggregate", "distinct", "insert_one", "insert_many", "update_one",
+        "update_many", "replace_one", "delete_one", "delete_many", "bulk_write",
+        "find_one_and_update", "find_one_and_replace", "find_one_and_delete",
+        "create_index", "create_indexes", "index_information",
+    )
+
+    def __init__(self):
+        self.count = 0
+        self._local = threading.local()
+        self._originals = {}
+
+    def install(self):
+        from mongomock.collection import Collection
+
+        for name in self.METHODS:
+            original = getattr(Collection, name, None)
+            if original is None:
+                continue
+            self._originals[name] = original
+            setattr(Collection, name, self._wrap(original))
+
+    def uninstall(self):
+        from mongomock.collection import Collection
+
+        for name, original in self._originals.items():
+            setattr(Collection, name, original)
+        self._originals = {}
+
+    def _wrap(self, original):
+        counter = self
+
+        def wrapper(*args, **kwargs):
+            depth = getattr(counter._local, "depth", 0)
+            if depth == 0:
+                counter.count += 1
+            counter._local.depth = depth + 1
+            try:
+                return original(*args, **kwargs)
+            finally:
+                counter._local.depth = depth
+
+        return wrapper
+
+
+@contextmanager
+def benchmark_connection(db_name, host=None, use_mongomock=False):
+    """Point the default MongoEngine alias at a scratch database for the duration."""
+
+    if not use_mongomock and host == settings.MONGODB_URI and db_name == settings.DATABASE_NAME:
+        raise ValueError("Refusing to benchmark against the configured content database.")
+
+    counter = MongomockOperationCounter() if use_mongomock else CommandCounter()
+    mongoengine.disconnect(alias="default")
+    try:
+        if use_mongomock:
+            import mongomock
+
+            mongoengine.connect(
+                db=db_name,
+                host=host or "mongodb://localhost",
+                alias="default",
+                mongo_client_class=mongomock.MongoClient,
+            )
+            counter.install()
+        else:
+            mongoengine.connect(
+                db=db_name,
+                host=host,
+                alias="default",
+                event_listeners=[counter],
+            )
+        yield counter
+    finally:
+        if use_mongomock:
+            counter.uninstall()
+        mongoengine.get_connection(alias="default").drop_database(db_name)
+        mongoengine.disconnect(alias="default")
+        mongoengine.connect(db=settings.DATABASE_NAME, host=settings.MONGODB_URI, alias="default")
+
+
+def seed_portfolio(scale, seed=0):
+    """Drop and reseed every content collection with `scale` blogs, projects, skills and submissions."""
+
+    generator = SyntheticContent(seed=seed, content_words=400, tag_vocabulary=60)
+
+    for document_class in SEEDED_DOCUMENTS:
+        document_class.drop_collection()
+
+    Profile(name="Benchmark User", role="Engineer", email="bench@example.com", bio=generator.words(40)).save()
+    HomePage().save()
+    AboutPage(introduction=f"<p>{generator.words(80)}</p>").save()
+    ContactPage().save()
+
+    categories = list(generator.skill_categories(max(3, min(scale // 20, 50))))
+    insert_chunked(SkillCategory, categories)
+    insert_chunked(Skill, generator.skills(scale, [category["_id"] for category in categories]))
+    insert_chunked(Project, generator.projects(scale))
+    insert_chunked(Blog, generator.blogs(scale))
+    insert_chunked(ContactSubmission, generator.contact_submissions(scale))
+    rebuild_related(Blog)
+    rebuild_related(Project)
+
+    about_sections = (
+        (Education, lambda i: {"degree": f"Degree {i}", "institution": "University", "year": "2020"}),
+        (Experience, lambda i: {"title": f"Role {i}", "organization": "Company", "period": "2021"}),
+        (Achievement, lambda i: {"title": f"Award {i}", "year": "2022"}),
+        (Interest, lambda i: {"title": f"Interest {i}"}),
+        (CoreValue, lambda i: {"title": f"Value {i}"}),
+    )
+    for document_class, build in about_sections:
+        for index in range(5):
+            document_class(description=generator.words(12), order=index, **build(index)).save()
+
+    research_categories = list(generator.research_categories(3))
+    insert_chunked(ResearchCategory, research_categories)
+    insert_chunked(
+        ResearchEntry,
+        generator.research_entries(max(1, scale // 10), [category["_id"] for category in research_categories]),
+    )
+    reconcile()
+
+
+def _route_kwargs(name, keys):
+    for prefix, document_class, filters in ROUTE_TARGETS:
+        if name.startswith(prefix):
+            document = document_class.objects(**filters).only(*keys).first()
+            if document is None:
+                return None
+            return {key: str(getattr(document, key)) for key in keys}
+    return None
+
+
+def _urlconf_prefix(module_name):
+    for pattern in get_resolver().url_patterns:
+        if isinstance(pattern, URLResolver) and getattr(pattern.urlconf_module, "__name__", None) == module_name:
+            return "/" + str(pattern.pattern)
+    return "/"
+
+
+def is_read_only_route(name):
+    return name not in MUTATING_ROUTES and not name.endswith(MUTATING_ROUTE_SUFFIXES)
+
+
+def collect_routes():
+    """Return (label, path) pairs for every read-only pattern in the benchmarked URLconfs."""
+
+    from importlib import import_module
+
+    routes = []
+    for module_name in BENCHMARK_URLCONFS:
+        prefix = _urlconf_prefix(module_name)
+        for pattern in import_module(module_name).urlpatterns:
+            name = pattern.name
+            converters = pattern.pattern.converters
+            if not name:
+                routes.append((f"{prefix}{pattern.pattern}", f"{prefix}{pattern.pattern}"))
+                continue
+            if not is_read_only_route(name):
+                continue
+            if not converters:
+                routes.append((name, reverse(name)))
+                continue
+            kwargs = _route_kwargs(name, list(converters))
+            if kwargs is None:
+                continue
+            routes.append((name, reverse(name, kwargs=kwargs)))
+    return routes
+
+
+def percentile(samples, percent):
+    """Nearest-rank percentile of a list of numbers."""
+
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(percent / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def measure_route(client, path, counter, repeat=20):
+    """Time `repeat` GETs of `path` and return latency, Mongo command and memory stats."""
+
+    response = client.get(path)
+    status = response.status_code
+
+    samples = []
+    commands_before = counter.count
+    for _ in range(repeat):
+        started = time.perf_counter()
+        client.get(path)
+        samples.append((time.perf_counter() - started) * 1000)
+    commands = (counter.count - commands_before) / repeat
+
+    tracemalloc.start()
+    try:
+        client.get(path)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "path": path,
+        "status": status,
+        "p50_ms": round(percentile(samples, 50), 3),
+        "p95_ms": round(percentile(samples, 95), 3),
+        "mean_ms": round(sum(samples) / len(samples), 3),
+        "mongo_commands": round(commands, 2),
+        "peak_memory_kb": round(peak / 1024, 1),
+    }
+
+
+def measure_read_path(load, template, counter, repeat=20):
+    """Time `repeat` rounds of `load()` plus rendering the rows through `template`."""
+
+    context = {"items": load()}
+    template.render(context)
+
+    samples = []
+    commands_before = counter.count
+    for _ in range(repeat):
+        started = time.perf_counter()
+        template.render({"items": load()})
+        samples.append((time.perf_counter() - started) * 1000)
+    commands = (counter.count - commands_before) / repeat
+
+    tracemalloc.start()
+    try:
+        template.render({"items": load()})
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "rows": len(context["items"]),
+        "p50_ms": round(percentile(samples, 50), 3),
+        "mean_ms": round(sum(samples) / len(samples), 3),
+        "mongo_commands": round(commands, 2),
+        "peak_memory_kb": round(peak / 1024, 1),
+    }
+
+
+def compare_read_models(counter, repeat=20):
+    """{label: {"documents": stats, "read_models": stats}} for every `READ_MODEL_CASES` listing."""
+
+    engine = engines["django"]
+    results = {}
+    for label, (template_name, documents, read_models) in READ_MODEL_CASES.items():
+        template = engine.from_string(READ_MODEL_TEMPLATES[template_name])
+        results[label] = {
+            "documents": measure_read_path(documents, template, counter, repeat),
+            "read_models": measure_read_path(read_models, template, counter, repeat),
+        }
+    return results
+
+
+def compare_results(baseline, current, latency_threshold=0.2, memory_threshold=0.2, command_threshold=0.0, min_latency_ms=1.0):
+    """Return a list of regression descriptions between two result payloads."""
+
+    regressions = []
+    for scale, routes in current.get("scales", {}).items():
+        baseline_routes = baseline.get("scales", {}).get(scale, {})
+        for label, stats in routes.items():
+            previous = baseline_routes.get(label)
+            if not previous:
+                continue
+            checks = (
+                ("p95_ms", latency_threshold, min_latency_ms),
+                ("mongo_commands", command_threshold, 0),
+                ("peak_memory_kb", memory_threshold, 0),
+            )
+            for metric, threshold, floor in checks:
+                before, after = previous.get(metric), stats.get(metric)
+                if before is None or after is None:
+                    continue
+                if after > before * (1 + threshold) and after - before > floor:
+                    regressions.append(
+                        f"[{scale}] {label}: {metric} {before} -> {after} (+{(after - before) / before * 100 if before else 100:.0f}%)"
+                    )
+    return regressions
+
+
+def load_results(path):
+    with open(path, encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def write_results(path, payload):
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(payload, handle, indent=2, sort_keys=True)
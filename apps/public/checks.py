@@ -5,10 +5,15 @@ from pymongo.errors import PyMongoError
 
 
 @register(Tags.database)
-def mongodb_connection_check(app_configs, **kwargs):
+def mongodb_connection_check(app_configs, databases=None, **kwargs):
     """
     Ensure that Django can connect to MongoDB Atlas using the configured URI.
+
+    Skipped when the caller names no databases (a test run of MongoTestCase/SimpleTestCase
+    tests), since those never touch the configured server.
     """
+    if databases is not None and not databases:
+        return []
     uri = getattr(settings, "MONGODB_URI", None)
     if not uri:
         return [
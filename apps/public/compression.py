@@ -0,0 +1,138 @@
+# apps/public/compression.py
+
+import gzip
+import hashlib
+import re
+
+from django.core.cache import caches
+from django.utils.cache import patch_vary_headers
+from django.utils.text import compress_string
+
+try:
+    import brotli
+except ImportError:  # Optional: without it only gzip is offered.
+    brotli = None
+
+
+COMPRESSIBLE_TYPES = (
+    "text/html",
+    "text/plain",
+    "text/xml",
+    "application/json",
+    "application/xml",
+    "application/atom+xml",
+)
+
+# Responses shorter than this are not worth compressing.
+MIN_COMPRESS_LENGTH = 200
+
+BROTLI_QUALITY = 5
+GZIP_LEVEL = 6
+
+# Random filler added to per-user gzip output, as Django's GZipMiddleware does against BREACH.
+MAX_RANDOM_BYTES = 100
+
+ACCEPT_ENCODING_RE = re.compile(r"\s*([\w*]+)\s*(?:;\s*q\s*=\s*([0-9.]+))?\s*")
+
+
+def supported_encodings():
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def negotiate_encoding(accept_encoding, encodings=None):
+    """Best of `encodings` (default: all supported) for an `Accept-Encoding` header, or None.
+
+    Higher q-values win; Brotli is preferred over gzip when both are equally acceptable.
+    """
+
+    qualities = {}
+    for part in accept_encoding.split(","):
+        match = ACCEPT_ENCODING_RE.fullmatch(part)
+        if not match:
+            continue
+        try:
+            quality = float(match.group(2)) if match.group(2) is not None else 1.0
+        except ValueError:
+            continue
+        qualities[match.group(1).lower()] = quality
+
+    best, best_quality = None, 0.0
+    for encoding in encodings or supported_encodings():
+        quality = qualities.get(encoding, qualities.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def compress(content, encoding):
+    if encoding == "br":
+        return brotli.compress(content, quality=BROTLI_QUALITY)
+    return gzip.compress(content, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def is_shared(response):
+    """Whether the body is the same for every visitor, so its compressed form can be reused."""
+
+    if response.cookies:
+        return False
+    vary = {value.strip().lower() for value in response.get("Vary", "").split(",")}
+    return "cookie" not in vary and "*" not in vary
+
+
+class CompressedResponseMiddleware:
+    """Compress text responses with Brotli or gzip, negotiated from `Accept-Encoding`.
+
+    Responses identical for every visitor are compressed once: the compressed bytes are
+    cached under a hash of the uncompressed body, so repeat hits only pay for a hash
+    and a cache lookup. Per-user responses (cookies set, `Vary: Cookie`) are gzipped with
+    random padding and never cached.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.cache = caches["compressed"]
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if not self._compressible(response):
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        accept_encoding = request.META.get("HTTP_ACCEPT_ENCODING", "")
+        shared = is_shared(response)
+        encoding = negotiate_encoding(accept_encoding, None if shared else ("gzip",))
+        if encoding is None:
+            return response
+
+        content = response.content
+        if shared:
+            key = f"compressed:{encoding}:{hashlib.sha1(content).hexdigest()}"
+            compressed = self.cache.get(key)
+            if compressed is None:
+                compressed = compress(content, encoding)
+                self.cache.set(key, compressed)
+        else:
+            compressed = compress_string(content, max_random_bytes=MAX_RANDOM_BYTES)
+
+        if len(compressed) >= len(content):
+            return response
+        response.content = compressed
+        response.headers["Content-Length"] = str(len(compressed))
+        response.headers["Content-Encoding"] = encoding
+
+        # The encoded body is a different representation: weaken a strong ETag (RFC 9110
+        # 8.8.1) so If-None-Match, which compares weakly, still matches it.
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        return response
+
+    def _compressible(self, response):
+        if response.streaming or response.status_code != 200:
+            return False
+        if response.has_header("Content-Encoding"):
+            return False
+        content_type = response.get("Content-Type", "").split(";")[0].strip().lower()
+        if content_type not in COMPRESSIBLE_TYPES:
+            return False
+        return len(response.content) >= MIN_COMPRESS_LENGTH
@@ -1,12 +1,13 @@
 # apps/public/context_processors.py
 
+from .invalidation import cached_first
 from .models import Profile
 from datetime import datetime
 
 def global_context(request):
     """Add global context variables to all templates"""
     try:
-        profile = Profile.objects.first()
+        profile = cached_first(Profile)
     except:
         profile = None
     
@@ -0,0 +1,200 @@
+# apps/public/counters.py
+
+from django.utils import timezone
+from pymongo import ReturnDocument
+
+from .invalidation import publish
+
+
+SITE_COUNTERS_ID = "site"
+
+
+def _matches(state, filters):
+    """Evaluate a flat Mongo filter (equality or `$ne`) against a raw field dict."""
+
+    for field, expected in filters.items():
+        value = state.get(field)
+        if isinstance(expected, dict):
+            if "$ne" in expected and value == expected["$ne"]:
+                return False
+        elif value != expected:
+            return False
+    return True
+
+
+def _counted_fields(document_class):
+    return {field for filters in document_class.site_counters.values() for field in filters}
+
+
+def _counted_documents(cls=None):
+    for subclass in (cls or CountedDocumentMixin).__subclasses__():
+        if subclass.site_counters and not subclass._meta.get("abstract"):
+            yield subclass
+        yield from _counted_documents(subclass)
+
+
+def _collection():
+    from .models import SiteCounters
+
+    return SiteCounters._get_collection()
+
+
+def increment(**deltas):
+    """Atomically apply `$inc` deltas to the site counters document."""
+
+    deltas = {name: value for name, value in deltas.items() if value}
+    if deltas:
+        _collection().update_one({"_id": SITE_COUNTERS_ID}, {"$inc": deltas}, upsert=True)
+
+
+def bump_content_version(*collections, document_id=None):
+    """Increment the site-wide content version and each named collection's version in one write.
+
+    Caches keyed on these versions are invalidated by any content change; bulk paths
+    call this once per operation instead of once per document. The new versions are
+    also published on the invalidation bus, for caches that are not version-keyed.
+    """
+
+    deltas = {"content_version": 1}
+    deltas.update({f"collection_versions.{name}": 1 for name in collections})
+    counters = _collection().find_one_and_update(
+        {"_id": SITE_COUNTERS_ID},
+        {"$inc": deltas},
+        projection={"collection_versions": 1},
+        upsert=True,
+        return_document=ReturnDocument.AFTER,
+    )
+    versions = counters.get("collection_versions", {})
+    publish({name: versions.get(name) for name in collections}, document_id=document_id)
+
+
+def update_deltas(document_class, raw_filter, values):
+    """Counter deltas of `$set: values` over the documents matching `raw_filter`.
+
+    Computed before the write: a matched document counts afterwards when the new
+    values satisfy the counter filter on the updated fields and its untouched fields
+    already match the rest of the filter.
+    """
+
+    collection = document_class._get_collection()
+    deltas = {}
+    for name, filters in document_class.site_counters.items():
+        updated = {field: value for field, value in filters.items() if field in values}
+        if not updated:
+            continue
+        untouched = {field: value for field, value in filters.items() if field not in values}
+        before = collection.count_documents({"$and": [raw_filter, filters]})
+        after = collection.count_documents({"$and": [raw_filter, untouched]}) if _matches(values, updated) else 0
+        deltas[name] = after - before
+    return deltas
+
+
+def delete_deltas(document_class, raw_filter):
+    """Counter deltas of deleting the documents matching `raw_filter`."""
+
+    collection = document_class._get_collection()
+    return {
+        name: -collection.count_documents({"$and": [raw_filter, filters]})
+        for name, filters in document_class.site_counters.items()
+    }
+
+
+def counted_update(queryset, values):
+    """`update_many({"$set": values})` over a queryset that keeps the site counters exact."""
+
+    document_class, raw_filter = queryset._document, queryset._query
+    deltas = update_deltas(document_class, raw_filter, values)
+    result = document_class._get_collection().update_many(raw_filter, {"$set": values})
+    increment(**deltas)
+    if result.modified_count:
+        bump_content_version(document_class._get_collection_name())
+    return result
+
+
+def counted_delete(queryset):
+    """Delete a queryset's documents with `delete_many`, decrementing the site counters first."""
+
+    document_class, raw_filter = queryset._document, queryset._query
+    deltas = delete_deltas(document_class, raw_filter)
+    result = document_class._get_collection().delete_many(raw_filter)
+    increment(**deltas)
+    if result.deleted_count:
+        bump_content_version(document_class._get_collection_name())
+    return result
+
+
+def reconcile():
+    """Recompute every counter exactly from the collections; returns the new values."""
+
+    values = {}
+    for document_class in _counted_documents():
+        collection = document_class._get_collection()
+        for name, filters in document_class.site_counters.items():
+            values[name] = collection.count_documents(filters)
+    _collection().update_one(
+        {"_id": SITE_COUNTERS_ID},
+        {"$set": dict(values, reconciled_at=timezone.now())},
+        upsert=True,
+    )
+    return values
+
+
+def get_site_counters():
+    """Return the counters document with a single `_id` fetch, reconciling it on first use."""
+
+    from .models import SiteCounters
+
+    counters = SiteCounters.objects(key=SITE_COUNTERS_ID).first()
+    if counters is None or counters.reconciled_at is None:
+        reconcile()
+        counters = SiteCounters.objects(key=SITE_COUNTERS_ID).first()
+    return counters
+
+
+class CountedDocumentMixin:
+    """Maintains the `SiteCounters` document with `$inc` on save and delete.
+
+    Subclasses declare `site_counters` as counter name -> flat Mongo filter. The raw
+    values of the filtered fields are remembered when a document is loaded, so a save
+    only increments the counters whose membership actually changed.
+    """
+
+    site_counters = {}
+
+    @classmethod
+    def _from_son(cls, son, *args, **kwargs):
+        document = super()._from_son(son, *args, **kwargs)
+        document._counter_state = {field: son.get(field) for field in _counted_fields(cls)}
+        return document
+
+    def save(self, *args, **kwargs):
+        created = self._created or not self.id
+        changed = set() if created else set(self._get_changed_fields())
+        result = super().save(*args, **kwargs)
+
+        fields = _counted_fields(type(self))
+        previous = None if created else getattr(self, "_counter_state", None)
+        if not created and previous is None:
+            return result
+        son = self.to_mongo()
+        if created:
+            current = {field: son.get(field) for field in fields}
+        else:
+            current = dict(previous)
+            current.update({field: son.get(field) for field in fields & changed})
+        increment(**{
+            name: int(_matches(current, filters)) - int(previous is not None and _matches(previous, filters))
+            for name, filters in self.site_counters.items()
+        })
+        self._counter_state = current
+        return result
+
+    def delete(self, *args, **kwargs):
+        previous = getattr(self, "_counter_state", None)
+        result = super().delete(*args, **kwargs)
+        if previous is not None:
+            increment(**{
+                name: -int(_matches(previous, filters))
+                for name, filters in self.site_counters.items()
+            })
+        return result
@@ -0,0 +1,132 @@
+# apps/public/feeds.py
+
+import hashlib
+from datetime import timezone as dt_timezone
+from xml.sax.saxutils import escape
+
+from django.core.cache import caches
+from django.urls import reverse
+from django.utils.feedgenerator import Atom1Feed
+from django.utils.cache import quote_etag
+
+from .counters import get_site_counters
+from .models import Blog, Profile, Project
+
+
+FEED_ENTRIES = 20
+
+# Entries are keyed by content version, so this only bounds how long unused ones linger.
+FEED_CACHE_TIMEOUT = 24 * 60 * 60
+
+SITEMAP_PAGES = (
+    ("home", "weekly", "1.0"),
+    ("about", "monthly", "0.8"),
+    ("projects", "weekly", "0.8"),
+    ("blogs", "daily", "0.8"),
+    ("skills", "monthly", "0.6"),
+    ("contact", "yearly", "0.5"),
+)
+
+# Collections each document is built from; their content versions key the cache.
+SITEMAP_COLLECTIONS = (Project._get_collection_name(), Blog._get_collection_name())
+FEED_COLLECTIONS = (Blog._get_collection_name(), Profile._get_collection_name())
+
+
+class CachedDocument:
+    """Rendered bytes plus the Last-Modified date to answer conditional requests with."""
+
+    def __init__(self, content, last_modified):
+        self.content = content
+        self.last_modified = last_modified
+
+
+def _aware(value):
+    return value.replace(tzinfo=dt_timezone.utc) if value is not None and value.tzinfo is None else value
+
+
+def feed_etag(name, base_url, collections):
+    """Strong ETag from the content versions of `collections`, known without rendering."""
+
+    versions = get_site_counters().collection_versions or {}
+    parts = [name, base_url] + [f"{collection}:{versions.get(collection, 0)}" for collection in collections]
+    return quote_etag(hashlib.sha1("|".join(parts).encode()).hexdigest())
+
+
+def cached_document(name, etag, base_url, build):
+    """The `CachedDocument` for `name` at `etag`, calling `build(base_url)` on a miss.
+
+    The ETag changes with any change to the feed's collections, so entries never need
+    invalidating; stale ones just age out of the cache.
+    """
+
+    cache = caches["default"]
+    key = f"feeds:{name}:{etag}"
+    document = cache.get(key)
+    if document is None:
+        content, last_modified = build(base_url)
+        document = CachedDocument(content, last_modified)
+        cache.set(key, document, FEED_CACHE_TIMEOUT)
+    return document
+
+
+def _modified(row):
+    return _aware(row.get("updated_at") or row.get("published_date") or row.get("created_at"))
+
+
+def build_sitemap(base_url):
+    """sitemap.xml bytes for the fixed pages, active projects and published blogs."""
+
+    entries = [(reverse(name), None, changefreq, priority) for name, changefreq, priority in SITEMAP_PAGES]
+    projects = Project.objects(is_active=True).order_by("-created_at")
+    for row in projects.only("id", "slug", "updated_at", "created_at").as_pymongo():
+        path = reverse("project_detail", args=[row.get("slug") or row["_id"]])
+        entries.append((path, _modified(row), "monthly", "0.7"))
+    blogs = Blog.objects(status="published", is_active=True).order_by("-published_date")
+    for row in blogs.only("id", "slug", "updated_at", "published_date").as_pymongo():
+        path = reverse("blog_detail", args=[row.get("slug") or row["_id"]])
+        entries.append((path, _modified(row), "monthly", "0.7"))
+
+    modified = [lastmod for _, lastmod, _, _ in entries if lastmod]
+    lines = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">',
+    ]
+    for path, lastmod, changefreq, priority in entries:
+        lines.append("<url>")
+        lines.append(f"<loc>{escape(base_url + path)}</loc>")
+        if lastmod:
+            lines.append(f"<lastmod>{lastmod.strftime('%Y-%m-%dT%H:%M:%S+00:00')}</lastmod>")
+        lines.append(f"<changefreq>{changefreq}</changefreq><priority>{priority}</priority>")
+        lines.append("</url>")
+    lines.append("</urlset>")
+    return "\n".join(lines).encode(), max(modified) if modified else None
+
+
+def build_atom_feed(base_url):
+    """Atom feed bytes for the latest published blogs."""
+
+    profile = Profile.objects.only("name").first()
+    author = getattr(profile, "name", "") or ""
+    feed = Atom1Feed(
+        title=f"{author} — Blog" if author else "Blog",
+        link=base_url + reverse("blogs"),
+        description="",
+        feed_url=base_url + reverse("blog_feed"),
+        author_name=author or None,
+        language="en",
+    )
+    blogs = Blog.objects(status="published", is_active=True).order_by("-published_date")
+    fields = ("id", "slug", "title", "preview", "tags", "author_display_name", "published_date", "updated_at")
+    for row in blogs.only(*fields).limit(FEED_ENTRIES).as_pymongo():
+        link = base_url + reverse("blog_detail", args=[row.get("slug") or row["_id"]])
+        feed.add_item(
+            title=row.get("title", ""),
+            link=link,
+            description=row.get("preview") or "",
+            unique_id=link,
+            pubdate=_aware(row.get("published_date")),
+            updateddate=_aware(row.get("updated_at") or row.get("published_date")),
+            author_name=row.get("author_display_name") or author or None,
+            categories=row.get("tags") or (),
+        )
+    return feed.writeString("utf-8").encode(), feed.latest_post_date()
@@ -0,0 +1,68 @@
+# apps/public/fragments.py
+
+import hashlib
+from collections.abc import Iterable, Mapping
+
+from bson import json_util
+from django.core.cache import caches
+from django.core.files.storage import default_storage
+from mongoengine import Document
+
+from .models import version_token
+from .readmodels import ReadModel
+
+
+def fragment_cache():
+    return caches["fragments"]
+
+
+def key_part(value):
+    """Stable text identifying `value`'s rendered state.
+
+    Documents (and their read models) contribute `(collection, id, updated_at)`; documents without `updated_at`
+    fall back to a hash of their stored fields. Lists, querysets and pages are the
+    concatenation of their items' parts, so a section keyed on its items changes
+    exactly when one of its cards does ("Russian doll" caching).
+    """
+
+    if isinstance(value, ReadModel):
+        return value.fragment_key_part()
+    if isinstance(value, Document):
+        if "updated_at" in value._fields:
+            state = version_token(value.updated_at)
+        else:
+            state = hashlib.sha1(json_util.dumps(value.to_mongo()).encode()).hexdigest()
+        return f"{value._get_collection_name()}:{value.pk}:{state}"
+    if isinstance(value, Mapping):
+        return "{" + ",".join(f"{key}={key_part(item)}" for key, item in sorted(value.items())) + "}"
+    if isinstance(value, Iterable) and not isinstance(value, (str, bytes)):
+        return "[" + ",".join(key_part(item) for item in value) + "]"
+    return "" if value is None else str(value)
+
+
+def url_epoch():
+    """The media storage's URL epoch (see `S3Storage.url_epoch`); None for stable URLs."""
+
+    epoch = getattr(default_storage, "url_epoch", None)
+    return epoch() if epoch is not None else None
+
+
+def fragment_key(name, *vary_on):
+    digest = hashlib.sha1("|".join(key_part(value) for value in vary_on).encode()).hexdigest()
+    epoch = url_epoch()
+    # Presigned media URLs expire, so fragments embedding them are re-rendered per epoch.
+    if epoch is not None:
+        return f"fragment:{name}:{epoch}:{digest}"
+    return f"fragment:{name}:{digest}"
+
+
+def cached_fragment(name, vary_on, render):
+    """Return the cached markup for `name` + `vary_on`, calling `render()` on a miss."""
+
+    cache = fragment_cache()
+    key = fragment_key(name, *vary_on)
+    content = cache.get(key)
+    if content is None:
+        content = render()
+        cache.set(key, content)
+    return content
@@ -0,0 +1,213 @@
+# apps/public/invalidation.py
+
+import logging
+import os
+import socket
+import threading
+from datetime import timedelta
+
+from django.utils import timezone
+from mongoengine import DateTimeField, Document, IntField, StringField
+from pymongo import CursorType
+from pymongo.errors import PyMongoError
+
+
+logger = logging.getLogger(__name__)
+
+# Identifies this worker's own events, which it has already applied locally.
+ORIGIN = f"{socket.gethostname()}:{os.getpid()}"
+
+# Backoff between attempts to re-open the tailable cursor after it dies or errors.
+RETRY_SECONDS = 1.0
+MAX_RETRY_SECONDS = 30.0
+# How long the server holds a tailing `getMore` open waiting for new events.
+AWAIT_MS = 1000
+
+
+class CacheInvalidation(Document):
+    """One content change, broadcast to every worker through a capped collection.
+
+    `version` is the collection's content version after the change; `document_id` is
+    empty for bulk changes that touch many documents at once.
+    """
+
+    collection = StringField(required=True)
+    document_id = StringField()
+    version = IntField()
+    origin = StringField()
+    at = DateTimeField()
+
+    meta = {
+        "collection": "cache_invalidations",
+        # Old events are only needed by listeners that are behind, and those clear
+        # their cache when they reconnect, so a small ring buffer is enough.
+        "max_size": 1024 * 1024,
+        "max_documents": 5000,
+    }
+
+    @classmethod
+    def _get_capped_collection(cls):
+        try:
+            return super()._get_capped_collection()
+        except NotImplementedError:
+            # mongomock (tests, `--mongomock` benchmarks) has no capped collections.
+            # A plain one still takes the events; nothing tails it in-process anyway.
+            return cls._get_db()[cls._get_collection_name()]
+
+
+class LocalCache:
+    """Per-process cache of loaded content, grouped by collection.
+
+    Only serves entries while this worker's listener is tailing the bus (`activate`);
+    otherwise every lookup loads fresh, so a worker that cannot hear other workers'
+    changes never serves stale content.
+    """
+
+    def __init__(self):
+        self.active = False
+        self._entries = {}
+        self._generations = {}
+        self._epoch = 0
+        self._lock = threading.Lock()
+
+    def _generation(self, collection):
+        return self._epoch, self._generations.get(collection, 0)
+
+    def get_or_set(self, collection, key, load):
+        if not self.active:
+            return load()
+        with self._lock:
+            entries = self._entries.get(collection)
+            if entries is not None and key in entries:
+                return entries[key]
+            generation = self._generation(collection)
+        value = load()
+        with self._lock:
+            # Skip storing if the collection was invalidated while loading: the value
+            # may predate that change.
+            if self.active and self._generation(collection) == generation:
+                self._entries.setdefault(collection, {})[key] = value
+        return value
+
+    def evict(self, collection, document_id=None):
+        # Entries are keyed by query rather than by document, so any change to a
+        # collection drops all of its entries.
+        with self._lock:
+            self._entries.pop(collection, None)
+            self._generations[collection] = self._generations.get(collection, 0) + 1
+
+    def activate(self):
+        with self._lock:
+            self._entries.clear()
+            self._epoch += 1
+            self.active = True
+
+    def deactivate(self):
+        with self._lock:
+            self.active = False
+            self._entries.clear()
+            self._epoch += 1
+
+
+local_cache = LocalCache()
+
+
+def cached_first(document_class):
+    """`document_class.objects.first()`, kept in this worker until the collection changes."""
+
+    return local_cache.get_or_set(document_class._get_collection_name(), "first", document_class.objects.first)
+
+
+def publish(versions, document_id=None):
+    """Evict locally and broadcast a `(collection, id, version)` event per changed collection.
+
+    Publishing is best effort: a failed insert is logged, and other workers' caches
+    are still bounded by their listener reconnecting (which clears them).
+    """
+
+    for collection in versions:
+        local_cache.evict(collection, document_id)
+    events = [
+        {
+            "collection": collection,
+            "document_id": str(document_id) if document_id is not None else None,
+            "version": version,
+            "origin": ORIGIN,
+            "at": timezone.now(),
+        }
+        for collection, version in versions.items()
+    ]
+    if not events:
+        return
+    try:
+        CacheInvalidation._get_collection().insert_many(events, ordered=False)
+    except Exception:
+        logger.exception("Could not publish cache invalidation for %s", ", ".join(versions))
+
+
+class InvalidationListener(threading.Thread):
+    """Tails `cache_invalidations` and evicts the local entries other workers invalidate.
+
+    A tailable, awaiting cursor delivers events as they are inserted; if it dies (the
+    connection drops, or the ring buffer overtakes it) it is re-opened. While it is not
+    tailing, the local cache is off, and it starts empty once tailing resumes, so no
+    event can be missed.
+    """
+
+    def __init__(self, cache=local_cache):
+        super().__init__(name="cache-invalidation-listener", daemon=True)
+        self.cache = cache
+        self._stopped = threading.Event()
+
+    def stop(self):
+        self._stopped.set()
+
+    def run(self):
+        delay = RETRY_SECONDS
+        while not self._stopped.is_set():
+            try:
+                self._tail()
+                delay = RETRY_SECONDS
+            except PyMongoError:
+                logger.warning("Cache invalidation listener disconnected; retrying in %.0fs", delay, exc_info=True)
+                delay = min(delay * 2, MAX_RETRY_SECONDS)
+            self.cache.deactivate()
+            self._stopped.wait(delay)
+
+    def _tail(self):
+        collection = CacheInvalidation._get_collection()
+        # A tailable cursor over an empty result dies at once, so announce ourselves
+        # first: the collection then always has an event to tail from.
+        collection.insert_one({"collection": "", "origin": ORIGIN, "at": timezone.now()})
+        # Replay from a second back so events racing the (re)connect are still applied;
+        # older ones predate the (empty) cache. An event applied twice is a no-op.
+        since = timezone.now() - timedelta(seconds=1)
+        cursor = collection.find(cursor_type=CursorType.TAILABLE_AWAIT, max_await_time_ms=AWAIT_MS)
+        self.cache.activate()
+        try:
+            while cursor.alive and not self._stopped.is_set():
+                for event in cursor:
+                    if event["_id"].generation_time >= since:
+                        self.handle(event)
+        finally:
+            cursor.close()
+
+    def handle(self, event):
+        if event.get("origin") == ORIGIN or not event.get("collection"):
+            return
+        self.cache.evict(event["collection"], event.get("document_id"))
+
+
+_listener = None
+_listener_lock = threading.Lock()
+
+
+def start_listener():
+    """Start this worker's listener once; call after the worker process is forked."""
+
+    global _listener
+    with _listener_lock:
+        if _listener is None or not _listener.is_alive():
+            _listener = InvalidationListener()
+            _listener.start()
+    return _listener
@@ -0,0 +1,34 @@
+# apps/public/management/commands/archive_submissions.py
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.public.retention import archive_submissions, archived_count
+
+
+class Command(BaseCommand):
+    help = (
+        "Move read contact submissions older than N days into compressed monthly archive "
+        "blocks. Safe to re-run; schedule it (e.g. daily) to keep the hot collection small."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=settings.CONTACT_ARCHIVE_AFTER_DAYS,
+            help="Archive read submissions older than this many days (default: CONTACT_ARCHIVE_AFTER_DAYS).",
+        )
+        parser.add_argument("--dry-run", action="store_true", help="Only report what would be archived.")
+
+    def handle(self, *args, **options):
+        if options["days"] < 0:
+            raise CommandError("--days cannot be negative.")
+        archived = archive_submissions(days=options["days"], dry_run=options["dry_run"])
+        for month, count in archived.items():
+            self.stdout.write(f"  {month}: {count}")
+        total = sum(archived.values())
+        if options["dry_run"]:
+            self.stdout.write(f"{total} submission(s) would be archived. Re-run without --dry-run to apply.")
+        else:
+            self.stdout.write(f"Archived {total} submission(s); {archived_count()} in the archive.")
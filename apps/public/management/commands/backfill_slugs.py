@@ -0,0 +1,32 @@
+# apps/public/management/commands/backfill_slugs.py
+
+from django.core.management.base import BaseCommand
+
+from apps.public.counters import bump_content_version
+from apps.public.models import Blog, Project, SkillCategory
+from apps.public.slugs import allocate_slug
+
+
+class Command(BaseCommand):
+    help = "Assign slugs to blogs, projects and skill categories created before slugs existed."
+
+    def handle(self, *args, **options):
+        for document_class in (Blog, Project, SkillCategory):
+            collection = document_class._get_collection()
+            source = document_class.slug_source_field
+            max_length = document_class._fields["slug"].max_length
+            updated = 0
+            missing = collection.find({"$or": [{"slug": {"$exists": False}}, {"slug": None}, {"slug": ""}]}, {source: 1})
+            for row in missing:
+                slug = allocate_slug(
+                    document_class,
+                    row.get(source),
+                    exclude_id=row["_id"],
+                    fallback=document_class.slug_fallback,
+                    max_length=max_length,
+                )
+                collection.update_one({"_id": row["_id"]}, {"$set": {"slug": slug}})
+                updated += 1
+            if updated:
+                bump_content_version(document_class._get_collection_name())
+            self.stdout.write(f"{document_class.__name__}: {updated} slug(s) assigned.")
@@ -0,0 +1,56 @@
+# apps/public/management/commands/benchmark_read_models.py
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.public import benchmarks
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed a scratch MongoDB with synthetic portfolios and compare rendering the public "
+        "listings from MongoEngine documents against the slotted read models."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--scales",
+            default=",".join(str(scale) for scale in benchmarks.DEFAULT_SCALES),
+            help="Comma separated document counts to seed, e.g. 10,1000,10000.",
+        )
+        parser.add_argument("--repeat", type=int, default=20, help="Timed rounds per listing and path.")
+        parser.add_argument("--seed", type=int, default=0, help="Random seed for synthetic content.")
+        parser.add_argument("--mongo-uri", default="mongodb://localhost:27017", help="Local mongod to seed.")
+        parser.add_argument("--database", default="portfolio_benchmark", help="Scratch database name (dropped afterwards).")
+        parser.add_argument("--mongomock", action="store_true", help="Use an in-process mongomock client instead of mongod.")
+
+    def handle(self, *args, **options):
+        try:
+            scales = [int(value) for value in options["scales"].split(",") if value.strip()]
+        except ValueError:
+            raise CommandError("--scales must be a comma separated list of integers.")
+        if options["mongomock"]:
+            try:
+                import mongomock  # noqa: F401
+            except ImportError:
+                raise CommandError("--mongomock requires the mongomock package (pip install mongomock).")
+
+        try:
+            with benchmarks.benchmark_connection(
+                options["database"],
+                host=options["mongo_uri"],
+                use_mongomock=options["mongomock"],
+            ) as counter:
+                for scale in scales:
+                    self.stdout.write(f"Seeding scale {scale}...")
+                    benchmarks.seed_portfolio(scale, seed=options["seed"])
+                    for label, paths in benchmarks.compare_read_models(counter, options["repeat"]).items():
+                        documents, read_models = paths["documents"], paths["read_models"]
+                        speedup = documents["p50_ms"] / read_models["p50_ms"] if read_models["p50_ms"] else 0
+                        self.stdout.write(
+                            f"  {label:<10} {documents['rows']:>6} rows  "
+                            f"p50 {documents['p50_ms']:>9.2f}ms -> {read_models['p50_ms']:>9.2f}ms ({speedup:.1f}x)  "
+                            f"cmds {documents['mongo_commands']:>6} -> {read_models['mongo_commands']:<6}  "
+                            f"peak {documents['peak_memory_kb']:>9.1f}KiB -> {read_models['peak_memory_kb']:.1f}KiB"
+                        )
+        except ValueError as exc:
+            raise CommandError(str(exc))
@@ -0,0 +1,113 @@
+# apps/public/management/commands/benchmark_views.py
+
+import logging
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client
+from django.test.utils import setup_test_environment, teardown_test_environment
+from django.utils import timezone
+
+from apps.accounts.models import MongoUser
+from apps.public import benchmarks
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed a scratch MongoDB with synthetic portfolios and benchmark every public "
+        "and admin URL (p50/p95 latency, Mongo commands, peak memory)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--scales",
+            default=",".join(str(scale) for scale in benchmarks.DEFAULT_SCALES),
+            help="Comma separated document counts to seed, e.g. 10,1000,100000.",
+        )
+        parser.add_argument("--repeat", type=int, default=20, help="Timed requests per URL.")
+        parser.add_argument("--seed", type=int, default=0, help="Random seed for synthetic content.")
+        parser.add_argument("--mongo-uri", default="mongodb://localhost:27017", help="Local mongod to seed.")
+        parser.add_argument("--database", default="portfolio_benchmark", help="Scratch database name (dropped afterwards).")
+        parser.add_argument("--mongomock", action="store_true", help="Use an in-process mongomock client instead of mongod.")
+        parser.add_argument("--output", default="benchmark-results.json", help="Where to write the JSON results.")
+        parser.add_argument("--baseline", help="Previous results JSON to compare against.")
+        parser.add_argument("--latency-threshold", type=float, default=0.2, help="Allowed p95 growth ratio.")
+        parser.add_argument("--memory-threshold", type=float, default=0.2, help="Allowed peak memory growth ratio.")
+        parser.add_argument("--command-threshold", type=float, default=0.0, help="Allowed Mongo command growth ratio.")
+
+    def handle(self, *args, **options):
+        try:
+            scales = [int(value) for value in options["scales"].split(",") if value.strip()]
+        except ValueError:
+            raise CommandError("--scales must be a comma separated list of integers.")
+        if options["mongomock"]:
+            try:
+                import mongomock  # noqa: F401
+            except ImportError:
+                raise CommandError("--mongomock requires the mongomock package (pip install mongomock).")
+
+        payload = {
+            "version": benchmarks.RESULTS_VERSION,
+            "created_at": timezone.now().isoformat(),
+            "backend": "mongomock" if options["mongomock"] else "mongod",
+            "repeat": options["repeat"],
+            "seed": options["seed"],
+            "scales": {},
+        }
+
+        # Server errors are recorded as a status in the results; keep tracebacks out of the report.
+        request_logger = logging.getLogger("django.request")
+        previous_level = request_logger.level
+        request_logger.setLevel(logging.CRITICAL)
+
+        setup_test_environment()
+        try:
+            with benchmarks.benchmark_connection(
+                options["database"],
+                host=options["mongo_uri"],
+                use_mongomock=options["mongomock"],
+            ) as counter:
+                # Admin accounts live in MongoDB, and MongoUserBackend is the only backend.
+                account = MongoUser(username="benchmark", email="benchmark@example.com", is_superuser=True)
+                account.set_password("benchmark")
+                account.save()
+                for scale in scales:
+                    self.stdout.write(f"Seeding scale {scale}...")
+                    benchmarks.seed_portfolio(scale, seed=options["seed"])
+                    client = Client(raise_request_exception=False)
+                    if not client.login(username="benchmark", password="benchmark"):
+                        raise CommandError("Could not log in the benchmark admin account.")
+                    payload["scales"][str(scale)] = self._run_scale(client, counter, options["repeat"])
+        except ValueError as exc:
+            raise CommandError(str(exc))
+        finally:
+            teardown_test_environment()
+            request_logger.setLevel(previous_level)
+
+        benchmarks.write_results(options["output"], payload)
+        self.stdout.write(self.style.SUCCESS(f"Results written to {options['output']}"))
+
+        if options["baseline"]:
+            regressions = benchmarks.compare_results(
+                benchmarks.load_results(options["baseline"]),
+                payload,
+                latency_threshold=options["latency_threshold"],
+                memory_threshold=options["memory_threshold"],
+                command_threshold=options["command_threshold"],
+            )
+            if regressions:
+                for line in regressions:
+                    self.stderr.write(line)
+                raise CommandError(f"{len(regressions)} regression(s) against {options['baseline']}.")
+            self.stdout.write(self.style.SUCCESS("No regressions against baseline."))
+
+    def _run_scale(self, client, counter, repeat):
+        results = {}
+        for label, path in benchmarks.collect_routes():
+            stats = benchmarks.measure_route(client, path, counter, repeat=repeat)
+            results[label] = stats
+            self.stdout.write(
+                f"  {label:<45} {stats['status']}  p50 {stats['p50_ms']:>8.2f}ms  "
+                f"p95 {stats['p95_ms']:>8.2f}ms  cmds {stats['mongo_commands']:>6}  "
+                f"peak {stats['peak_memory_kb']:>9.1f}KiB"
+            )
+        return results
@@ -0,0 +1,44 @@
+# apps/public/management/commands/check_media_storage.py
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = (
+        "Round-trip a small file through the configured media storage (save, exists, size, "
+        "open, url, delete) to check its settings, e.g. against a local MinIO."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--name", default="uploads/check/storage-check.txt", help="Path of the test file.")
+
+    def handle(self, *args, **options):
+        storage = default_storage
+        payload = b"portfolio storage check\n"
+        self.stdout.write(f"Storage: {storage.__class__.__module__}.{storage.__class__.__name__}")
+        try:
+            name = storage.save(options["name"], ContentFile(payload))
+            try:
+                if not storage.exists(name):
+                    raise CommandError(f"{name} was saved but does not exist.")
+                if storage.size(name) != len(payload):
+                    raise CommandError(f"{name} has size {storage.size(name)}, expected {len(payload)}.")
+                with storage.open(name, "rb") as handle:
+                    if handle.read() != payload:
+                        raise CommandError(f"{name} reads back different bytes.")
+                self.stdout.write(f"  saved, read back and sized {name}")
+                self.stdout.write(f"  url: {storage.url(name)}")
+                if hasattr(storage, "presigned_post"):
+                    form = storage.presigned_post(name, "text/plain", len(payload), 60)
+                    self.stdout.write(f"  direct uploads post to {form['url']}")
+                else:
+                    self.stdout.write("  direct uploads: not supported, the admin uploads in chunks")
+            finally:
+                storage.delete(name)
+        except CommandError:
+            raise
+        except Exception as exc:
+            raise CommandError(f"Storage check failed: {exc}")
+        self.stdout.write(self.style.SUCCESS("Media storage OK."))
@@ -0,0 +1,44 @@
+# apps/public/management/commands/gc_media.py
+
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.public.media_gc import QUARANTINE_PREFIX, collect_garbage, upload_prefixes
+
+
+class Command(BaseCommand):
+    help = "Find and remove uploaded media files no longer referenced by any document."
+
+    def add_arguments(self, parser):
+        mode = parser.add_mutually_exclusive_group()
+        mode.add_argument("--delete", action="store_true", help="Delete orphaned files.")
+        mode.add_argument(
+            "--quarantine",
+            action="store_true",
+            help=f"Move orphaned files under {QUARANTINE_PREFIX}/<timestamp>/ instead of deleting them.",
+        )
+        parser.add_argument(
+            "--grace-hours",
+            type=float,
+            default=24,
+            help="Only touch files older than this, so uploads whose document is not saved yet survive.",
+        )
+        parser.add_argument("--verbose-paths", action="store_true", help="List every orphaned path.")
+
+    def handle(self, *args, **options):
+        if options["grace_hours"] < 0:
+            raise CommandError("--grace-hours cannot be negative.")
+        mode = "delete" if options["delete"] else "quarantine" if options["quarantine"] else "dry-run"
+
+        self.stdout.write(f"Scanning {', '.join(upload_prefixes())} ({mode})...")
+        orphans = collect_garbage(grace=timedelta(hours=options["grace_hours"]), mode=mode)
+        if options["verbose_paths"]:
+            for path, size in orphans:
+                self.stdout.write(f"  {path} ({size:,} bytes)")
+
+        total = sum(size for _, size in orphans)
+        verb = {"dry-run": "would reclaim", "delete": "reclaimed", "quarantine": "quarantined"}[mode]
+        self.stdout.write(f"{len(orphans)} orphaned file(s), {verb} {total:,} bytes ({total / 1048576:.1f} MiB).")
+        if mode == "dry-run" and orphans:
+            self.stdout.write("Re-run with --delete or --quarantine to apply.")
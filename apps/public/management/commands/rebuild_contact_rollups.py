@@ -0,0 +1,22 @@
+# apps/public/management/commands/rebuild_contact_rollups.py
+
+from django.core.management.base import BaseCommand
+
+from apps.public.rollups import ContactDailyRollup, rebuild
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the daily contact activity rollups from the submissions and the archive. "
+        "Run once to back-fill existing data, or whenever the rollups may have drifted."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--if-empty", action="store_true", help="Only rebuild when there are no rollups yet.")
+
+    def handle(self, *args, **options):
+        if options["if_empty"] and ContactDailyRollup.objects.only("day").first() is not None:
+            self.stdout.write("Contact rollups already exist; nothing to do.")
+            return
+        days = rebuild()
+        self.stdout.write(f"Rebuilt contact rollups for {days} day(s).")
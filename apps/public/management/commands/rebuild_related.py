@@ -0,0 +1,29 @@
+# apps/public/management/commands/rebuild_related.py
+
+from django.core.management.base import BaseCommand
+from pymongo import UpdateOne
+
+from apps.public.models import Blog, Project
+from apps.public.related import extract_keywords, rebuild_related
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the precomputed related-content lists for blogs and projects, "
+        "backfilling missing keywords and the stored normalised terms."
+    )
+
+    def handle(self, *args, **options):
+        collection = Blog._get_collection()
+        operations = []
+        for row in collection.find({"keywords": {"$exists": False}}, {"content": 1}):
+            operations.append(UpdateOne({"_id": row["_id"]}, {"$set": {"keywords": extract_keywords(row.get("content"))}}))
+            if len(operations) >= 1000:
+                collection.bulk_write(operations, ordered=False)
+                operations = []
+        if operations:
+            collection.bulk_write(operations, ordered=False)
+
+        for document_class in (Blog, Project):
+            count = rebuild_related(document_class)
+            self.stdout.write(f"{document_class.__name__}: related lists rebuilt for {count} document(s).")
@@ -0,0 +1,21 @@
+# apps/public/management/commands/reconcile_counters.py
+
+from django.core.management.base import BaseCommand
+
+from apps.public.counters import SITE_COUNTERS_ID, reconcile
+from apps.public.models import SiteCounters
+
+
+class Command(BaseCommand):
+    help = "Recompute the denormalized site counters exactly from the content collections."
+
+    def handle(self, *args, **options):
+        previous = SiteCounters.objects(key=SITE_COUNTERS_ID).first()
+        values = reconcile()
+        drifted = 0
+        for name, value in sorted(values.items()):
+            before = getattr(previous, name, None) if previous is not None else None
+            if before != value:
+                drifted += 1
+                self.stdout.write(f"{name}: {before} -> {value}")
+        self.stdout.write(f"Site counters reconciled ({drifted} corrected).")
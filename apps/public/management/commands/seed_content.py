@@ -0,0 +1,118 @@
+# apps/public/management/commands/seed_content.py
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from pymongo.errors import BulkWriteError
+
+from apps.public.counters import bump_content_version, reconcile
+from apps.public.models import (
+    Blog,
+    ContactSubmission,
+    Project,
+    ResearchCategory,
+    ResearchEntry,
+    Skill,
+    SkillCategory,
+)
+from apps.public.related import rebuild_related
+from apps.public.rollups import rebuild as rebuild_rollups
+from apps.public.synthetic import SyntheticContent, insert_chunked
+
+
+class Command(BaseCommand):
+    help = "Bulk-insert large, deterministic synthetic content for load testing."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--blogs", type=int, default=0)
+        parser.add_argument("--projects", type=int, default=0)
+        parser.add_argument("--skills", type=int, default=0)
+        parser.add_argument("--skill-categories", type=int, default=0)
+        parser.add_argument("--research-categories", type=int, default=0)
+        parser.add_argument("--research-entries", type=int, default=0)
+        parser.add_argument("--submissions", type=int, default=0)
+        parser.add_argument("--seed", type=int, default=0, help="Random seed; the same seed produces the same content.")
+        parser.add_argument("--chunk-size", type=int, default=5000, help="Documents per insert_many call.")
+        parser.add_argument("--content-words", type=int, default=600, help="Median words per blog/project body.")
+        parser.add_argument("--content-sigma", type=float, default=0.5, help="Log-normal spread of body length (0 = fixed).")
+        parser.add_argument("--tag-vocabulary", type=int, default=150, help="Number of distinct tags/technologies.")
+        parser.add_argument("--tags-min", type=int, default=1)
+        parser.add_argument("--tags-max", type=int, default=6)
+        parser.add_argument("--image-ratio", type=float, default=0.6, help="Share of blogs/projects with an image path.")
+        parser.add_argument("--published-ratio", type=float, default=0.8)
+        parser.add_argument("--read-ratio", type=float, default=0.7, help="Share of submissions already read.")
+        parser.add_argument("--days", type=int, default=365, help="Spread timestamps over this many past days.")
+        parser.add_argument("--clear", action="store_true", help="Drop the seeded collections before inserting.")
+
+    def handle(self, *args, **options):
+        if options["chunk_size"] < 1:
+            raise CommandError("--chunk-size must be positive.")
+        if options["tags_min"] > options["tags_max"]:
+            raise CommandError("--tags-min cannot exceed --tags-max.")
+
+        generator = SyntheticContent(
+            seed=options["seed"],
+            content_words=options["content_words"],
+            content_sigma=options["content_sigma"],
+            tag_vocabulary=options["tag_vocabulary"],
+            tags_per_doc=(options["tags_min"], options["tags_max"]),
+            image_ratio=options["image_ratio"],
+            published_ratio=options["published_ratio"],
+            read_ratio=options["read_ratio"],
+            days=options["days"],
+        )
+
+        if options["clear"]:
+            for document_class in (SkillCategory, Skill, Project, Blog, ResearchCategory, ResearchEntry, ContactSubmission):
+                document_class.drop_collection()
+            self.stdout.write("Dropped existing content collections.")
+
+        chunk_size = options["chunk_size"]
+        try:
+            category_ids = [doc["_id"] for doc in self._insert(
+                SkillCategory, list(generator.skill_categories(options["skill_categories"])), chunk_size
+            )]
+            if not category_ids:
+                category_ids = list(SkillCategory.objects.scalar("id"))
+            self._insert(Skill, generator.skills(options["skills"], category_ids), chunk_size)
+            self._insert(Project, generator.projects(options["projects"]), chunk_size)
+            self._insert(Blog, generator.blogs(options["blogs"]), chunk_size)
+
+            research_ids = [doc["_id"] for doc in self._insert(
+                ResearchCategory, list(generator.research_categories(options["research_categories"])), chunk_size
+            )]
+            if not research_ids:
+                research_ids = list(ResearchCategory.objects.scalar("id"))
+            self._insert(ResearchEntry, generator.research_entries(options["research_entries"], research_ids), chunk_size)
+            self._insert(ContactSubmission, generator.contact_submissions(options["submissions"]), chunk_size)
+        except BulkWriteError as exc:
+            raise CommandError(
+                f"Bulk insert failed ({exc.details.get('writeErrors', [{}])[0].get('errmsg', exc)}). "
+                "Re-run with --clear or a different --seed."
+            )
+
+        # Bulk inserts bypass the save hooks that maintain derived data.
+        for document_class, count in ((Blog, options["blogs"]), (Project, options["projects"])):
+            if count:
+                rebuild_related(document_class)
+                self.stdout.write(f"{document_class.__name__}: related lists rebuilt.")
+        if options["submissions"]:
+            days = rebuild_rollups()
+            self.stdout.write(f"Contact rollups rebuilt for {days} day(s).")
+        reconcile()
+        self.stdout.write("Site counters reconciled.")
+        bump_content_version(*(
+            document_class._get_collection_name()
+            for document_class in (SkillCategory, Skill, Project, Blog, ResearchCategory, ResearchEntry, ContactSubmission)
+        ))
+
+    def _insert(self, document_class, documents, chunk_size):
+        started = time.perf_counter()
+        count = insert_chunked(document_class, documents, chunk_size=chunk_size)
+        if count:
+            elapsed = time.perf_counter() - started
+            self.stdout.write(
+                f"{document_class.__name__}: {count} documents in {elapsed:.1f}s "
+                f"({count / elapsed if elapsed else count:,.0f}/s)"
+            )
+        return documents
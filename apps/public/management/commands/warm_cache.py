@@ -0,0 +1,35 @@
+# apps/public/management/commands/warm_cache.py
+
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.public.warmup import warm, warm_urls
+
+
+class Command(BaseCommand):
+    help = (
+        "Render every public page once, in this process, and report status and timing. "
+        "Workers do the same at start (WARMUP_ON_START); this shows what they warm and "
+        "which pages are slow when cold."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--concurrency", type=int, default=None, help="Requests in flight (default: WARMUP_CONCURRENCY).")
+        parser.add_argument("--limit", type=int, default=None, help="Most pages to warm (default: WARMUP_MAX_URLS).")
+        parser.add_argument("--list", action="store_true", help="Only list the paths that would be warmed.")
+
+    def handle(self, *args, **options):
+        if options["concurrency"] is not None and options["concurrency"] < 1:
+            raise CommandError("--concurrency must be at least 1.")
+        paths = warm_urls(limit=options["limit"])
+        if options["list"]:
+            for path in paths:
+                self.stdout.write(path)
+            return
+
+        results = warm(WSGIHandler(), paths, concurrency=options["concurrency"])
+        for path, status, seconds in sorted(results, key=lambda result: result[2], reverse=True):
+            self.stdout.write(f"{status:>3}  {seconds * 1000:8.1f} ms  {path}")
+        failed = sum(1 for _, status, _ in results if status >= 500 or status == 0)
+        total = sum(seconds for _, _, seconds in results)
+        self.stdout.write(f"Warmed {len(results)} page(s), {total * 1000:.1f} ms of rendering ({failed} failed).")
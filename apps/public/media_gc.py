@@ -0,0 +1,129 @@
+# apps/public/media_gc.py
+
+import posixpath
+from datetime import timedelta
+
+from django.core.files.storage import default_storage
+from django.utils import timezone
+from mongoengine import Document
+
+from . import models
+from .models import FileFieldDescriptor, UploadSession
+from .uploads import UPLOAD_STAGING_PREFIX
+
+
+QUARANTINE_PREFIX = "quarantine"
+
+
+def file_fields():
+    """Yield (document class, storage field, upload prefix) for every `FileFieldDescriptor`."""
+
+    for document_class in vars(models).values():
+        if not isinstance(document_class, type) or not issubclass(document_class, Document):
+            continue
+        if document_class._meta.get("abstract"):
+            continue
+        for attribute in vars(document_class).values():
+            if isinstance(attribute, FileFieldDescriptor):
+                yield document_class, attribute.storage_field, attribute.upload_to
+
+
+def referenced_paths():
+    """Mark phase: every stored path still referenced by a document, one projected scan per field."""
+
+    live = set()
+    for document_class, storage_field, _ in file_fields():
+        cursor = document_class._get_collection().find(
+            {storage_field: {"$nin": [None, ""]}}, {storage_field: 1, "_id": 0}
+        )
+        live.update(row[storage_field] for row in cursor)
+
+    # Chunks of uploads in progress, direct uploads not yet verified, and finished
+    # uploads not yet attached to a form save.
+    for row in UploadSession._get_collection().find({}, {"chunks": 1, "path": 1, "direct_path": 1, "_id": 0}):
+        live.update(row.get("chunks") or ())
+        for field in ("path", "direct_path"):
+            if row.get(field):
+                live.add(row[field])
+    return live
+
+
+def upload_prefixes():
+    return sorted({upload_to for _, _, upload_to in file_fields()} | {UPLOAD_STAGING_PREFIX})
+
+
+def walk_storage(prefix, storage=None):
+    """Yield every file path below `prefix` using only `listdir`, so any storage backend works."""
+
+    storage = storage or default_storage
+    try:
+        directories, files = storage.listdir(prefix)
+    except (FileNotFoundError, NotADirectoryError):
+        return
+    for name in files:
+        yield posixpath.join(prefix, name)
+    for name in directories:
+        yield from walk_storage(posixpath.join(prefix, name), storage)
+
+
+def _modified_time(storage, path):
+    try:
+        return storage.get_modified_time(path)
+    except (NotImplementedError, OSError):
+        return None
+
+
+def find_orphans(grace, storage=None, live=None, prefixes=None):
+    """Sweep candidates: unreferenced files under the upload prefixes older than `grace`.
+
+    Files whose age cannot be determined are never returned. Yields (path, size).
+    """
+
+    storage = storage or default_storage
+    live = referenced_paths() if live is None else live
+    cutoff = timezone.now() - grace
+    for prefix in prefixes or upload_prefixes():
+        for path in walk_storage(prefix, storage):
+            if path in live:
+                continue
+            modified = _modified_time(storage, path)
+            if modified is None:
+                continue
+            if timezone.is_naive(modified):
+                modified = timezone.make_aware(modified)
+            if modified > cutoff:
+                continue
+            try:
+                size = storage.size(path)
+            except OSError:
+                size = 0
+            yield path, size
+
+
+def quarantine(path, storage=None, stamp=None):
+    """Move a file under `quarantine/<stamp>/` so it can be restored by hand; returns the new path."""
+
+    storage = storage or default_storage
+    stamp = stamp or timezone.now().strftime("%Y%m%d%H%M%S")
+    with storage.open(path, "rb") as handle:
+        destination = storage.save(posixpath.join(QUARANTINE_PREFIX, stamp, path), handle)
+    storage.delete(path)
+    return destination
+
+
+def collect_garbage(grace=timedelta(hours=24), mode="dry-run", storage=None):
+    """Run mark and sweep; returns the (path, size) pairs found or removed.
+
+    `mode` is "dry-run" (report only), "delete" or "quarantine".
+    """
+
+    storage = storage or default_storage
+    stamp = timezone.now().strftime("%Y%m%d%H%M%S")
+    orphans = []
+    for path, size in find_orphans(grace, storage):
+        if mode == "delete":
+            storage.delete(path)
+        elif mode == "quarantine":
+            quarantine(path, storage, stamp)
+        orphans.append((path, size))
+    return orphans
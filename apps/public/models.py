@@ -1,26 +1,56 @@
 import os
+from datetime import timezone as dt_timezone
 from types import SimpleNamespace
 
+from django.core.files.base import ContentFile
 from django.core.files.storage import default_storage
 from django.utils import timezone
-from django.utils.text import slugify
 
 from mongoengine import (
+    BinaryField,
     BooleanField,
     DateTimeField,
+    DictField,
     Document,
+    FloatField,
     IntField,
     ListField,
+    ObjectIdField,
     ReferenceField,
     StringField,
 )
 from mongoengine import NULLIFY
 
+from .counters import SITE_COUNTERS_ID, CountedDocumentMixin, bump_content_version
+from .related import RelatedContentMixin, extract_keywords
+from .rollups import record_delete, record_read_change, record_submission
+from .slugs import SluggedDocumentMixin
+from .uploads import (
+    DIRECT_UPLOAD_TTL,
+    UPLOAD_RULES,
+    UPLOAD_SESSION_TTL,
+    UPLOAD_STAGING_PREFIX,
+    UploadRejected,
+    assemble,
+    check_signature,
+    direct_upload_name,
+)
+
 
 def _now():
     return timezone.now()
 
 
+def version_token(value):
+    """Serialize an `updated_at` the way MongoDB stores it: naive UTC, millisecond precision."""
+
+    if value is None:
+        return ""
+    if timezone.is_aware(value):
+        value = timezone.make_naive(value, dt_timezone.utc)
+    return value.isoformat(timespec="milliseconds")
+
+
 class StoredFileProxy:
     """A tiny stand-in for Django's FieldFile so templates can keep using `.url` and `.name`."""
 
@@ -72,31 +102,64 @@ class FileFieldDescriptor:
         setattr(instance, self.storage_field, value)
 
 
-class TimestampedDocument(Document):
+class VersionedDocument(Document):
+    """Bumps the content version of its collection whenever a document is saved or deleted.
+
+    Saving a stored document with no changed fields is a no-op: nothing is written and
+    no version is bumped, so caches keyed on the versions stay valid.
+    """
+
+    meta = {"abstract": True}
+
+    def has_changes(self):
+        return self._created or self.pk is None or bool(self._get_changed_fields())
+
+    def save(self, *args, **kwargs):
+        if not self.has_changes() and not kwargs.get("force_insert"):
+            return self
+        result = super().save(*args, **kwargs)
+        bump_content_version(self._get_collection_name(), document_id=self.pk)
+        return result
+
+    def delete(self, *args, **kwargs):
+        document_id = self.pk
+        result = super().delete(*args, **kwargs)
+        bump_content_version(self._get_collection_name(), document_id=document_id)
+        return result
+
+
+class TimestampedDocument(VersionedDocument):
     meta = {"abstract": True}
 
     created_at = DateTimeField(default=_now)
     updated_at = DateTimeField(default=_now)
 
     def save(self, *args, **kwargs):
-        now = _now()
-        if not self.created_at:
-            self.created_at = now
-        self.updated_at = now
+        if self.has_changes():
+            now = _now()
+            if not self.created_at:
+                self.created_at = now
+            self.updated_at = now
         return super().save(*args, **kwargs)
 
     @property
     def id_str(self):
         return str(self.id)
 
+    @property
+    def version(self):
+        """Optimistic-concurrency token for the stored `updated_at`."""
+        return version_token(self.updated_at)
+
 
-class UpdatedDocument(Document):
+class UpdatedDocument(VersionedDocument):
     meta = {"abstract": True}
 
     updated_at = DateTimeField(default=_now)
 
     def save(self, *args, **kwargs):
-        self.updated_at = _now()
+        if self.has_changes():
+            self.updated_at = _now()
         return super().save(*args, **kwargs)
 
 
@@ -116,7 +179,7 @@ class TestPost(Document):
     meta = {"collection": "test_posts"}
 
 
-class SkillCategory(Document):
+class SkillCategory(SluggedDocumentMixin, TimestampedDocument):
     name = StringField(max_length=100, required=True, unique=True)
     slug = StringField(max_length=120, unique=True)
     description = StringField(max_length=255, default="")
@@ -125,13 +188,12 @@ class SkillCategory(Document):
 
     meta = {"collection": "skill_categories", "ordering": ["-order", "name"]}
 
+    slug_source_field = "name"
+    slug_fallback = "category"
+
     def __str__(self):
         return self.name
 
-    @property
-    def id_str(self):
-        return str(self.id)
-
     @property
     def proficiency_percent(self):
         value_raw = str(self.proficiency or '').strip()
@@ -143,26 +205,6 @@ class SkillCategory(Document):
             value = 0
         return max(0, min(100, value))
 
-    def save(self, *args, **kwargs):
-        self.slug = self._generate_slug() if not self.slug else self.slug
-        return super().save(*args, **kwargs)
-
-    def _generate_slug(self):
-        base = slugify(self.name) or "category"
-        candidate = base
-        counter = 1
-
-        while True:
-            query = SkillCategory.objects(slug=candidate)
-            if self.id:
-                query = query.filter(id__ne=self.id)
-            if query.count() == 0:
-                break
-            candidate = f"{base}-{counter}"
-            counter += 1
-
-        return candidate
-
 
 class Profile(TimestampedDocument):
     name = StringField(max_length=100, required=True)
@@ -185,7 +227,7 @@ class Profile(TimestampedDocument):
         return self.name
 
 
-class Skill(TimestampedDocument):
+class Skill(CountedDocumentMixin, TimestampedDocument):
     name = StringField(max_length=100, required=True)
     category = ReferenceField("SkillCategory", reverse_delete_rule=NULLIFY)
     is_active = BooleanField(default=True)
@@ -194,6 +236,8 @@ class Skill(TimestampedDocument):
 
     meta = {"collection": "skills", "ordering": ["-proficiency"]}
 
+    site_counters = {"skills_total": {}, "skills_active": {"is_active": True}}
+
     def __str__(self):
         return self.name
 
@@ -213,8 +257,9 @@ class Skill(TimestampedDocument):
         return max(0, min(100, value))
 
 
-class Project(TimestampedDocument):
+class Project(CountedDocumentMixin, RelatedContentMixin, SluggedDocumentMixin, TimestampedDocument):
     title = StringField(max_length=200, required=True)
+    slug = StringField(max_length=220, unique=True, sparse=True)
     description = StringField()
     tech_stack = ListField(StringField(), default=list)
     image_path = StringField()
@@ -222,23 +267,41 @@ class Project(TimestampedDocument):
     demo_link = StringField()
     is_featured = BooleanField(default=False)
     is_active = BooleanField(default=True)
+    related_terms = DictField()
+    related_ids = ListField(ObjectIdField(), default=list)
+    related_scores = ListField(FloatField(), default=list)
 
     image = FileFieldDescriptor("image_path", "projects")
 
-    meta = {"collection": "projects", "ordering": ["-created_at"]}
+    meta = {
+        "collection": "projects",
+        "ordering": ["-created_at"],
+        "indexes": ["tech_stack", "related_terms.tech_stack", "related_ids"],
+    }
+
+    related_features = {"tech_stack": 1.0}
+    related_filters = {"is_active": True}
+    site_counters = {"projects_total": {}, "projects_active": {"is_active": True}}
 
     def __str__(self):
         return self.title
 
 
-class Blog(TimestampedDocument):
+class Blog(CountedDocumentMixin, RelatedContentMixin, SluggedDocumentMixin, TimestampedDocument):
     STATUS_CHOICES = ("draft", "published")
+    # `blog/feed/` is routed before `blog/<slug>/`.
+    reserved_slugs = ("feed",)
 
     title = StringField(max_length=200, required=True)
+    slug = StringField(max_length=220, unique=True, sparse=True)
     content = StringField()
     preview = StringField(max_length=300)
     cover_image_path = StringField()
     tags = ListField(StringField(), default=list)
+    keywords = ListField(StringField(), default=list)
+    related_terms = DictField()
+    related_ids = ListField(ObjectIdField(), default=list)
+    related_scores = ListField(FloatField(), default=list)
     status = StringField(choices=STATUS_CHOICES, default="draft")
     is_active = BooleanField(default=True)
     read_time = IntField(default=5)
@@ -249,11 +312,29 @@ class Blog(TimestampedDocument):
 
     cover_image = FileFieldDescriptor("cover_image_path", "blogs")
 
-    meta = {"collection": "blogs", "ordering": ["-created_at"]}
+    meta = {
+        "collection": "blogs",
+        "ordering": ["-created_at"],
+        "indexes": ["tags", "keywords", "related_terms.tags", "related_terms.keywords", "related_ids"],
+    }
+
+    related_features = {"tags": 0.7, "keywords": 0.3}
+    related_filters = {"status": "published", "is_active": True}
+    site_counters = {
+        "blogs_total": {},
+        "blogs_published": {"status": "published"},
+        "blogs_draft": {"status": "draft"},
+        "blogs_live": {"status": "published", "is_active": True},
+    }
 
     def __str__(self):
         return self.title
 
+    def save(self, *args, **kwargs):
+        if not self.id or "content" in self._get_changed_fields():
+            self.keywords = extract_keywords(self.content)
+        return super().save(*args, **kwargs)
+
     @property
     def author(self):
         if not self.author_username:
@@ -417,7 +498,7 @@ class ResearchCategory(TimestampedDocument):
         return self.name
 
 
-class ResearchEntry(TimestampedDocument):
+class ResearchEntry(CountedDocumentMixin, TimestampedDocument):
     title = StringField(max_length=200, required=True)
     description = StringField()
     publication = StringField(max_length=200, default="")
@@ -427,6 +508,9 @@ class ResearchEntry(TimestampedDocument):
 
     meta = {"collection": "research_entries", "ordering": ["-created_at"]}
 
+    # Entries saved before `is_active` existed are shown publicly.
+    site_counters = {"research_active": {"is_active": {"$ne": False}}}
+
     def __str__(self):
         return self.title
 
@@ -459,7 +543,7 @@ class ContactPage(SingletonDocument):
         return "Contact Page Content"
 
 
-class ContactSubmission(Document):
+class ContactSubmission(CountedDocumentMixin, Document):
     name = StringField(max_length=200, required=True)
     email = StringField(required=True)
     subject = StringField(max_length=300)
@@ -468,7 +552,185 @@ class ContactSubmission(Document):
     is_read = BooleanField(default=False)
     notes = StringField(default="")
 
-    meta = {"collection": "contact_submissions", "ordering": ["-submitted_at"]}
+    meta = {
+        "collection": "contact_submissions",
+        "ordering": ["-submitted_at"],
+        # Serves both the admin listing and the retention sweep (read, older than N days).
+        "indexes": [("is_read", "submitted_at")],
+    }
+
+    site_counters = {"submissions_total": {}, "submissions_unread": {"is_read": False}}
 
     def __str__(self):
         return f"{self.name} - {self.subject}"
+
+    def save(self, *args, **kwargs):
+        created = self._created or not self.id
+        read_changed = not created and "is_read" in self._get_changed_fields()
+        result = super().save(*args, **kwargs)
+        if created:
+            record_submission(self.submitted_at, self.email, self.is_read)
+        elif read_changed:
+            record_read_change(self.submitted_at, self.is_read)
+        return result
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        record_delete(self.submitted_at, self.is_read)
+        return result
+
+
+class ContactArchive(Document):
+    """A compressed NDJSON block of read submissions moved out of `contact_submissions`.
+
+    Written by `apps.public.retention.archive_submissions`; one month can span several
+    blocks. `submission_ids` makes a re-run after an interrupted sweep idempotent.
+    """
+
+    month = StringField(required=True)  # "YYYY-MM" of submitted_at
+    codec = StringField(required=True, choices=("zstd", "zlib"))
+    count = IntField(required=True)
+    first_submitted_at = DateTimeField()
+    last_submitted_at = DateTimeField()
+    submission_ids = ListField(ObjectIdField())
+    data = BinaryField(required=True)
+    archived_at = DateTimeField(default=_now)
+
+    meta = {
+        "collection": "contact_archive",
+        "ordering": ["-month", "-last_submitted_at"],
+        "indexes": ["month", "submission_ids"],
+    }
+
+
+class SiteCounters(Document):
+    """Denormalized dashboard/page counts, kept current with `$inc` by `CountedDocumentMixin`.
+
+    Also carries the content versions bumped by `bump_content_version`.
+    """
+
+    key = StringField(primary_key=True, default=SITE_COUNTERS_ID)
+    projects_total = IntField(default=0)
+    projects_active = IntField(default=0)
+    blogs_total = IntField(default=0)
+    blogs_published = IntField(default=0)
+    blogs_draft = IntField(default=0)
+    blogs_live = IntField(default=0)
+    skills_total = IntField(default=0)
+    skills_active = IntField(default=0)
+    research_active = IntField(default=0)
+    submissions_total = IntField(default=0)
+    submissions_unread = IntField(default=0)
+    reconciled_at = DateTimeField()
+    content_version = IntField(default=0)
+    collection_versions = DictField()
+
+    meta = {"collection": "site_counters"}
+
+    @property
+    def submissions_read(self):
+        return self.submissions_total - self.submissions_unread
+
+
+class UploadSession(Document):
+    """A resumable chunked upload staged under `uploads/partial/<id>/` until complete.
+
+    Chunks are appended strictly in order: each append is a conditional update on
+    `received`, so a retried or duplicated chunk can never be applied twice.
+
+    With an object store the browser can instead POST the file straight to
+    `direct_path` in the bucket (see `start_direct`); `verify_direct` then checks what
+    arrived before the session counts as complete.
+    """
+
+    rule = StringField(required=True)
+    filename = StringField(required=True)
+    content_type = StringField(required=True)
+    size = IntField(required=True)
+    received = IntField(default=0)
+    chunks = ListField(StringField(), default=list)
+    path = StringField()
+    direct_path = StringField()
+    owner_id = StringField()
+    created_at = DateTimeField(default=_now)
+
+    meta = {
+        "collection": "upload_sessions",
+        "indexes": [{"fields": ["created_at"], "expireAfterSeconds": UPLOAD_SESSION_TTL}],
+    }
+
+    @property
+    def is_complete(self):
+        return bool(self.path)
+
+    def append(self, offset, data):
+        """Stage one chunk at `offset`; assembles the final file once the last byte arrives."""
+
+        if self.is_complete:
+            return
+        if self.received == self.size:
+            # Every byte arrived but assembling failed earlier; retry it.
+            self.finish()
+            return
+        if offset != self.received:
+            raise UploadRejected(f"Expected offset {self.received}.", status=409)
+        if not data:
+            raise UploadRejected("Empty chunk.")
+        if offset + len(data) > self.size:
+            raise UploadRejected("Chunk exceeds the declared size.", status=413)
+        if offset == 0:
+            check_signature(self.content_type, data[:16])
+
+        chunk_path = default_storage.save(
+            f"{UPLOAD_STAGING_PREFIX}/{self.id}/{offset:012d}", ContentFile(data)
+        )
+        updated = UploadSession.objects(id=self.id, received=offset, path=None).update_one(
+            inc__received=len(data), push__chunks=chunk_path
+        )
+        if not updated:
+            default_storage.delete(chunk_path)
+            self.reload()
+            raise UploadRejected(f"Expected offset {self.received}.", status=409)
+        self.reload()
+        if self.received == self.size:
+            self.finish()
+
+    def finish(self):
+        path = assemble(UPLOAD_RULES[self.rule], self.filename, self.chunks, self.size)
+        UploadSession.objects(id=self.id).update_one(set__path=path, set__chunks=[])
+        self.reload()
+
+    def start_direct(self):
+        """Reserve the bucket name and return the presigned form (`url`, `fields`)."""
+
+        self.direct_path = direct_upload_name(UPLOAD_RULES[self.rule], self.filename)
+        self.save()
+        return default_storage.presigned_post(self.direct_path, self.content_type, self.size, DIRECT_UPLOAD_TTL)
+
+    def verify_direct(self):
+        """Check the object the browser uploaded (size and leading bytes) and complete the session.
+
+        An object that has not arrived yet is a 409, so the client can retry; for any
+        other rejection, `discard()` removes the session and the object.
+        """
+
+        if self.is_complete:
+            return
+        if not self.direct_path:
+            raise UploadRejected("This upload is not a direct upload.")
+        try:
+            size = default_storage.size(self.direct_path)
+        except FileNotFoundError:
+            raise UploadRejected("The file has not reached storage yet.", status=409)
+        if size != self.size:
+            raise UploadRejected("The stored file does not match the declared size.")
+        check_signature(self.content_type, default_storage.read_head(self.direct_path, 16))
+        UploadSession.objects(id=self.id, path=None).update_one(set__path=self.direct_path, set__received=size)
+        self.reload()
+
+    def discard(self):
+        for chunk_path in self.chunks:
+            default_storage.delete(chunk_path)
+        if self.direct_path and not self.is_complete:
+            default_storage.delete(self.direct_path)
+        self.delete()
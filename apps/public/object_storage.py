@@ -0,0 +1,268 @@
+# apps/public/object_storage.py
+
+import logging
+import mimetypes
+import posixpath
+import threading
+import time
+from tempfile import SpooledTemporaryFile
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files.base import File
+from django.core.files.storage import Storage
+from django.utils import timezone
+from django.utils.deconstruct import deconstructible
+
+try:
+    import boto3
+    from botocore.config import Config
+    from botocore.exceptions import ClientError
+except ImportError:  # Optional: only needed when MEDIA_STORAGE = "s3".
+    boto3 = None
+
+
+logger = logging.getLogger(__name__)
+
+# Objects up to this size are uploaded with one PUT; larger ones stream as multipart.
+SINGLE_PUT_MAX_BYTES = 8 * 1024 * 1024
+# Opened objects are buffered in memory up to this size, then spill to a temp file.
+SPOOL_MAX_BYTES = 5 * 1024 * 1024
+# `DeleteObjects` takes at most this many keys per call.
+DELETE_BATCH_SIZE = 1000
+URL_CACHE_MAX_ENTRIES = 4096
+
+MISSING_CODES = ("404", "NoSuchKey", "NotFound")
+
+
+def _is_missing(exc):
+    return exc.response.get("Error", {}).get("Code") in MISSING_CODES
+
+
+class URLCache:
+    """Signed URLs by object name, reused until half of their lifetime has passed.
+
+    Listings render the same images on every request; reusing the URL saves an HMAC
+    per access and keeps it stable, so browsers can cache the file.
+    """
+
+    def __init__(self, max_entries=URL_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = {}
+
+    def get(self, name, now):
+        entry = self._entries.get(name)
+        if entry is not None and entry[1] > now:
+            return entry[0]
+        return None
+
+    def set(self, name, url, refresh_at):
+        with self._lock:
+            if len(self._entries) >= self.max_entries:
+                self._entries.clear()
+            self._entries[name] = (url, refresh_at)
+
+    def discard(self, name):
+        with self._lock:
+            self._entries.pop(name, None)
+
+
+class _ReadOnly:
+    """Hides `seek`/`tell`, so the transfer manager streams a file it cannot rewind."""
+
+    def __init__(self, fileobj):
+        self._fileobj = fileobj
+
+    def read(self, size=-1):
+        return self._fileobj.read(size)
+
+
+@deconstructible
+class S3Storage(Storage):
+    """Media storage in an S3-compatible bucket (AWS S3, Cloudflare R2, MinIO, ...).
+
+    Names map to keys below `S3_LOCATION`. URLs are public (`S3_PUBLIC_URL`, e.g. a CDN
+    in front of a public bucket) or presigned and cached per worker. `presigned_post`
+    lets the browser upload straight to the bucket.
+    """
+
+    def __init__(self, bucket=None, endpoint_url=None, region=None, access_key=None, secret_key=None,
+                 location=None, public_url=None, url_expire=None, addressing_style=None):
+        if boto3 is None:
+            raise ImproperlyConfigured("MEDIA_STORAGE = 's3' requires boto3 (pip install boto3).")
+        self.bucket_name = bucket or settings.S3_BUCKET
+        if not self.bucket_name:
+            raise ImproperlyConfigured("MEDIA_STORAGE = 's3' requires S3_BUCKET.")
+        self.endpoint_url = endpoint_url or settings.S3_ENDPOINT_URL or None
+        self.region = region or settings.S3_REGION or None
+        self.access_key = access_key or settings.S3_ACCESS_KEY_ID or None
+        self.secret_key = secret_key or settings.S3_SECRET_ACCESS_KEY or None
+        self.location = (settings.S3_LOCATION if location is None else location).strip("/")
+        self.public_url = (public_url or settings.S3_PUBLIC_URL or "").rstrip("/")
+        self.url_expire = url_expire or settings.S3_URL_EXPIRE
+        self.addressing_style = addressing_style or settings.S3_ADDRESSING_STYLE
+        self._client = None
+        self._client_lock = threading.Lock()
+        self._urls = URLCache()
+
+    @property
+    def client(self):
+        # Clients are thread-safe; sessions are not, so each storage builds its own once.
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = boto3.session.Session().client(
+                        "s3",
+                        endpoint_url=self.endpoint_url,
+                        region_name=self.region,
+                        aws_access_key_id=self.access_key,
+                        aws_secret_access_key=self.secret_key,
+                        config=Config(signature_version="s3v4", s3={"addressing_style": self.addressing_style}),
+                    )
+        return self._client
+
+    def _key(self, name):
+        name = (name or "").replace("\\", "/").lstrip("/")
+        return posixpath.join(self.location, name) if self.location else name
+
+    def _head(self, name):
+        try:
+            return self.client.head_object(Bucket=self.bucket_name, Key=self._key(name))
+        except ClientError as exc:
+            if _is_missing(exc):
+                raise FileNotFoundError(name) from exc
+            raise
+
+    def _open(self, name, mode="rb"):
+        if "w" in mode or "a" in mode or "+" in mode:
+            raise ValueError("S3Storage files are read-only; use save() to write.")
+        body = SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+        try:
+            self.client.download_fileobj(self.bucket_name, self._key(name), body)
+        except ClientError as exc:
+            body.close()
+            if _is_missing(exc):
+                raise FileNotFoundError(name) from exc
+            raise
+        body.seek(0)
+        return File(body, name)
+
+    def _save(self, name, content):
+        content_type = (
+            getattr(content, "content_type", None)
+            or mimetypes.guess_type(name)[0]
+            or "application/octet-stream"
+        )
+        if hasattr(content, "seek"):
+            try:
+                content.seek(0)
+            except OSError:
+                pass
+        size = getattr(content, "size", None)
+        if size is not None and size <= SINGLE_PUT_MAX_BYTES:
+            self.client.put_object(
+                Bucket=self.bucket_name, Key=self._key(name), Body=content.read(), ContentType=content_type
+            )
+        else:
+            self.client.upload_fileobj(
+                _ReadOnly(content), self.bucket_name, self._key(name), ExtraArgs={"ContentType": content_type}
+            )
+        self._urls.discard(name)
+        return name
+
+    def delete(self, name):
+        self.client.delete_object(Bucket=self.bucket_name, Key=self._key(name))
+        self._urls.discard(name)
+
+    def delete_many(self, names):
+        """Delete `names` with batched `DeleteObjects` calls; returns how many were removed."""
+
+        deleted = 0
+        names = list(names)
+        for start in range(0, len(names), DELETE_BATCH_SIZE):
+            batch = names[start:start + DELETE_BATCH_SIZE]
+            response = self.client.delete_objects(
+                Bucket=self.bucket_name,
+                Delete={"Objects": [{"Key": self._key(name)} for name in batch], "Quiet": True},
+            )
+            errors = response.get("Errors", [])
+            for error in errors:
+                logger.warning("Could not delete stored file %s: %s", error.get("Key"), error.get("Message"))
+            deleted += len(batch) - len(errors)
+            for name in batch:
+                self._urls.discard(name)
+        return deleted
+
+    def exists(self, name):
+        try:
+            self._head(name)
+        except FileNotFoundError:
+            return False
+        return True
+
+    def listdir(self, path):
+        prefix = self._key(path).rstrip("/")
+        prefix = f"{prefix}/" if prefix else ""
+        directories, files = [], []
+        paginator = self.client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix, Delimiter="/"):
+            directories.extend(item["Prefix"][len(prefix):].rstrip("/") for item in page.get("CommonPrefixes", ()))
+            files.extend(item["Key"][len(prefix):] for item in page.get("Contents", ()) if item["Key"] != prefix)
+        return directories, files
+
+    def size(self, name):
+        return self._head(name)["ContentLength"]
+
+    def get_modified_time(self, name):
+        modified = self._head(name)["LastModified"]
+        return modified if settings.USE_TZ else timezone.make_naive(modified)
+
+    def read_head(self, name, length):
+        """The first `length` bytes of an object, fetched with a ranged GET."""
+
+        try:
+            response = self.client.get_object(Bucket=self.bucket_name, Key=self._key(name), Range=f"bytes=0-{length - 1}")
+        except ClientError as exc:
+            if _is_missing(exc):
+                raise FileNotFoundError(name) from exc
+            raise
+        return response["Body"].read()
+
+    def url(self, name):
+        if self.public_url:
+            return f"{self.public_url}/{quote(self._key(name))}"
+        now = time.monotonic()
+        url = self._urls.get(name, now)
+        if url is None:
+            url = self.client.generate_presigned_url(
+                "get_object",
+                Params={"Bucket": self.bucket_name, "Key": self._key(name)},
+                ExpiresIn=self.url_expire,
+            )
+            self._urls.set(name, url, now + self.url_expire / 2)
+        return url
+
+    def url_epoch(self):
+        """Changes every half `url_expire` while URLs are presigned, else None.
+
+        Markup cached under a key that includes it never outlives the URLs it embeds:
+        `url()` hands out URLs at most half their lifetime old.
+        """
+
+        if self.public_url:
+            return None
+        return int(time.time() // (self.url_expire / 2))
+
+    def presigned_post(self, name, content_type, size, expires):
+        """Form `url` and `fields` for the browser to POST exactly `size` bytes of
+        `content_type` to `name`; the bucket rejects anything else."""
+
+        return self.client.generate_presigned_post(
+            self.bucket_name,
+            self._key(name),
+            Fields={"Content-Type": content_type},
+            Conditions=[{"Content-Type": content_type}, ["content-length-range", size, size]],
+            ExpiresIn=expires,
+        )
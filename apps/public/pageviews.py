@@ -0,0 +1,225 @@
+# apps/public/pageviews.py
+
+import atexit
+import logging
+import re
+import threading
+from collections import Counter
+from datetime import datetime, time, timedelta
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils import timezone
+from mongoengine import DateTimeField, Document, IntField, StringField
+from pymongo import UpdateOne
+from pymongo.errors import PyMongoError
+
+
+logger = logging.getLogger(__name__)
+
+# The "trailing week" ranking sums this many daily buckets, today included.
+TRAILING_DAYS = 7
+# Daily buckets are dropped by the TTL index this long after their day.
+DAY_BUCKET_DAYS = 35
+# Candidates fetched per ranking slot, so unpublished or deleted documents can be skipped.
+RANKING_OVERFETCH = 3
+
+# Crawlers, link previews, monitors and scripts; requests without a User-Agent
+# (including the in-process warm-up) are not counted either.
+BOT_USER_AGENT = re.compile(
+    r"bot|crawl|spider|slurp|preview|monitor|lighthouse|headless|curl|wget|python-|go-http|java/",
+    re.IGNORECASE,
+)
+
+
+class PageViewCounter(Document):
+    """View count of one document, all-time (`day` unset) or for one local day.
+
+    `_id` is "<kind>:<object id>" or "<kind>:<object id>:<YYYY-MM-DD>", so every flush
+    is a batch of `$inc` upserts by primary key.
+    """
+
+    id = StringField(primary_key=True)
+    kind = StringField(required=True)
+    object_id = StringField(required=True)
+    day = StringField()
+    views = IntField(default=0)
+    expires_at = DateTimeField()
+
+    meta = {
+        "collection": "page_views",
+        "indexes": [
+            ("kind", "day", "-views"),
+            {"fields": ["expires_at"], "expireAfterSeconds": 0},
+        ],
+    }
+
+
+class ViewBuffer:
+    """Views counted in this process since the last flush, by (kind, object id, day)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = Counter()
+
+    def __len__(self):
+        return len(self._counts)
+
+    def add(self, kind, object_id, day=None):
+        key = (kind, str(object_id), day or timezone.localdate().isoformat())
+        with self._lock:
+            self._counts[key] += 1
+            return len(self._counts)
+
+    def drain(self):
+        with self._lock:
+            counts, self._counts = self._counts, Counter()
+        return counts
+
+
+view_buffer = ViewBuffer()
+
+
+def _expires_at(day):
+    end = datetime.combine(datetime.strptime(day, "%Y-%m-%d").date(), time.min)
+    return end + timedelta(days=DAY_BUCKET_DAYS)
+
+
+def flush(buffer=None):
+    """Write the buffered views with one unordered `bulk_write`; returns the views written.
+
+    Each (kind, object id) gets one all-time and one per-day `$inc` upsert, however many
+    views it had. A failed write is logged and its views dropped: the counts are
+    approximate anyway, and retrying a partly applied batch would double count.
+    """
+
+    counts = (buffer or view_buffer).drain()
+    if not counts:
+        return 0
+    totals = Counter()
+    operations = []
+    for (kind, object_id, day), views in counts.items():
+        totals[(kind, object_id)] += views
+        operations.append(UpdateOne(
+            {"_id": f"{kind}:{object_id}:{day}"},
+            {
+                "$inc": {"views": views},
+                "$setOnInsert": {"kind": kind, "object_id": object_id, "day": day, "expires_at": _expires_at(day)},
+            },
+            upsert=True,
+        ))
+    for (kind, object_id), views in totals.items():
+        operations.append(UpdateOne(
+            {"_id": f"{kind}:{object_id}"},
+            {"$inc": {"views": views}, "$setOnInsert": {"kind": kind, "object_id": object_id}},
+            upsert=True,
+        ))
+    try:
+        PageViewCounter._get_collection().bulk_write(operations, ordered=False)
+    except PyMongoError:
+        logger.exception("Dropped %d buffered page view(s)", sum(counts.values()))
+        return 0
+    return sum(counts.values())
+
+
+def is_countable(request):
+    if request.method != "GET":
+        return False
+    user = getattr(request, "user", None)
+    if user is not None and user.is_authenticated:
+        return False  # Admins checking their own pages.
+    agent = request.META.get("HTTP_USER_AGENT", "")
+    return bool(agent) and not BOT_USER_AGENT.search(agent)
+
+
+def record_view(request, kind, object_id):
+    """Count a view of `object_id` in memory; no database write on the request path
+    unless the buffer has grown past `PAGEVIEW_MAX_PENDING` keys."""
+
+    if not settings.PAGEVIEWS_ENABLED or not is_countable(request):
+        return
+    if view_buffer.add(kind, object_id) >= settings.PAGEVIEW_MAX_PENDING:
+        flush()
+
+
+class Flusher(threading.Thread):
+    """Flushes the buffer every `interval` seconds, and once more when the process exits."""
+
+    def __init__(self, interval):
+        super().__init__(name="pageview-flusher", daemon=True)
+        self.interval = interval
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            try:
+                flush()
+            except Exception:
+                logger.exception("Page view flush failed")
+
+    def stop(self):
+        self._stop_event.set()
+        flush()
+
+
+_flusher = None
+
+
+def start_flusher():
+    global _flusher
+    if _flusher is None:
+        _flusher = Flusher(settings.PAGEVIEW_FLUSH_INTERVAL)
+        _flusher.start()
+        atexit.register(_flusher.stop)
+    return _flusher
+
+
+def most_read(kind, period="all", limit=5):
+    """[(object id, views)] for the most viewed documents of `kind`, most viewed first.
+
+    `period` is "all" (the all-time counters, read straight off the index) or "week"
+    (the last `TRAILING_DAYS` daily buckets summed). Rankings are cached for
+    `PAGEVIEW_RANKING_TIMEOUT` seconds; they trail the buffered counts by a flush anyway.
+    """
+
+    today = timezone.localdate()
+    cache = caches["default"]
+    key = f"pageviews:{kind}:{period}:{limit}:{today.isoformat()}"
+    ranking = cache.get(key)
+    if ranking is not None:
+        return ranking
+
+    collection = PageViewCounter._get_collection()
+    if period == "all":
+        rows = collection.find({"kind": kind, "day": None}, {"object_id": 1, "views": 1})
+        rows = rows.sort([("views", -1), ("_id", 1)]).limit(limit)
+    elif period == "week":
+        start = (today - timedelta(days=TRAILING_DAYS - 1)).isoformat()
+        rows = collection.aggregate([
+            {"$match": {"kind": kind, "day": {"$gte": start}}},
+            {"$group": {"_id": "$object_id", "views": {"$sum": "$views"}}},
+            {"$sort": {"views": -1, "_id": 1}},
+            {"$limit": limit},
+            {"$project": {"object_id": "$_id", "views": 1}},
+        ])
+    else:
+        raise ValueError(f"Unknown ranking period: {period!r}")
+    ranking = [(row["object_id"], row["views"]) for row in rows]
+    cache.set(key, ranking, settings.PAGEVIEW_RANKING_TIMEOUT)
+    return ranking
+
+
+def most_read_documents(document_class, kind, period="all", limit=5, exclude=None, **filters):
+    """The `most_read` documents of `document_class` matching `filters`, each with a
+    `view_count` attribute; `exclude` drops one id (e.g. the page being shown)."""
+
+    ranking = most_read(kind, period, (limit + 1) * RANKING_OVERFETCH)
+    ids = [object_id for object_id, _ in ranking if object_id != str(exclude)]
+    documents = {str(document.id): document for document in document_class.objects(id__in=ids, **filters)}
+    result = []
+    for object_id, views in ranking:
+        document = documents.get(object_id)
+        if document is not None and object_id != str(exclude):
+            document.view_count = views
+            result.append(document)
+    return result[:limit]
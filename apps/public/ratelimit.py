@@ -0,0 +1,272 @@
+# apps/public/ratelimit.py
+
+import math
+import re
+import threading
+import time
+from datetime import datetime, timezone as dt_timezone
+from functools import wraps
+
+from django.conf import settings
+from django.http import HttpResponse, JsonResponse
+from mongoengine import DateTimeField, Document, IntField, StringField
+from pymongo import ReturnDocument
+
+
+RATE_RE = re.compile(r"^\s*(\d+)\s*/\s*(\d*)\s*([smhd])\s*$")
+UNIT_SECONDS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+# The in-process table drops keys whose windows have lapsed once it grows past this.
+MAX_TRACKED_KEYS = 10000
+
+
+def parse_rate(rate):
+    """`"5/10m"` -> (5, 600): at most 5 requests per 10 minutes."""
+
+    match = RATE_RE.match(rate)
+    if not match:
+        raise ValueError(f"Invalid rate {rate!r}; expected e.g. '5/m' or '20/15m'.")
+    count, multiplier, unit = match.groups()
+    return int(count), int(multiplier or 1) * UNIT_SECONDS[unit]
+
+
+def estimate(previous, current, elapsed, window):
+    """Sliding-window count: the previous window's hits, weighted by how much of it
+    still overlaps the last `window` seconds, plus this window's hits."""
+
+    return previous * (1 - elapsed / window) + current
+
+
+def retry_after(previous, current, elapsed, window, limit):
+    """Whole seconds until `estimate()` drops below `limit` again.
+
+    Hits are refused while the estimate is at or above the limit, so this is the first
+    whole second strictly after the estimate reaches it.
+    """
+
+    if current >= limit:
+        # Only once this window has become the previous one and decayed far enough.
+        wait = window - elapsed + window * (current - limit) / current
+    else:
+        wait = window * (previous - limit + current) / previous - elapsed
+    return max(1, math.floor(wait) + 1)
+
+
+class MemoryBackend:
+    """Per-process counters: two integers per key, for the current and previous window.
+
+    Each worker counts on its own, so with N workers a client can get up to N times the
+    limit; use the Mongo backend where that matters.
+    """
+
+    def __init__(self, max_keys=MAX_TRACKED_KEYS):
+        self.max_keys = max_keys
+        self._windows = {}
+        self._lock = threading.Lock()
+
+    def hit(self, key, limit, window, now=None, count=True):
+        now = time.time() if now is None else now
+        index, elapsed = divmod(now, window)
+        with self._lock:
+            start, previous, current, _ = self._windows.get(key, (index, 0, 0, window))
+            if start != index:
+                previous = current if start == index - 1 else 0
+                current = 0
+            if estimate(previous, current, elapsed, window) >= limit:
+                self._windows[key] = (index, previous, current, window)
+                return retry_after(previous, current, elapsed, window, limit)
+            self._windows[key] = (index, previous, current + int(count), window)
+            if len(self._windows) > self.max_keys:
+                self._prune(now)
+        return 0
+
+    def _prune(self, now):
+        # A key whose last hit is two windows old no longer counts towards anything.
+        stale = [
+            key for key, (start, _, _, window) in self._windows.items()
+            if (start + 2) * window <= now
+        ]
+        for key in stale:
+            del self._windows[key]
+
+    def reset(self):
+        with self._lock:
+            self._windows.clear()
+
+
+class RateLimitWindow(Document):
+    """One fixed window's hit count for a rate-limit key, shared by all workers."""
+
+    id = StringField(primary_key=True)
+    count = IntField(default=0)
+    expires_at = DateTimeField(required=True)
+
+    meta = {
+        "collection": "rate_limits",
+        "indexes": [{"fields": ["expires_at"], "expireAfterSeconds": 0}],
+    }
+
+
+class MongoBackend:
+    """Counters in the `rate_limits` collection, so the limit holds across workers.
+
+    Costs one read of the previous window plus one `$inc` upsert of the current one per
+    request. The hit is counted before it is checked, so concurrent workers each see the
+    others' hits; a rejected hit is taken back. Expired windows are removed by the TTL
+    index.
+    """
+
+    def hit(self, key, limit, window, now=None, count=True):
+        now = time.time() if now is None else now
+        index, elapsed = divmod(now, window)
+        index = int(index)
+        current_id, previous_id = f"{key}:{index}", f"{key}:{index - 1}"
+        collection = RateLimitWindow._get_collection()
+        if count:
+            # Kept through the next window, where it still counts as "previous".
+            expires_at = datetime.fromtimestamp((index + 2) * window, tz=dt_timezone.utc)
+            row = collection.find_one_and_update(
+                {"_id": current_id},
+                {"$inc": {"count": 1}, "$setOnInsert": {"expires_at": expires_at}},
+                projection={"count": 1},
+                upsert=True,
+                return_document=ReturnDocument.AFTER,
+            )
+            current = row["count"] - 1
+        else:
+            current = self._count(collection, current_id)
+        previous = self._count(collection, previous_id)
+        if estimate(previous, current, elapsed, window) >= limit:
+            if count:
+                collection.update_one({"_id": current_id}, {"$inc": {"count": -1}})
+            return retry_after(previous, current, elapsed, window, limit)
+        return 0
+
+    @staticmethod
+    def _count(collection, window_id):
+        row = collection.find_one({"_id": window_id}, {"count": 1})
+        return row["count"] if row else 0
+
+    def reset(self):
+        RateLimitWindow.objects.delete()
+
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def get_backend():
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                name = getattr(settings, "RATELIMIT_BACKEND", "memory")
+                _backend = MongoBackend() if name == "mongo" else MemoryBackend()
+    return _backend
+
+
+def client_ip(request):
+    """The client address, taken from `X-Forwarded-For` when behind trusted proxies.
+
+    `RATELIMIT_PROXY_COUNT` is how many proxies sit in front of the app (Render adds
+    one); the client is the address that many hops from the right. Without proxies the
+    header is ignored, since clients can set it to anything.
+    """
+
+    proxies = getattr(settings, "RATELIMIT_PROXY_COUNT", 0)
+    forwarded = request.META.get("HTTP_X_FORWARDED_FOR")
+    if proxies and forwarded:
+        hops = [hop.strip() for hop in forwarded.split(",") if hop.strip()]
+        if hops:
+            return hops[-min(proxies, len(hops))]
+    return request.META.get("REMOTE_ADDR", "")
+
+
+def post_field(name):
+    """Key function for a submitted field, e.g. the login username or contact email."""
+
+    def key(request):
+        return (request.POST.get(name) or "").strip().lower()
+
+    return key
+
+
+def post_field_and_ip(name):
+    """Key function for a submitted field per client, so one client's attempts never
+    lock out another, e.g. a stranger guessing the admin's password."""
+
+    field = post_field(name)
+
+    def key(request):
+        value = field(request)
+        return f"{value}:{client_ip(request)}" if value else ""
+
+    return key
+
+
+def rate_limited_response(request, seconds):
+    message = f"Too many attempts. Please try again in {seconds} second{'s' if seconds != 1 else ''}."
+    if request.headers.get("X-Requested-With") == "XMLHttpRequest":
+        response = JsonResponse({"success": False, "message": message}, status=429)
+    else:
+        response = HttpResponse(message, status=429, content_type="text/plain; charset=utf-8")
+    response["Retry-After"] = str(seconds)
+    return response
+
+
+def rate_limit(scope, rate, key=client_ip, methods=("POST",)):
+    """Allow at most `rate` requests per `key(request)` to the view, else answer 429.
+
+    The check runs before the view, so a rejected request never reaches password
+    hashing or a database write. Requests with an empty key are not counted. Stack the
+    decorator to combine limits, e.g. per IP and per username.
+    """
+
+    limit, window = parse_rate(rate)
+
+    def decorator(view):
+        @wraps(view)
+        def wrapped(request, *args, **kwargs):
+            if getattr(settings, "RATELIMIT_ENABLED", True) and request.method in methods:
+                value = key(request)
+                if value:
+                    wait = get_backend().hit(f"{scope}:{value}", limit, window)
+                    if wait:
+                        return rate_limited_response(request, wait)
+            return view(request, *args, **kwargs)
+
+        return wrapped
+
+    return decorator
+
+
+class FailureLimit:
+    """Allow at most `rate` failed attempts per `key(request)`; successful ones are free.
+
+    Unlike `rate_limit`, nothing is counted until the view calls `fail()`, so only
+    attempts that actually failed (e.g. a wrong password) spend the budget.
+    """
+
+    def __init__(self, scope, rate, key):
+        self.scope = scope
+        self.limit, self.window = parse_rate(rate)
+        self.key = key
+
+    def _bucket(self, request):
+        if not getattr(settings, "RATELIMIT_ENABLED", True):
+            return None
+        value = self.key(request)
+        return f"{self.scope}:{value}" if value else None
+
+    def check(self, request):
+        """Seconds to wait before the next attempt is allowed, or 0."""
+
+        bucket = self._bucket(request)
+        if bucket is None:
+            return 0
+        return get_backend().hit(bucket, self.limit, self.window, count=False)
+
+    def fail(self, request):
+        bucket = self._bucket(request)
+        if bucket is not None:
+            get_backend().hit(bucket, self.limit, self.window)
@@ -0,0 +1,151 @@
+# apps/public/readmodels.py
+
+from django.core.files.storage import default_storage
+
+from .models import Blog, Project, Skill, version_token
+
+
+class StoredMedia:
+    """An uploaded file's path and URL, resolved once; used like `StoredFileProxy`."""
+
+    __slots__ = ("name", "url")
+
+    def __init__(self, path):
+        self.name = path or ""
+        self.url = default_storage.url(path) if path else ""
+
+    def __bool__(self):
+        return bool(self.name)
+
+    def __str__(self):
+        return self.url
+
+
+class CardAuthor:
+    __slots__ = ("username", "display_name")
+
+    def __init__(self, username, display_name):
+        self.username = username
+        self.display_name = display_name
+
+    def get_full_name(self):
+        return self.display_name or self.username
+
+
+class ReadModel:
+    """A read-only row for public listings, built straight from an `as_pymongo()` dict.
+
+    Skips MongoEngine hydration: no field validation, change tracking or descriptors,
+    and media URLs are resolved once per row instead of on every template access.
+    Subclasses name the stored fields they read in `fields`; `id` and `updated_at` are
+    always loaded so fragment cache keys match the documents'.
+    """
+
+    __slots__ = ("id", "updated_at")
+
+    document_class = None
+    fields = ()
+
+    def __init__(self, row):
+        self.id = row["_id"]
+        self.updated_at = row.get("updated_at")
+
+    @classmethod
+    def rows(cls, queryset):
+        """`queryset` narrowed to this model's fields, yielding raw dicts (paginates fine)."""
+
+        return queryset.only("id", "updated_at", *cls.fields).as_pymongo()
+
+    @classmethod
+    def build(cls, rows, **extra):
+        return [cls(row, **extra) for row in rows]
+
+    @classmethod
+    def load(cls, queryset, **extra):
+        return cls.build(cls.rows(queryset), **extra)
+
+    @property
+    def pk(self):
+        return self.id
+
+    @property
+    def id_str(self):
+        return str(self.id)
+
+    def fragment_key_part(self):
+        return f"{self.document_class._get_collection_name()}:{self.id}:{version_token(self.updated_at)}"
+
+
+class ProjectCard(ReadModel):
+    __slots__ = ("title", "slug", "description", "tech_stack", "image", "github_link", "demo_link", "is_featured")
+
+    document_class = Project
+    fields = ("title", "slug", "description", "tech_stack", "image_path", "github_link", "demo_link", "is_featured")
+
+    def __init__(self, row):
+        super().__init__(row)
+        self.title = row.get("title", "")
+        self.slug = row.get("slug")
+        self.description = row.get("description", "")
+        self.tech_stack = row.get("tech_stack") or []
+        self.image = StoredMedia(row.get("image_path"))
+        self.github_link = row.get("github_link")
+        self.demo_link = row.get("demo_link")
+        self.is_featured = row.get("is_featured", False)
+
+    @property
+    def url_key(self):
+        return self.slug or str(self.id)
+
+
+class BlogCard(ReadModel):
+    __slots__ = ("title", "slug", "preview", "tags", "cover_image", "read_time", "published_date", "author")
+
+    document_class = Blog
+    fields = (
+        "title", "slug", "preview", "tags", "cover_image_path", "read_time",
+        "published_date", "author_username", "author_display_name",
+    )
+
+    def __init__(self, row):
+        super().__init__(row)
+        self.title = row.get("title", "")
+        self.slug = row.get("slug")
+        self.preview = row.get("preview", "")
+        self.tags = row.get("tags") or []
+        self.cover_image = StoredMedia(row.get("cover_image_path"))
+        self.read_time = row.get("read_time", 5)
+        self.published_date = row.get("published_date")
+        username = row.get("author_username")
+        self.author = CardAuthor(username, row.get("author_display_name")) if username else None
+
+    @property
+    def url_key(self):
+        return self.slug or str(self.id)
+
+
+class SkillRow(ReadModel):
+    """A skill with its category name looked up from `category_names` (id -> name),
+    so listing skills never dereferences the category per row."""
+
+    __slots__ = ("name", "icon", "proficiency", "category", "category_name", "display_proficiency")
+
+    document_class = Skill
+    fields = ("name", "icon", "proficiency", "category")
+
+    def __init__(self, row, category_names=None):
+        super().__init__(row)
+        self.name = row.get("name", "")
+        self.icon = row.get("icon", "")
+        self.category = row.get("category")
+        self.category_name = (category_names or {}).get(self.category, "Uncategorized")
+        try:
+            proficiency = int(row.get("proficiency") or 0)
+        except (TypeError, ValueError):
+            proficiency = 0
+        self.proficiency = proficiency
+        self.display_proficiency = max(0, min(100, proficiency))
+
+    @property
+    def proficiency_percent(self):
+        return self.display_proficiency
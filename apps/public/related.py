@@ -0,0 +1,308 @@
+# apps/public/related.py
+
+import re
+from collections import Counter, defaultdict
+
+from django.utils.html import strip_tags
+from pymongo import UpdateOne
+
+
+RELATED_TOP_K = 6
+
+KEYWORD_LIMIT = 12
+
+# Terms carried by more than this share of eligible documents (and more than
+# MIN_TERM_CUTOFF documents) carry no signal and are skipped, like a hard IDF cut. This
+# also bounds how many candidates one save has to compare.
+MAX_TERM_SHARE = 0.1
+MIN_TERM_CUTOFF = 50
+
+_WORD_RE = re.compile(r"[a-z][a-z0-9+#]{2,}")
+
+STOPWORDS = frozenset(
+    """
+    about above after again against also among and any are because been before being
+    below between both but can could did does doing down during each few for from
+    further had has have having her here hers him his how into its itself just more
+    most much must not now off once only other our ours out over own same she should
+    some such than that the their theirs them then there these they this those through
+    too under until very was were what when where which while who whom why will with
+    would you your yours use used using via one two new like make made get got
+    """.split()
+)
+
+
+def extract_keywords(html, limit=KEYWORD_LIMIT):
+    """Return the `limit` most frequent non-stopword terms of an HTML body."""
+
+    words = _WORD_RE.findall(strip_tags(html or "").lower())
+    counts = Counter(word for word in words if word not in STOPWORDS)
+    return [word for word, _ in counts.most_common(limit)]
+
+
+def _terms(values):
+    return {str(value).strip().lower() for value in values or () if str(value).strip()}
+
+
+def normalized_terms(features, source):
+    """The normalised terms of each feature field, as stored in `related_terms`.
+
+    `source` is a raw document or any other mapping of the feature fields.
+    """
+
+    return {field: sorted(_terms(source.get(field))) for field in features}
+
+
+def _stored_terms(row, field):
+    return set((row.get("related_terms") or {}).get(field) or ())
+
+
+def similarity(features, left, right, common=frozenset()):
+    """Weighted Jaccard similarity between two raw documents over their stored `related_terms`.
+
+    Shared terms listed in `common` as (field, term) pairs do not count as overlap.
+    """
+
+    score = 0.0
+    for field, weight in features.items():
+        a, b = _stored_terms(left, field), _stored_terms(right, field)
+        overlap = sum(1 for term in a & b if (field, term) not in common)
+        if overlap:
+            score += weight * overlap / (len(a) + len(b) - overlap)
+    return score
+
+
+def _term_cutoff(eligible):
+    return max(MIN_TERM_CUTOFF, int(eligible * MAX_TERM_SHARE))
+
+
+def _top_k(scored):
+    ranked = sorted(
+        ((document_id, round(score, 4)) for document_id, score in scored if score > 0),
+        key=lambda item: (-item[1], str(item[0])),
+    )
+    return ranked[:RELATED_TOP_K]
+
+
+def _related_update(document_id, ranked, **fields):
+    return UpdateOne(
+        {"_id": document_id},
+        {"$set": {
+            "related_ids": [related_id for related_id, _ in ranked],
+            "related_scores": [score for _, score in ranked],
+            **fields,
+        }},
+    )
+
+
+class RelatedContentMixin:
+    """Keeps a precomputed top-k list of similar documents in `related_ids`.
+
+    Subclasses declare `related_features` (field -> weight) and `related_filters`
+    (the raw Mongo filter a document must match to be recommended), plus a
+    `related_terms` dict field holding the normalised feature terms, so candidates are
+    found with plain indexed `$in` lookups. Lists are updated incrementally on
+    save/delete; `rebuild_related` recomputes them (and the stored terms) from scratch.
+    """
+
+    related_features = {}
+    related_filters = {}
+
+    def save(self, *args, **kwargs):
+        watched = set(self.related_features) | set(self.related_filters)
+        changed = set(self._get_changed_fields()) if self.id else watched
+        if changed & set(self.related_features) or not self.related_terms:
+            values = {field: getattr(self, field) for field in self.related_features}
+            self.related_terms = normalized_terms(self.related_features, values)
+        result = super().save(*args, **kwargs)
+        if changed & watched:
+            refresh_related(type(self), self.id)
+        return result
+
+    def delete(self, *args, **kwargs):
+        document_id = self.id
+        result = super().delete(*args, **kwargs)
+        detach_related(type(self), document_id)
+        return result
+
+    def related_documents(self, limit=3, fallback=None):
+        """Fetch the precomputed related documents with one `$in` query, in ranked order.
+
+        `fallback` is a queryset used to top up the list when fewer than `limit`
+        related documents are still eligible.
+        """
+
+        ranked_ids = list(self.related_ids or [])[: RELATED_TOP_K]
+        documents = []
+        if ranked_ids:
+            found = {
+                document.id: document
+                for document in type(self).objects(id__in=ranked_ids, __raw__=self.related_filters)
+            }
+            documents = [found[related_id] for related_id in ranked_ids if related_id in found][:limit]
+        if len(documents) < limit and fallback is not None:
+            exclude = [self.id] + [document.id for document in documents]
+            documents += list(fallback.filter(id__nin=exclude)[: limit - len(documents)])
+        return documents
+
+
+def _projection(document_class):
+    return {"related_terms": 1, "related_ids": 1, "related_scores": 1}
+
+
+def _common_terms(document_class, source):
+    """The (field, term) pairs of `source` that `rebuild_related` would skip as too common.
+
+    Each term costs one count, capped just past the cutoff; none are needed while there
+    are too few eligible documents for any term to reach it.
+    """
+
+    collection = document_class._get_collection()
+    filters = document_class.related_filters
+    eligible = collection.count_documents(filters)
+    cutoff = _term_cutoff(eligible)
+    if eligible <= cutoff:
+        return set()
+    common = set()
+    for field in document_class.related_features:
+        for term in _stored_terms(source, field):
+            query = dict(filters, **{f"related_terms.{field}": term})
+            if collection.count_documents(query, limit=cutoff + 1) > cutoff:
+                common.add((field, term))
+    return common
+
+
+def _candidates(document_class, source, common):
+    clauses = []
+    for field in document_class.related_features:
+        terms = {term for term in _stored_terms(source, field) if (field, term) not in common}
+        if terms:
+            clauses.append({f"related_terms.{field}": {"$in": sorted(terms)}})
+    if not clauses:
+        return []
+    query = dict(document_class.related_filters, _id={"$ne": source["_id"]}, **{"$or": clauses})
+    return list(document_class._get_collection().find(query, _projection(document_class)))
+
+
+def _recompute(document_class, document_id):
+    """(raw source document or None, [(candidate, score)], the update that rewrites its top-k list)."""
+
+    source = document_class._get_collection().find_one(
+        dict(document_class.related_filters, _id=document_id), _projection(document_class)
+    )
+    if source is None:
+        # No longer eligible: it recommends nothing.
+        return None, [], _related_update(document_id, [])
+    common = _common_terms(document_class, source)
+    scored = [
+        (candidate, similarity(document_class.related_features, source, candidate, common))
+        for candidate in _candidates(document_class, source, common)
+    ]
+    ranked = _top_k((candidate["_id"], score) for candidate, score in scored)
+    return source, scored, _related_update(document_id, ranked)
+
+
+def recompute_related(document_class, document_id):
+    """Recompute one document's own top-k list; returns the raw source document or None."""
+
+    source, _, operation = _recompute(document_class, document_id)
+    document_class._get_collection().bulk_write([operation])
+    return source
+
+
+def refresh_related(document_class, document_id):
+    """Update a changed document's list and patch the lists of the documents it affects.
+
+    Lists already scored on a term that has since become too common are not revisited;
+    the next `rebuild_related` brings them back in line.
+    """
+
+    source, scored, own_update = _recompute(document_class, document_id)
+    if source is None:
+        detach_related(document_class, document_id, extra=[own_update])
+        return
+
+    collection = document_class._get_collection()
+    operations = [own_update]
+    seen = set()
+    for candidate, pair_score in scored:
+        seen.add(candidate["_id"])
+        current = list(zip(candidate.get("related_ids") or [], candidate.get("related_scores") or []))
+        entries = [(related_id, score) for related_id, score in current if related_id != document_id]
+        entries.append((document_id, pair_score))
+        ranked = _top_k(entries)
+        if ranked != current:
+            operations.append(_related_update(candidate["_id"], ranked))
+
+    # Documents that listed this one but no longer share any feature with it.
+    stale = collection.find(
+        {"related_ids": document_id, "_id": {"$nin": list(seen | {document_id})}}, {"_id": 1}
+    )
+    operations += [_recompute(document_class, row["_id"])[2] for row in stale]
+    collection.bulk_write(operations, ordered=False)
+
+
+def detach_related(document_class, document_id, extra=()):
+    """Drop a deleted or no longer eligible document from every list that references it.
+
+    The affected lists (plus any `extra` updates) are written with one `bulk_write`.
+    """
+
+    collection = document_class._get_collection()
+    referencing = [row["_id"] for row in collection.find({"related_ids": document_id}, {"_id": 1})]
+    operations = list(extra) + [_recompute(document_class, related_id)[2] for related_id in referencing]
+    if operations:
+        collection.bulk_write(operations, ordered=False)
+
+
+def rebuild_related(document_class):
+    """Recompute every eligible document's list with an in-memory inverted index; returns the count.
+
+    Every document's `related_terms` are rewritten from its feature fields on the way,
+    which also backfills documents saved before the terms were stored.
+    """
+
+    features = document_class.related_features
+    collection = document_class._get_collection()
+    eligible = {row["_id"] for row in collection.find(document_class.related_filters, {"_id": 1})}
+    stored = {}
+    terms = {}
+    for row in collection.find({}, {field: 1 for field in features}):
+        stored[row["_id"]] = normalized_terms(features, row)
+        if row["_id"] in eligible:
+            terms[row["_id"]] = {field: set(values) for field, values in stored[row["_id"]].items()}
+
+    postings = defaultdict(list)
+    for document_id, fields in terms.items():
+        for field, values in fields.items():
+            for term in values:
+                postings[(field, term)].append(document_id)
+    cutoff = _term_cutoff(len(terms))
+
+    operations = [
+        # No longer eligible: it recommends nothing.
+        _related_update(document_id, [], related_terms=values)
+        for document_id, values in stored.items()
+        if document_id not in terms
+    ]
+    for document_id, fields in terms.items():
+        # Intersection sizes per candidate and field, accumulated from the postings.
+        shared = defaultdict(Counter)
+        for field, values in fields.items():
+            for term in values:
+                posting = postings[(field, term)]
+                if len(posting) <= cutoff:
+                    shared[field].update(posting)
+        scores = Counter()
+        for field, counts in shared.items():
+            size = len(fields[field])
+            for other, overlap in counts.items():
+                if other != document_id:
+                    scores[other] += features[field] * overlap / (size + len(terms[other][field]) - overlap)
+        operations.append(_related_update(document_id, _top_k(scores.items()), related_terms=stored[document_id]))
+        if len(operations) >= 1000:
+            collection.bulk_write(operations, ordered=False)
+            operations = []
+    if operations:
+        collection.bulk_write(operations, ordered=False)
+    return len(terms)
@@ -0,0 +1,165 @@
+# apps/public/retention.py
+
+import zlib
+from collections import OrderedDict
+from datetime import timedelta
+
+from bson import json_util
+from django.conf import settings
+from django.utils import timezone
+
+from .counters import counted_delete
+from .models import ContactArchive, ContactSubmission
+
+try:
+    import zstandard
+except ImportError:  # Optional: without it blocks are written with zlib.
+    zstandard = None
+
+
+# Submissions per sweep batch, and the most one archive block holds.
+ARCHIVE_BATCH_SIZE = 500
+# Flush a block early once its uncompressed NDJSON reaches this, well below Mongo's 16 MB.
+MAX_BLOCK_BYTES = 4 * 1024 * 1024
+
+ZSTD_LEVEL = 10
+ZLIB_LEVEL = 9
+
+SEARCH_FIELDS = ("name", "email", "subject", "message")
+
+
+def compress_block(data):
+    if zstandard is not None:
+        return "zstd", zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+    return "zlib", zlib.compress(data, ZLIB_LEVEL)
+
+
+def decompress_block(codec, data):
+    if codec == "zstd":
+        if zstandard is None:
+            raise RuntimeError("This archive block is zstd-compressed; install `zstandard` to read it.")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return zlib.decompress(data)
+
+
+def retention_cutoff(days=None, now=None):
+    days = settings.CONTACT_ARCHIVE_AFTER_DAYS if days is None else days
+    return (now or timezone.now()) - timedelta(days=days)
+
+
+def _blocks(rows):
+    """Group raw submissions into (month, rows) blocks bounded by `MAX_BLOCK_BYTES`."""
+
+    months = OrderedDict()
+    for row in rows:
+        months.setdefault(row["submitted_at"].strftime("%Y-%m"), []).append(row)
+    for month, month_rows in months.items():
+        block, size = [], 0
+        for row in month_rows:
+            line = json_util.dumps(row).encode()
+            if block and size + len(line) > MAX_BLOCK_BYTES:
+                yield month, block
+                block, size = [], 0
+            block.append((row, line))
+            size += len(line) + 1
+        if block:
+            yield month, block
+
+
+def _write_block(month, block):
+    rows = [row for row, _ in block]
+    codec, data = compress_block(b"\n".join(line for _, line in block))
+    ContactArchive(
+        month=month,
+        codec=codec,
+        count=len(rows),
+        first_submitted_at=rows[0]["submitted_at"],
+        last_submitted_at=rows[-1]["submitted_at"],
+        submission_ids=[row["_id"] for row in rows],
+        data=data,
+    ).save()
+
+
+def archive_submissions(days=None, now=None, dry_run=False):
+    """Move read submissions older than `days` into compressed `ContactArchive` blocks.
+
+    Works in batches of `ARCHIVE_BATCH_SIZE`: each batch is written to the archive
+    first and only then deleted from the hot collection (keeping the site counters
+    exact), so an interrupted sweep loses nothing; rows already archived by an earlier,
+    interrupted run are just deleted. Returns the number archived per month.
+    """
+
+    stale = ContactSubmission.objects(is_read=True, submitted_at__lt=retention_cutoff(days, now))
+    if dry_run:
+        return OrderedDict(
+            (row["_id"], row["count"])
+            for row in stale.aggregate([
+                {"$group": {"_id": {"$dateToString": {"format": "%Y-%m", "date": "$submitted_at"}}, "count": {"$sum": 1}}},
+                {"$sort": {"_id": 1}},
+            ])
+        )
+
+    archived = OrderedDict()
+    while True:
+        rows = list(stale.order_by("submitted_at").limit(ARCHIVE_BATCH_SIZE).as_pymongo())
+        if not rows:
+            break
+        ids = [row["_id"] for row in rows]
+        done = set(ContactArchive.objects(submission_ids__in=ids).distinct("submission_ids"))
+        for month, block in _blocks(row for row in rows if row["_id"] not in done):
+            _write_block(month, block)
+            archived[month] = archived.get(month, 0) + len(block)
+        counted_delete(ContactSubmission.objects(id__in=ids))
+    return archived
+
+
+def archived_count():
+    """Total archived submissions, summed over the (small) archive block collection."""
+
+    result = list(ContactArchive.objects.aggregate([{"$group": {"_id": None, "count": {"$sum": "$count"}}}]))
+    return result[0]["count"] if result else 0
+
+
+def archive_months():
+    return sorted(ContactArchive.objects.distinct("month"), reverse=True)
+
+
+def iter_archived_rows(month=None):
+    """Yield the raw archived submissions, block by block, optionally for one month."""
+
+    blocks = ContactArchive.objects(month=month) if month else ContactArchive.objects
+    for block in blocks.only("codec", "data"):
+        for line in decompress_block(block.codec, block.data).splitlines():
+            yield json_util.loads(line)
+
+
+class ArchivedSubmission:
+    """A read-only submission restored from an archive block, shaped like the document."""
+
+    is_read = True
+    is_archived = True
+
+    def __init__(self, row):
+        self.id = row["_id"]
+        self.name = row.get("name", "")
+        self.email = row.get("email", "")
+        self.subject = row.get("subject", "")
+        self.message = row.get("message", "")
+        self.notes = row.get("notes", "")
+        self.submitted_at = row.get("submitted_at")
+
+
+def search_archive(query="", month=None):
+    """Archived submissions matching `query` (case-insensitive, like the live search), newest first.
+
+    Decompresses the blocks on demand; pass `month` ("YYYY-MM") to read only that month.
+    """
+
+    needle = query.strip().lower()
+    results = []
+    for row in iter_archived_rows(month):
+        if needle and not any(needle in (row.get(field) or "").lower() for field in SEARCH_FIELDS):
+            continue
+        results.append(ArchivedSubmission(row))
+    results.sort(key=lambda submission: submission.submitted_at, reverse=True)
+    return results
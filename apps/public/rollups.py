@@ -0,0 +1,182 @@
+# apps/public/rollups.py
+
+import hashlib
+from collections import defaultdict
+from datetime import timedelta, timezone as dt_timezone
+
+from django.utils import timezone
+from mongoengine import Document, IntField, ListField, StringField
+from pymongo import ReplaceOne, UpdateOne
+
+
+class ContactDailyRollup(Document):
+    """Contact form activity for one local day, maintained with `$inc` upserts.
+
+    `submissions` counts what was received that day and never goes down; `read` and
+    `unread` track those submissions' current state (deleted ones drop out, archived
+    ones stay read). `email_hashes` holds a short hash per distinct sender so
+    `distinct_emails` can be kept without storing addresses twice.
+    """
+
+    day = StringField(primary_key=True)  # "YYYY-MM-DD" in TIME_ZONE
+    submissions = IntField(default=0)
+    read = IntField(default=0)
+    unread = IntField(default=0)
+    distinct_emails = IntField(default=0)
+    email_hashes = ListField(StringField())
+
+    meta = {"collection": "contact_daily_rollups"}
+
+
+def day_key(value):
+    """Local calendar day of a datetime; naive values are UTC, as MongoDB returns them."""
+
+    if timezone.is_naive(value):
+        value = value.replace(tzinfo=dt_timezone.utc)
+    return timezone.localtime(value).date().isoformat()
+
+
+def email_hash(email):
+    return hashlib.sha1((email or "").strip().lower().encode()).hexdigest()[:12]
+
+
+def _collection():
+    return ContactDailyRollup._get_collection()
+
+
+def apply_deltas(deltas):
+    """Apply `{day: {counter: delta}}` with one `bulk_write` of `$inc` upserts."""
+
+    operations = [
+        UpdateOne({"_id": day}, {"$inc": counters}, upsert=True)
+        for day, counters in deltas.items()
+        if any(counters.values())
+    ]
+    if operations:
+        _collection().bulk_write(operations, ordered=False)
+
+
+def record_submission(submitted_at, email, is_read=False):
+    day = day_key(submitted_at)
+    apply_deltas({day: {"submissions": 1, "read" if is_read else "unread": 1}})
+    # Counted only when the hash was not there yet; the filter makes it race-free.
+    _collection().update_one(
+        {"_id": day, "email_hashes": {"$ne": email_hash(email)}},
+        {"$push": {"email_hashes": email_hash(email)}, "$inc": {"distinct_emails": 1}},
+    )
+
+
+def record_read_change(submitted_at, is_read):
+    step = 1 if is_read else -1
+    apply_deltas({day_key(submitted_at): {"read": step, "unread": -step}})
+
+
+def record_delete(submitted_at, was_read):
+    apply_deltas({day_key(submitted_at): {"read" if was_read else "unread": -1}})
+
+
+def _rows(raw_filter):
+    from .models import ContactSubmission
+
+    return ContactSubmission._get_collection().find(raw_filter, {"submitted_at": 1, "is_read": 1})
+
+
+def update_deltas(raw_filter, values):
+    """Rollup deltas of `$set: values` over the submissions matching `raw_filter`.
+
+    Computed before the write, like the site counter deltas; only `is_read` matters.
+    """
+
+    if "is_read" not in values:
+        return {}
+    is_read = bool(values["is_read"])
+    step = 1 if is_read else -1
+    deltas = defaultdict(lambda: {"read": 0, "unread": 0})
+    for row in _rows({"$and": [raw_filter, {"is_read": {"$ne": is_read}}]}):
+        counters = deltas[day_key(row["submitted_at"])]
+        counters["read"] += step
+        counters["unread"] -= step
+    return dict(deltas)
+
+
+def delete_deltas(raw_filter):
+    deltas = defaultdict(lambda: {"read": 0, "unread": 0})
+    for row in _rows(raw_filter):
+        deltas[day_key(row["submitted_at"])]["read" if row.get("is_read") else "unread"] -= 1
+    return dict(deltas)
+
+
+def daily_activity(days=365, today=None):
+    """One row per day for the last `days` days (oldest first), zeros where nothing happened.
+
+    Reads at most `days` small documents, whatever the size of the submissions collection.
+    """
+
+    today = today or timezone.localdate()
+    start = today - timedelta(days=days - 1)
+    stored = {
+        row["_id"]: row
+        for row in _collection().find(
+            {"_id": {"$gte": start.isoformat(), "$lte": today.isoformat()}},
+            {"email_hashes": 0},
+        )
+    }
+    activity = []
+    for offset in range(days):
+        day = start + timedelta(days=offset)
+        row = stored.get(day.isoformat(), {})
+        activity.append({
+            "day": day,
+            "submissions": row.get("submissions", 0),
+            "read": row.get("read", 0),
+            "unread": row.get("unread", 0),
+            "distinct_emails": row.get("distinct_emails", 0),
+        })
+    return activity
+
+
+def rebuild():
+    """Recompute every day from the submissions and the archive; returns the number of days.
+
+    For repairing drift (or back-filling existing data); normal operation only `$inc`s.
+    Deleted submissions cannot be recounted, so their days lose them from `submissions`.
+    Each day is replaced in place and only then are days without submissions removed,
+    so readers never see the rollups empty and concurrent `$inc` upserts cannot collide
+    with the rebuild's writes.
+    """
+
+    from .models import ContactSubmission
+    from .retention import iter_archived_rows
+
+    days = defaultdict(lambda: {"submissions": 0, "read": 0, "unread": 0, "emails": set()})
+
+    def add(row):
+        day = days[day_key(row["submitted_at"])]
+        day["submissions"] += 1
+        day["read" if row.get("is_read") else "unread"] += 1
+        day["emails"].add(email_hash(row.get("email")))
+
+    for row in ContactSubmission._get_collection().find({}, {"submitted_at": 1, "is_read": 1, "email": 1}):
+        add(row)
+    for row in iter_archived_rows():
+        add(row)
+
+    collection = _collection()
+    operations = [
+        ReplaceOne(
+            {"_id": day},
+            {
+                "submissions": counters["submissions"],
+                "read": counters["read"],
+                "unread": counters["unread"],
+                "distinct_emails": len(counters["emails"]),
+                "email_hashes": sorted(counters["emails"]),
+            },
+            upsert=True,
+        )
+        for day, counters in sorted(days.items())
+    ]
+    if operations:
+        collection.bulk_write(operations, ordered=False)
+    collection.delete_many({"_id": {"$nin": list(days)}})
+    return len(days)
@@ -0,0 +1,145 @@
+# apps/public/slugs.py
+
+import re
+import threading
+from collections import OrderedDict
+
+from django.utils.text import slugify
+from mongoengine.errors import NotUniqueError
+
+
+SLUG_ALLOCATION_ATTEMPTS = 5
+
+SLUG_CACHE_SIZE = 10000
+
+
+def allocate_slug(document_class, value, exclude_id=None, fallback="item", max_length=None, reserved=()):
+    """Return the first free `<base>` / `<base>-N` slug using a single anchored query.
+
+    All taken candidates are fetched in one round trip with a `^base(-N)?$` regex. The
+    anchored prefix lets MongoDB walk the unique `slug` index instead of scanning, and
+    only the `slug` key is projected. Slugs in `reserved` (sibling URL segments such as
+    `feed`) count as taken. Races between concurrent writers are settled by the unique
+    index; see `SluggedDocumentMixin.save`.
+    """
+
+    base = slugify(value or "") or fallback
+    if max_length:
+        # Leave room for a numeric suffix.
+        base = base[: max(1, max_length - 8)].rstrip("-") or fallback
+
+    pattern = f"^{re.escape(base)}(-[0-9]+)?$"
+    query = {"slug": {"$regex": pattern}}
+    if exclude_id is not None:
+        query["_id"] = {"$ne": exclude_id}
+    taken = {
+        row["slug"]
+        for row in document_class._get_collection().find(query, {"slug": 1, "_id": 0})
+    }
+    taken.update(slug for slug in reserved if re.match(pattern, slug))
+    if base not in taken:
+        return base
+
+    prefix_length = len(base) + 1
+    suffixes = {int(slug[prefix_length:]) for slug in taken if slug != base}
+    counter = 1
+    while counter in suffixes:
+        counter += 1
+    return f"{base}-{counter}"
+
+
+class SlugIdCache:
+    """Bounded in-process `(collection, slug) -> ObjectId` map used to route by slug."""
+
+    def __init__(self, max_size=SLUG_CACHE_SIZE):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, collection, slug):
+        with self._lock:
+            key = (collection, slug)
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def set(self, collection, slug, document_id):
+        with self._lock:
+            self._entries[(collection, slug)] = document_id
+            self._entries.move_to_end((collection, slug))
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def discard(self, collection, slug):
+        with self._lock:
+            self._entries.pop((collection, slug), None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+slug_ids = SlugIdCache()
+
+
+def find_by_slug(document_class, slug, **filters):
+    """Fetch a document by slug, going through the cached `_id` when the slug was seen before."""
+
+    collection = document_class._get_collection_name()
+    document_id = slug_ids.get(collection, slug)
+    if document_id is not None:
+        document = document_class.objects(id=document_id, slug=slug, **filters).first()
+        if document is not None:
+            return document
+        # Renamed, deleted or filtered out since it was cached: fall back to the index.
+        slug_ids.discard(collection, slug)
+
+    document = document_class.objects(slug=slug, **filters).first()
+    if document is not None:
+        slug_ids.set(collection, slug, document.id)
+    return document
+
+
+class SluggedDocumentMixin:
+    """Assigns a unique slug from `slug_source_field` on first save.
+
+    The slug is kept on later saves so public URLs stay stable when titles change.
+    `reserved_slugs` are never assigned, so routes next to the detail URL stay reachable.
+    """
+
+    slug_source_field = "title"
+    slug_fallback = "item"
+    reserved_slugs = ()
+
+    @property
+    def url_key(self):
+        return self.slug or str(self.id)
+
+    def save(self, *args, **kwargs):
+        if self.slug:
+            return super().save(*args, **kwargs)
+
+        max_length = self._fields["slug"].max_length
+        for attempt in range(SLUG_ALLOCATION_ATTEMPTS):
+            self.slug = allocate_slug(
+                type(self),
+                getattr(self, self.slug_source_field),
+                exclude_id=self.id,
+                fallback=self.slug_fallback,
+                max_length=max_length,
+                reserved=self.reserved_slugs,
+            )
+            try:
+                return super().save(*args, **kwargs)
+            except NotUniqueError:
+                # Retry only when another writer claimed the slug between allocation and insert.
+                slug_taken = type(self).objects(slug=self.slug, id__ne=self.id).only("id").first() is not None
+                if not slug_taken or attempt == SLUG_ALLOCATION_ATTEMPTS - 1:
+                    self.slug = None
+                    raise
+
+    def delete(self, *args, **kwargs):
+        if self.slug:
+            slug_ids.discard(self._get_collection_name(), self.slug)
+        return super().delete(*args, **kwargs)
@@ -0,0 +1,217 @@
+# apps/public/synthetic.py
+
+import math
+import random
+from datetime import timedelta
+from itertools import accumulate, islice
+
+from bson import ObjectId
+from django.utils import timezone
+from django.utils.text import slugify
+
+from .related import extract_keywords
+
+
+WORDS = (
+    "data", "model", "python", "django", "mongo", "pipeline", "vector", "cloud",
+    "latency", "cache", "index", "query", "design", "system", "learning", "graph",
+    "stream", "search", "deploy", "signal", "insight", "metric", "scale", "api",
+    "network", "feature", "training", "dataset", "cluster", "service", "schema",
+    "analysis", "experiment", "research", "visual", "storage", "runtime", "batch",
+    "pattern", "testing", "review", "release", "sensor", "forecast", "language",
+)
+
+SKILL_ICONS = ("bi bi-code-slash", "bi bi-graph-up", "bi bi-database", "bi bi-cloud", "")
+
+
+def _tag_name(index):
+    word = WORDS[index % len(WORDS)]
+    return word if index < len(WORDS) else f"{word}-{index // len(WORDS)}"
+
+
+class SyntheticContent:
+    """Deterministic generator of raw MongoDB documents for every content collection.
+
+    Each generator yields plain dicts keyed by database field names so they can be
+    passed straight to `insert_many`. Size distributions are tunable:
+
+    * `content_words` / `content_sigma`: median word count and log-normal spread of
+      blog content and project descriptions.
+    * `tag_vocabulary` / `tags_per_doc`: number of distinct tags and the (min, max)
+      tags drawn per blog or project, Zipf-weighted so a few tags dominate.
+    * `image_ratio`: probability that a blog or project references a cover image.
+    """
+
+    def __init__(
+        self,
+        seed=0,
+        content_words=600,
+        content_sigma=0.5,
+        tag_vocabulary=150,
+        tags_per_doc=(1, 6),
+        image_ratio=0.6,
+        published_ratio=0.8,
+        read_ratio=0.7,
+        days=365,
+    ):
+        self.rng = random.Random(seed)
+        self.content_words = max(1, content_words)
+        self.content_sigma = max(0.0, content_sigma)
+        self.tags_per_doc = (max(0, tags_per_doc[0]), max(tags_per_doc))
+        self.image_ratio = image_ratio
+        self.published_ratio = published_ratio
+        self.read_ratio = read_ratio
+        self.days = max(1, days)
+        self.now = timezone.now()
+
+        self.tags = [_tag_name(index) for index in range(max(1, tag_vocabulary))]
+        # Zipf weights: the first tags are drawn far more often than the tail.
+        self._tag_weights = list(accumulate(1 / (rank + 1) for rank in range(len(self.tags))))
+
+    def words(self, count):
+        return " ".join(self.rng.choices(WORDS, k=count))
+
+    def word_count(self):
+        if not self.content_sigma:
+            return self.content_words
+        return max(1, int(self.rng.lognormvariate(math.log(self.content_words), self.content_sigma)))
+
+    def pick_tags(self):
+        count = self.rng.randint(*self.tags_per_doc)
+        if not count:
+            return []
+        return list(dict.fromkeys(self.rng.choices(self.tags, cum_weights=self._tag_weights, k=count)))
+
+    def timestamp(self):
+        return self.now - timedelta(seconds=self.rng.randrange(self.days * 86400))
+
+    def skill_categories(self, count):
+        for index in range(count):
+            name = f"{WORDS[index % len(WORDS)].title()} {index}"
+            yield {
+                "_id": ObjectId(),
+                "name": name,
+                "slug": name.lower().replace(" ", "-"),
+                "description": self.words(8),
+                "is_active": self.rng.random() > 0.1,
+                "order": index,
+            }
+
+    def skills(self, count, category_ids):
+        for index in range(count):
+            created = self.timestamp()
+            document = {
+                "name": f"{self.rng.choice(WORDS).title()} {index}",
+                "is_active": self.rng.random() > 0.1,
+                "proficiency": self.rng.randint(10, 100),
+                "icon": self.rng.choice(SKILL_ICONS),
+                "created_at": created,
+                "updated_at": created,
+            }
+            if category_ids:
+                document["category"] = self.rng.choice(category_ids)
+            yield document
+
+    def projects(self, count):
+        for index in range(count):
+            created = self.timestamp()
+            title = f"Project {index}: {self.words(3).title()}"
+            document = {
+                "title": title,
+                "slug": slugify(title),
+                "description": self.words(self.word_count()),
+                "tech_stack": self.pick_tags(),
+                "github_link": f"https://github.com/example/project-{index}",
+                "demo_link": f"https://example.com/demo/{index}" if self.rng.random() < 0.5 else "",
+                "is_featured": self.rng.random() < 0.1,
+                "is_active": self.rng.random() > 0.1,
+                "created_at": created,
+                "updated_at": created,
+            }
+            if self.rng.random() < self.image_ratio:
+                document["image_path"] = f"projects/synthetic-{index}.jpg"
+            yield document
+
+    def blogs(self, count):
+        for index in range(count):
+            created = self.timestamp()
+            words = self.word_count()
+            published = self.rng.random() < self.published_ratio
+            title = f"Blog {index}: {self.words(4).title()}"
+            content = "".join(f"<p>{self.words(60)}</p>" for _ in range(max(1, words // 60)))
+            document = {
+                "title": title,
+                "slug": slugify(title),
+                "content": content,
+                "keywords": extract_keywords(content),
+                "preview": self.words(30)[:300],
+                "tags": self.pick_tags(),
+                "status": "published" if published else "draft",
+                "is_active": self.rng.random() > 0.05,
+                "read_time": max(1, words // 200),
+                "author_username": "synthetic",
+                "author_display_name": "Synthetic Author",
+                "created_at": created,
+                "updated_at": created,
+            }
+            if published:
+                document["published_date"] = created
+            if self.rng.random() < self.image_ratio:
+                document["cover_image_path"] = f"blogs/synthetic-{index}.jpg"
+            yield document
+
+    def research_categories(self, count):
+        for index in range(count):
+            created = self.timestamp()
+            yield {
+                "_id": ObjectId(),
+                "name": f"{self.rng.choice(WORDS).title()} Research {index}",
+                "description": self.words(10),
+                "order": index,
+                "is_active": True,
+                "created_at": created,
+                "updated_at": created,
+            }
+
+    def research_entries(self, count, category_ids):
+        for index in range(count):
+            created = self.timestamp()
+            document = {
+                "title": f"Paper {index}: {self.words(5).title()}",
+                "description": self.words(max(10, self.word_count() // 4)),
+                "publication": f"Journal of {self.rng.choice(WORDS).title()}",
+                "link": "",
+                "is_active": self.rng.random() > 0.1,
+                "created_at": created,
+                "updated_at": created,
+            }
+            if category_ids:
+                document["category"] = self.rng.choice(category_ids)
+            yield document
+
+    def contact_submissions(self, count):
+        rng = self.rng
+        for index in range(count):
+            yield {
+                "name": f"Visitor {index}",
+                "email": f"visitor{rng.randrange(max(1, count // 3))}@example.com",
+                "subject": self.words(5),
+                "message": self.words(rng.randint(10, 120)),
+                "submitted_at": self.timestamp(),
+                "is_read": rng.random() < self.read_ratio,
+                "notes": "",
+            }
+
+
+def insert_chunked(document_class, documents, chunk_size=5000):
+    """Insert an iterable of raw dicts with `insert_many` in fixed-size chunks; return the count."""
+
+    collection = document_class._get_collection()
+    iterator = iter(documents)
+    inserted = 0
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return inserted
+        collection.insert_many(chunk, ordered=False)
+        inserted += len(chunk)
@@ -0,0 +1,121 @@
+# apps/public/template_loading.py
+
+import logging
+import threading
+import time
+from pathlib import Path
+
+from django.template import TemplateSyntaxError, engines
+from django.template.loaders import cached
+
+
+logger = logging.getLogger(__name__)
+
+WARM_SUFFIXES = (".html", ".txt", ".xml")
+
+
+class TemplateStats:
+    def __init__(self):
+        self.compiles = 0
+        self.compile_seconds = 0.0
+        self.renders = 0
+        self.render_seconds = 0.0
+        self.render_max = 0.0
+
+    def as_dict(self):
+        return {
+            "compiles": self.compiles,
+            "compile_ms": round(self.compile_seconds * 1000, 3),
+            "renders": self.renders,
+            "render_ms_total": round(self.render_seconds * 1000, 3),
+            "render_ms_avg": round(self.render_seconds * 1000 / self.renders, 3) if self.renders else 0.0,
+            "render_ms_max": round(self.render_max * 1000, 3),
+        }
+
+
+_stats = {}
+_stats_lock = threading.Lock()
+
+
+def _record(template_name, compile_seconds=None, render_seconds=None):
+    with _stats_lock:
+        stats = _stats.setdefault(template_name, TemplateStats())
+        if compile_seconds is not None:
+            stats.compiles += 1
+            stats.compile_seconds += compile_seconds
+        if render_seconds is not None:
+            stats.renders += 1
+            stats.render_seconds += render_seconds
+            stats.render_max = max(stats.render_max, render_seconds)
+
+
+def template_metrics():
+    """Per-template compile and render timings for this worker, slowest renders first.
+
+    Render times are inclusive: a template's time covers the templates it includes
+    and, for a child template, the parent it extends.
+    """
+
+    with _stats_lock:
+        rows = [dict(stats.as_dict(), template=name) for name, stats in _stats.items()]
+    return sorted(rows, key=lambda row: row["render_ms_total"], reverse=True)
+
+
+def reset_template_metrics():
+    with _stats_lock:
+        _stats.clear()
+
+
+def _instrument(template):
+    name = template.origin.template_name
+    render = template.render
+
+    def timed_render(context):
+        start = time.perf_counter()
+        try:
+            return render(context)
+        finally:
+            _record(name, render_seconds=time.perf_counter() - start)
+
+    template.render = timed_render
+    return template
+
+
+class Loader(cached.Loader):
+    """Django's cached loader, timing each compile (cache miss) and every render."""
+
+    def get_template(self, template_name, skip=None):
+        if self.cache_key(template_name, skip) in self.get_template_cache:
+            return super().get_template(template_name, skip)
+        start = time.perf_counter()
+        template = super().get_template(template_name, skip)
+        _record(template.origin.template_name, compile_seconds=time.perf_counter() - start)
+        return _instrument(template)
+
+
+def warm_templates(backend="django"):
+    """Compile every template under the project template dirs into the cached loader.
+
+    Meant to run at worker start, before traffic. Returns (compiled, failed, seconds);
+    templates that fail to compile are logged, not raised, so one bad file cannot keep
+    a worker from booting.
+    """
+
+    engine = engines[backend].engine
+    start = time.perf_counter()
+    compiled = failed = 0
+    for directory in engine.dirs:
+        root = Path(directory)
+        for path in sorted(root.rglob("*")):
+            if path.suffix not in WARM_SUFFIXES or not path.is_file():
+                continue
+            name = path.relative_to(root).as_posix()
+            try:
+                engine.get_template(name)
+                compiled += 1
+            except TemplateSyntaxError:
+                failed += 1
+                logger.exception("Template %s failed to compile during warm-up", name)
+    seconds = time.perf_counter() - start
+    logger.info("Warmed %d template(s) in %.1f ms (%d failed)", compiled, seconds * 1000, failed)
+    return compiled, failed, seconds
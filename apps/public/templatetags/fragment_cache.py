@@ -0,0 +1,44 @@
+# apps/public/templatetags/fragment_cache.py
+
+from django import template
+from django.utils.safestring import mark_safe
+
+from apps.public.fragments import cached_fragment
+
+
+register = template.Library()
+
+
+class FragmentCacheNode(template.Node):
+    def __init__(self, nodelist, name, vary_on):
+        self.nodelist = nodelist
+        self.name = name
+        self.vary_on = vary_on
+
+    def render(self, context):
+        vary_on = [value.resolve(context) for value in self.vary_on]
+        return mark_safe(cached_fragment(self.name, vary_on, lambda: self.nodelist.render(context)))
+
+
+@register.tag("fragmentcache")
+def do_fragmentcache(parser, token):
+    """Cache a block keyed on the documents (or lists of documents) it renders.
+
+    Usage::
+
+        {% fragmentcache "project-card" project %} ... {% endfragmentcache %}
+
+    Each document contributes its collection, id and `updated_at`, so editing one
+    project re-renders only its card and any fragment listing it. Extra arguments
+    (strings, numbers) are added to the key as-is.
+    """
+
+    bits = token.split_contents()
+    if len(bits) < 3:
+        raise template.TemplateSyntaxError(f"'{bits[0]}' takes a fragment name and at least one value.")
+    name = bits[1]
+    if not (name[0] == name[-1] and name[0] in "'\""):
+        raise template.TemplateSyntaxError(f"'{bits[0]}' fragment name must be a quoted string.")
+    nodelist = parser.parse(("endfragmentcache",))
+    parser.delete_first_token()
+    return FragmentCacheNode(nodelist, name[1:-1], [parser.compile_filter(bit) for bit in bits[2:]])
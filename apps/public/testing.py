@@ -0,0 +1,59 @@
+# apps/public/testing.py
+
+import unittest
+
+import mongoengine
+from django.conf import settings
+from django.core.cache import caches
+from django.test import SimpleTestCase
+from mongoengine.connection import get_connection
+
+from .invalidation import local_cache
+from .slugs import slug_ids
+
+try:
+    import mongomock
+except ImportError:  # Optional: only needed to run the MongoDB-backed tests.
+    mongomock = None
+
+
+TEST_DATABASE_NAME = "portfolio_test"
+
+
+@unittest.skipIf(mongomock is None, "MongoDB-backed tests require mongomock (pip install mongomock).")
+class MongoTestCase(SimpleTestCase):
+    """Runs against an in-memory mongomock database, emptied before every test.
+
+    The default MongoEngine alias is swapped for each test and restored afterwards, and
+    the in-process caches are cleared so no state leaks between tests.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        mongoengine.disconnect(alias="default")
+
+    @classmethod
+    def tearDownClass(cls):
+        mongoengine.connect(db=settings.DATABASE_NAME, host=settings.MONGODB_URI, alias="default")
+        super().tearDownClass()
+
+    def setUp(self):
+        super().setUp()
+        # A fresh connection also drops each document's cached collection, so indexes
+        # (e.g. the unique slugs) are created again on the empty database.
+        mongoengine.connect(
+            db=TEST_DATABASE_NAME,
+            host="mongodb://localhost",
+            alias="default",
+            mongo_client_class=mongomock.MongoClient,
+        )
+        get_connection().drop_database(TEST_DATABASE_NAME)
+        for cache in caches.all():
+            cache.clear()
+        local_cache.deactivate()
+        slug_ids.clear()
+
+    def tearDown(self):
+        mongoengine.disconnect(alias="default")
+        super().tearDown()
@@ -1,3 +1,878 @@
-from django.test import TestCase
+import gzip
+import os
+import shutil
+import tempfile
+import time
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import caches
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage, default_storage
+from django.core.paginator import Paginator
+from django.http import HttpResponse
+from django.template.loader import render_to_string
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from django.utils import timezone
+from pymongo.errors import PyMongoError
+
+from . import benchmarks
+from .compression import CompressedResponseMiddleware, compress, negotiate_encoding
+from .counters import SITE_COUNTERS_ID, counted_delete, counted_update, delete_deltas, reconcile, update_deltas
+from .feeds import build_atom_feed, build_sitemap
+from .fragments import fragment_key
+from .invalidation import ORIGIN, CacheInvalidation, InvalidationListener, LocalCache, local_cache, publish
+from .media_gc import QUARANTINE_PREFIX, collect_garbage, find_orphans
+from .models import Blog, ContactSubmission, Project, SiteCounters, Skill, SkillCategory, UploadSession
+from .object_storage import S3Storage
+from .pageviews import DAY_BUCKET_DAYS, PageViewCounter, ViewBuffer, flush, is_countable, most_read
+from .readmodels import BlogCard, ProjectCard, SkillRow
+from .ratelimit import MemoryBackend, MongoBackend, RateLimitWindow, client_ip, estimate, parse_rate, rate_limit
+from .related import rebuild_related
+from .rollups import (
+    ContactDailyRollup,
+    apply_deltas,
+    daily_activity,
+    day_key,
+    delete_deltas as delete_rollup_deltas,
+    rebuild,
+    update_deltas as update_rollup_deltas,
+)
+from .retention import archive_submissions, archived_count, search_archive
+from .slugs import allocate_slug, find_by_slug, slug_ids
+from .testing import MongoTestCase
+from .uploads import UPLOAD_STAGING_PREFIX, UploadRejected
+
+
+class BenchmarkRoutesTests(MongoTestCase):
+    def test_collect_routes_skips_mutating_admin_routes(self):
+        benchmarks.seed_portfolio(5, seed=0)
+        labels = {label for label, _ in benchmarks.collect_routes()}
+
+        self.assertIn("blog_detail", labels)
+        self.assertIn("admin_blog_edit", labels)
+        for label in labels:
+            self.assertTrue(benchmarks.is_read_only_route(label), label)
+        self.assertNotIn("admin_contact_submissions_bulk_action", labels)
+        self.assertNotIn("admin_skill_toggle_active", labels)
+
+
+class BenchmarkResultsTests(SimpleTestCase):
+    def test_percentile_is_nearest_rank(self):
+        self.assertEqual(benchmarks.percentile([], 95), 0.0)
+        self.assertEqual(benchmarks.percentile([5, 1, 3, 2, 4], 50), 3)
+        self.assertEqual(benchmarks.percentile(list(range(1, 101)), 95), 95)
+
+    def test_compare_results_reports_only_growth_past_thresholds(self):
+        baseline = {"scales": {"10": {"home": {"p95_ms": 10.0, "mongo_commands": 4, "peak_memory_kb": 100.0}}}}
+        current = {"scales": {"10": {"home": {"p95_ms": 11.0, "mongo_commands": 5, "peak_memory_kb": 130.0}}}}
+
+        regressions = benchmarks.compare_results(baseline, current)
+
+        self.assertEqual(len(regressions), 2)
+        self.assertIn("mongo_commands 4 -> 5", regressions[0])
+        self.assertIn("peak_memory_kb 100.0 -> 130.0", regressions[1])
+
+
+class AllocateSlugTests(MongoTestCase):
+    def test_first_free_suffix_is_used(self):
+        Blog(title="Hello World", content="x").save()
+        Blog(title="Hello World", content="x").save()
+        Blog._get_collection().insert_one({"title": "Hello", "slug": "hello-world-3"})
+
+        self.assertEqual(allocate_slug(Blog, "Hello World"), "hello-world-2")
+        self.assertEqual(allocate_slug(Blog, "Hello World!"), "hello-world-2")
+
+    def test_other_prefixes_do_not_count(self):
+        Blog(title="Hello World Again", content="x").save()
+
+        self.assertEqual(allocate_slug(Blog, "Hello World"), "hello-world")
+
+    def test_excluded_document_keeps_its_own_slug(self):
+        blog = Blog(title="Hello", content="x")
+        blog.save()
+
+        self.assertEqual(allocate_slug(Blog, "Hello", exclude_id=blog.id), "hello")
+
+    def test_fallback_and_max_length(self):
+        self.assertEqual(allocate_slug(Blog, "!!!", fallback="post"), "post")
+        self.assertEqual(allocate_slug(Blog, "a" * 50, max_length=20), "a" * 12)
+
+    def test_reserved_slugs_count_as_taken(self):
+        blog = Blog(title="Feed", content="x")
+        blog.save()
+
+        self.assertEqual(blog.slug, "feed-1")
+        self.assertEqual(allocate_slug(Project, "Feed"), "feed")
+
+    def test_find_by_slug_drops_stale_cache_entries(self):
+        blog = Blog(title="Hello", content="x", status="published")
+        blog.save()
+        self.assertEqual(find_by_slug(Blog, "hello").id, blog.id)
+
+        blog.delete()
+
+        self.assertIsNone(find_by_slug(Blog, "hello"))
+        self.assertIsNone(slug_ids.get(Blog._get_collection_name(), "hello"))
+
+
+class RelatedContentTests(MongoTestCase):
+    def _project(self, title, tech_stack, **fields):
+        project = Project(title=title, tech_stack=tech_stack, **fields)
+        project.save()
+        return project
+
+    def _related(self, project):
+        project.reload()
+        return [Project.objects.get(id=related_id).title for related_id in project.related_ids]
+
+    def test_terms_match_regardless_of_case_and_spacing(self):
+        django = self._project("A", ["Django", "Python"])
+        self._project("B", ["python "])
+        self._project("C", ["DJANGO"])
+        self._project("D", ["Rust"])
+
+        self.assertEqual(sorted(self._related(django)), ["B", "C"])
+        self.assertEqual(django.related_terms, {"tech_stack": ["django", "python"]})
+
+    def test_rebuild_backfills_stored_terms(self):
+        collection = Project._get_collection()
+        collection.insert_many([
+            {"title": "A", "tech_stack": ["Django", "Python"], "is_active": True},
+            {"title": "B", "tech_stack": [" python"], "is_active": True},
+            {"title": "C", "tech_stack": ["Python"], "is_active": False},
+        ])
+
+        rebuild_related(Project)
+
+        rows = {row["title"]: row for row in collection.find()}
+        self.assertEqual(rows["B"]["related_terms"], {"tech_stack": ["python"]})
+        self.assertEqual(rows["C"]["related_terms"], {"tech_stack": ["python"]})
+        self.assertEqual(rows["A"]["related_ids"], [rows["B"]["_id"]])
+        self.assertEqual(rows["C"]["related_ids"], [])
+
+    def test_delete_detaches_with_one_bulk_write(self):
+        first = self._project("A", ["python"])
+        second = self._project("B", ["python"])
+        third = self._project("C", ["python"])
+        self.assertEqual(sorted(self._related(second)), ["A", "C"])
+
+        collection_class = type(Project._get_collection())
+        with mock.patch.object(collection_class, "bulk_write", autospec=True,
+                               side_effect=collection_class.bulk_write) as bulk_write:
+            first.delete()
+
+        self.assertEqual(bulk_write.call_count, 1)
+        self.assertEqual(self._related(second), ["C"])
+        self.assertEqual(self._related(third), ["B"])
+
+    def test_ineligible_document_is_dropped_from_lists(self):
+        first = self._project("A", ["python"])
+        second = self._project("B", ["python"])
+
+        first.is_active = False
+        first.save()
+
+        self.assertEqual(self._related(second), [])
+        self.assertEqual(self._related(first), [])
+
+
+    @mock.patch("apps.public.related.MAX_TERM_SHARE", 0)
+    @mock.patch("apps.public.related.MIN_TERM_CUTOFF", 3)
+    def test_incremental_updates_match_a_rebuild(self):
+        # "python" is on more than three active projects, so both paths skip it.
+        self._project("A", ["python", "django"])
+        flask = self._project("B", ["python", "flask"])
+        react = self._project("C", ["python", "django", "react"])
+        self._project("D", ["react", "vue"])
+        self._project("F", ["python", "go"])
+        rebuild_related(Project)
+
+        self._project("E", ["python", "flask", "vue"])
+        flask.tech_stack = ["python", "vue", "go"]
+        flask.save()
+        react.is_active = False
+        react.save()
+
+        def lists():
+            return {
+                row["_id"]: (row["related_ids"], row["related_scores"])
+                for row in Project._get_collection().find({}, {"related_ids": 1, "related_scores": 1})
+            }
+
+        incremental = lists()
+        rebuild_related(Project)
+        self.assertEqual(incremental, lists())
+        self.assertEqual(self._related(Project.objects.get(title="A")), [])
+
+
+class SiteCounterTests(MongoTestCase):
+    def _counters(self):
+        return SiteCounters.objects.get(key=SITE_COUNTERS_ID)
+
+    def test_update_deltas_count_only_membership_changes(self):
+        Blog(title="A", content="x", status="draft").save()
+        Blog(title="B", content="x", status="published").save()
+        Blog(title="C", content="x", status="draft", is_active=False).save()
+        raw_filter = {}
+
+        deltas = update_deltas(Blog, raw_filter, {"status": "published"})
+
+        self.assertEqual(deltas, {"blogs_published": 2, "blogs_draft": -2, "blogs_live": 1})
+
+    def test_delete_deltas(self):
+        Blog(title="A", content="x", status="draft").save()
+        Blog(title="B", content="x", status="published").save()
+
+        deltas = delete_deltas(Blog, {"status": "published"})
+
+        self.assertEqual(deltas, {"blogs_total": -1, "blogs_published": -1, "blogs_draft": 0, "blogs_live": -1})
+
+    def test_counted_writes_match_reconcile(self):
+        for index in range(4):
+            Blog(title=f"Post {index}", content="x", status="draft").save()
+        counted_update(Blog.objects(title__in=["Post 0", "Post 1"]), {"status": "published"})
+        counted_delete(Blog.objects(title="Post 3"))
+        blog = Blog.objects.get(title="Post 2")
+        blog.is_active = False
+        blog.save()
+
+        counters = self._counters()
+        expected = reconcile()
+        for name in Blog.site_counters:
+            self.assertEqual(getattr(counters, name), expected[name], name)
+        self.assertEqual((counters.blogs_total, counters.blogs_published, counters.blogs_live), (3, 2, 2))
+
+    def test_save_without_counted_change_does_not_write_counters(self):
+        blog = Blog(title="A", content="x", status="published")
+        blog.save()
+        blog = Blog.objects.get(id=blog.id)
+
+        with mock.patch("apps.public.counters.increment") as increment:
+            blog.content = "changed"
+            blog.save()
+
+        increment.assert_called_once_with(blogs_total=0, blogs_published=0, blogs_draft=0, blogs_live=0)
+
+
+PNG_HEADER = b"\x89PNG\r\n\x1a\n"
+
+
+class UploadSessionTests(MongoTestCase):
+    def setUp(self):
+        super().setUp()
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        settings_override = override_settings(MEDIA_ROOT=media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def _session(self, size):
+        session = UploadSession(rule="blog_cover", filename="cover.png", content_type="image/png", size=size)
+        session.save()
+        return session
+
+    def test_chunks_are_assembled_in_order(self):
+        data = PNG_HEADER + b"x" * 24
+        session = self._session(len(data))
+
+        session.append(0, data[:16])
+        session.append(16, data[16:])
+
+        self.assertTrue(session.is_complete)
+        self.assertEqual(session.path, "blogs/cover.png")
+        with default_storage.open(session.path) as stored:
+            self.assertEqual(stored.read(), data)
+        self.assertEqual(session.chunks, [])
+        self.assertEqual(default_storage.listdir(f"{UPLOAD_STAGING_PREFIX}/{session.id}")[1], [])
+
+    def test_out_of_order_or_replayed_chunk_is_a_conflict(self):
+        session = self._session(32)
+        session.append(0, PNG_HEADER + b"x" * 8)
+
+        for offset in (0, 24):
+            with self.assertRaises(UploadRejected) as raised:
+                session.append(offset, b"y" * 8)
+            self.assertEqual(raised.exception.status, 409)
+        self.assertEqual(session.received, 16)
+
+    def test_chunk_written_by_another_request_is_not_applied_twice(self):
+        session = self._session(32)
+        stale = UploadSession.objects.get(id=session.id)
+        session.append(0, PNG_HEADER + b"x" * 8)
+
+        with self.assertRaises(UploadRejected) as raised:
+            stale.append(0, PNG_HEADER + b"x" * 8)
+
+        self.assertEqual(raised.exception.status, 409)
+        self.assertEqual(UploadSession.objects.get(id=session.id).chunks, session.chunks)
+
+    def test_limits_and_signature_are_checked(self):
+        session = self._session(16)
+        with self.assertRaises(UploadRejected) as raised:
+            session.append(0, b"GIF89a" + b"x" * 10)
+        self.assertEqual(raised.exception.status, 415)
+        with self.assertRaises(UploadRejected) as raised:
+            session.append(0, PNG_HEADER + b"x" * 16)
+        self.assertEqual(raised.exception.status, 413)
+        with self.assertRaises(UploadRejected):
+            session.append(0, b"")
+
+
+class MediaGcTests(MongoTestCase):
+    def setUp(self):
+        super().setUp()
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        self.storage = FileSystemStorage(location=media_root)
+        self.day_old = time.time() - 86400
+
+    def _file(self, path, modified=None):
+        self.storage.save(path, ContentFile(b"x"))
+        modified = self.day_old if modified is None else modified
+        os.utime(self.storage.path(path), (modified, modified))
+
+    def test_sweeps_only_old_unreferenced_files(self):
+        paths = [
+            "projects/live.jpg", "projects/orphan.jpg", "projects/fresh.jpg",
+            f"{UPLOAD_STAGING_PREFIX}/session/0", "blogs/direct.jpg",
+        ]
+        for path in paths:
+            self._file(path, modified=time.time() if path == "projects/fresh.jpg" else None)
+        Project(title="Live", image_path="projects/live.jpg").save()
+        # An in-flight chunked upload and a direct upload not yet verified.
+        UploadSession(rule="blog_cover", filename="a.png", content_type="image/png", size=10,
+                      chunks=[f"{UPLOAD_STAGING_PREFIX}/session/0"]).save()
+        UploadSession(rule="blog_cover", filename="b.png", content_type="image/png", size=10,
+                      direct_path="blogs/direct.jpg").save()
+
+        self.assertEqual([path for path, _ in find_orphans(timedelta(hours=1), self.storage)], ["projects/orphan.jpg"])
+
+        self.assertEqual(collect_garbage(timedelta(hours=1), mode="dry-run", storage=self.storage), [("projects/orphan.jpg", 1)])
+        self.assertTrue(all(self.storage.exists(path) for path in paths))
+
+        collect_garbage(timedelta(hours=1), mode="delete", storage=self.storage)
+        self.assertEqual([path for path in paths if not self.storage.exists(path)], ["projects/orphan.jpg"])
+
+    def test_grace_period_and_quarantine(self):
+        self._file("projects/orphan.jpg")
+
+        self.assertEqual(collect_garbage(timedelta(days=2), mode="delete", storage=self.storage), [])
+        self.assertTrue(self.storage.exists("projects/orphan.jpg"))
+
+        collect_garbage(timedelta(hours=1), mode="quarantine", storage=self.storage)
+        self.assertFalse(self.storage.exists("projects/orphan.jpg"))
+        stamp = self.storage.listdir(QUARANTINE_PREFIX)[0][0]
+        self.assertTrue(self.storage.exists(f"{QUARANTINE_PREFIX}/{stamp}/projects/orphan.jpg"))
+
+
+class RateLimitTests(SimpleTestCase):
+    def test_parse_rate(self):
+        self.assertEqual(parse_rate("5/m"), (5, 60))
+        self.assertEqual(parse_rate("20 / 15m"), (20, 900))
+        with self.assertRaises(ValueError):
+            parse_rate("5 per minute")
+
+    def test_estimate_weights_the_previous_window_by_its_overlap(self):
+        self.assertEqual(estimate(10, 2, 15, 60), 9.5)
+        self.assertEqual(estimate(10, 2, 0, 60), 12)
+
+    def test_memory_backend_slides_across_windows(self):
+        backend = MemoryBackend()
+        for second in range(5):
+            self.assertEqual(backend.hit("login:ip", 5, 60, now=600 + second), 0)
+        self.assertGreater(backend.hit("login:ip", 5, 60, now=610), 0)
+        self.assertEqual(backend.hit("login:other", 5, 60, now=610), 0)
+
+        # Half-way through the next window, half of the previous window's hits still count.
+        for _ in range(3):
+            self.assertEqual(backend.hit("login:ip", 5, 60, now=690), 0)
+        self.assertGreater(backend.hit("login:ip", 5, 60, now=690), 0)
+
+        # Two windows later nothing is left.
+        self.assertEqual(backend.hit("login:ip", 5, 60, now=800), 0)
+
+    def test_retry_after_is_when_the_estimate_drops_below_the_limit(self):
+        backend = MemoryBackend()
+        for _ in range(5):
+            backend.hit("key", 5, 60, now=600)
+
+        wait = backend.hit("key", 5, 60, now=630)
+
+        self.assertGreater(backend.hit("key", 5, 60, now=630 + wait - 1), 0)
+        self.assertEqual(backend.hit("key", 5, 60, now=630 + wait), 0)
+
+    def test_retry_after_while_the_previous_window_decays(self):
+        backend = MemoryBackend()
+        for _ in range(5):
+            backend.hit("key", 5, 60, now=600)
+        self.assertEqual(backend.hit("key", 5, 60, now=670), 0)
+
+        wait = backend.hit("key", 5, 60, now=670)
+
+        self.assertEqual(wait, 3)
+        self.assertGreater(backend.hit("key", 5, 60, now=670 + wait - 1), 0)
+        self.assertEqual(backend.hit("key", 5, 60, now=670 + wait), 0)
+
+    def test_memory_backend_prunes_lapsed_keys(self):
+        backend = MemoryBackend(max_keys=2)
+        backend.hit("a", 5, 60, now=0)
+        backend.hit("b", 5, 60, now=0)
+        backend.hit("c", 5, 60, now=200)
+
+        self.assertEqual(set(backend._windows), {"c"})
+
+    @override_settings(RATELIMIT_PROXY_COUNT=1, RATELIMIT_ENABLED=True)
+    def test_per_ip_limits_key_on_the_forwarded_client(self):
+        view = rate_limit("contact-ip", "2/m")(lambda request: HttpResponse("ok"))
+        factory = RequestFactory()
+
+        def post(forwarded):
+            # REMOTE_ADDR is the proxy for every visitor; only X-Forwarded-For differs.
+            return view(factory.post("/contact/", REMOTE_ADDR="10.0.0.1", HTTP_X_FORWARDED_FOR=forwarded))
+
+        with mock.patch("apps.public.ratelimit._backend", MemoryBackend()):
+            self.assertEqual([post("203.0.113.7").status_code for _ in range(3)], [200, 200, 429])
+            self.assertEqual(post("spoofed, 198.51.100.4").status_code, 200)
+            self.assertEqual(post("198.51.100.4").status_code, 200)
+            self.assertEqual(post("198.51.100.4").status_code, 429)
+
+    def test_forwarded_header_is_ignored_without_trusted_proxies(self):
+        request = RequestFactory().get("/", REMOTE_ADDR="10.0.0.1", HTTP_X_FORWARDED_FOR="203.0.113.7")
+
+        with override_settings(RATELIMIT_PROXY_COUNT=0):
+            self.assertEqual(client_ip(request), "10.0.0.1")
+        with override_settings(RATELIMIT_PROXY_COUNT=1):
+            self.assertEqual(client_ip(request), "203.0.113.7")
+
+
+class MongoRateLimitTests(MongoTestCase):
+    def setUp(self):
+        super().setUp()
+        # mongomock enforces the TTL index, so the windows must not have expired yet.
+        self.start = (int(time.time()) // 60 + 1) * 60
+
+    def _count(self, key, now):
+        window = RateLimitWindow.objects(id=f"{key}:{now // 60}").first()
+        return window.count if window else 0
+
+    def test_slides_across_windows_and_does_not_count_rejected_hits(self):
+        backend = MongoBackend()
+        for second in range(5):
+            self.assertEqual(backend.hit("login:ip", 5, 60, now=self.start + second), 0)
+        self.assertGreater(backend.hit("login:ip", 5, 60, now=self.start + 10), 0)
+        self.assertEqual(self._count("login:ip", self.start), 5)
+
+        for _ in range(3):
+            self.assertEqual(backend.hit("login:ip", 5, 60, now=self.start + 90), 0)
+        self.assertGreater(backend.hit("login:ip", 5, 60, now=self.start + 90, count=False), 0)
+        self.assertEqual(self._count("login:ip", self.start + 90), 3)
+
+    def test_concurrent_hits_cannot_both_take_the_last_slot(self):
+        backend = MongoBackend()
+        for _ in range(4):
+            backend.hit("contact:ip", 5, 60, now=self.start)
+        other = MongoBackend()
+        racing = []
+
+        def racing_count(collection, window_id):
+            # Another worker's hit lands after this one counted itself but before it checks.
+            if not racing:
+                racing.append(other.hit("contact:ip", 5, 60, now=self.start))
+            return MongoBackend._count(collection, window_id)
+
+        with mock.patch.object(backend, "_count", side_effect=racing_count):
+            wait = backend.hit("contact:ip", 5, 60, now=self.start)
+
+        self.assertEqual(wait, 0)
+        self.assertGreater(racing[0], 0)
+        self.assertEqual(self._count("contact:ip", self.start), 5)
+
+
+class ContactArchiveTests(MongoTestCase):
+    NOW = datetime(2024, 6, 1, tzinfo=dt_timezone.utc)
+
+    def _submission(self, days_ago, is_read=True, **fields):
+        fields.setdefault("name", "Ada")
+        fields.setdefault("email", "ada@example.com")
+        submission = ContactSubmission(submitted_at=self.NOW - timedelta(days=days_ago), is_read=is_read, **fields)
+        submission.save()
+        return submission
+
+    def test_archives_only_old_read_submissions(self):
+        old = self._submission(200, subject="Old read")
+        self._submission(200, is_read=False, subject="Old unread")
+        self._submission(10, subject="Recent read")
+
+        self.assertEqual(dict(archive_submissions(days=180, now=self.NOW, dry_run=True)), {"2023-11": 1})
+        archived = archive_submissions(days=180, now=self.NOW)
+
+        self.assertEqual(dict(archived), {"2023-11": 1})
+        self.assertEqual(ContactSubmission.objects.count(), 2)
+        self.assertFalse(ContactSubmission.objects(id=old.id))
+        self.assertEqual(archived_count(), 1)
+        self.assertEqual(SiteCounters.objects.get().submissions_total, 2)
+
+    def test_search_archive_is_case_insensitive_and_newest_first(self):
+        self._submission(300, subject="Portfolio question")
+        self._submission(200, message="About your PORTFOLIO")
+        self._submission(250, subject="Unrelated")
+        archive_submissions(days=180, now=self.NOW)
+
+        results = search_archive("portfolio")
+
+        self.assertEqual([result.subject or result.message for result in results], ["About your PORTFOLIO", "Portfolio question"])
+        self.assertEqual(len(search_archive()), 3)
+        self.assertEqual(len(search_archive(month="2023-08")), 1)
+
+    def test_rerun_after_interrupted_sweep_does_not_duplicate(self):
+        submission = self._submission(200)
+        with mock.patch("apps.public.retention.counted_delete", side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                archive_submissions(days=180, now=self.NOW)
+
+        archive_submissions(days=180, now=self.NOW)
+
+        self.assertEqual(archived_count(), 1)
+        self.assertEqual([result.id for result in search_archive()], [submission.id])
+        self.assertEqual(ContactSubmission.objects.count(), 0)
+
+
+class CacheInvalidationTests(MongoTestCase):
+    def test_publish_falls_back_to_a_plain_collection_without_capped_support(self):
+        publish({"blogs": 3}, document_id="abc")
+
+        event = CacheInvalidation._get_collection().find_one({"collection": "blogs"})
+        self.assertEqual((event["document_id"], event["version"]), ("abc", 3))
+
+    def test_publish_is_best_effort(self):
+        local_cache.activate()
+        local_cache.get_or_set("blogs", "first", lambda: "cached")
+        with mock.patch.object(CacheInvalidation, "_get_collection", side_effect=NotImplementedError):
+            with self.assertLogs("apps.public.invalidation", "ERROR"):
+                publish({"blogs": 4})
+
+        self.assertEqual(local_cache.get_or_set("blogs", "first", lambda: "fresh"), "fresh")
+
+    def test_listener_evicts_other_workers_changes_only(self):
+        cache = LocalCache()
+        cache.activate()
+        cache.get_or_set("blogs", "first", lambda: "cached")
+        listener = InvalidationListener(cache)
+
+        listener.handle({"collection": "blogs", "origin": ORIGIN})
+        self.assertEqual(cache.get_or_set("blogs", "first", lambda: "fresh"), "cached")
+        listener.handle({"collection": "blogs", "origin": "other-host:1"})
+        self.assertEqual(cache.get_or_set("blogs", "first", lambda: "fresh"), "fresh")
+
+
+class FeedCacheTests(MongoTestCase):
+    def _get(self, path, **headers):
+        return self.client.get(path, secure=True, **headers)
+
+    def test_bytes_are_cached_until_a_save_bumps_the_version(self):
+        Blog(title="First", content="x", status="published", published_date=timezone.now()).save()
+        for path, build, save in (
+            ("/sitemap.xml", build_sitemap, lambda: Project(title="Second").save()),
+            ("/blog/feed/", build_atom_feed,
+             lambda: Blog(title="Second", content="x", status="published", published_date=timezone.now()).save()),
+        ):
+            with self.subTest(path=path):
+                with mock.patch(f"apps.public.views.{build.__name__}", wraps=build) as built:
+                    first = self._get(path)
+                    self.assertEqual(self._get(path).content, first.content)
+                    self.assertEqual(built.call_count, 1)
+
+                    save()
+                    changed = self._get(path)
+
+                self.assertEqual(built.call_count, 2)
+                self.assertNotEqual(changed["ETag"], first["ETag"])
+                self.assertIn(b"second", changed.content)
+
+    def test_conditional_requests_answer_304(self):
+        Blog(title="First", content="x", status="published", published_date=timezone.now()).save()
+        for path in ("/sitemap.xml", "/blog/feed/"):
+            with self.subTest(path=path):
+                first = self._get(path)
+
+                self.assertEqual(self._get(path, HTTP_IF_NONE_MATCH=first["ETag"]).status_code, 304)
+                self.assertEqual(self._get(path, HTTP_IF_MODIFIED_SINCE=first["Last-Modified"]).status_code, 304)
+                self.assertEqual(self._get(path, HTTP_IF_NONE_MATCH='"stale"').status_code, 200)
+
+
+# The manifest storage needs `collectstatic`, which tests do not run.
+@override_settings(STATICFILES_STORAGE="django.contrib.staticfiles.storage.StaticFilesStorage")
+class ReadModelParityTests(MongoTestCase):
+    def setUp(self):
+        super().setUp()
+        self.request = RequestFactory().get("/", secure=True)
+        self.request.user = AnonymousUser()
+        for index in range(3):
+            Project(title=f"Project {index}", description="About it", tech_stack=["Django", "Mongo"],
+                    image_path="projects/a.png" if index else "", github_link="https://github.com/x/y",
+                    is_featured=not index).save()
+            Blog(title=f"Post {index}", content="<p>Text</p>", preview="Preview", tags=["django"],
+                 cover_image_path="blogs/a.png" if index else "", status="published", read_time=index + 1,
+                 author_username="admin", author_display_name="Ada" if index else "",
+                 published_date=datetime(2024, 1, index + 1)).save()
+        category = SkillCategory(name="Languages", is_active=True)
+        category.save()
+        for index, proficiency in enumerate((90, 150, -5)):
+            Skill(name=f"Skill {index}", category=category, proficiency=proficiency, icon="code").save()
+
+    def _render(self, template_name, context):
+        # A cached fragment would hide any difference between the two paths.
+        caches["fragments"].clear()
+        return render_to_string(template_name, context, request=self.request)
+
+    def test_listings_render_and_key_the_same_from_either_path(self):
+        projects = Project.objects(is_active=True).order_by("-created_at")
+        blogs = Blog.objects(status="published", is_active=True).order_by("-published_date")
+        category_names = {category.id: category.name for category in SkillCategory.objects}
+        skills = list(Skill.objects(is_active=True).order_by("name"))
+        for skill in skills:
+            skill.display_proficiency = skill.proficiency_percent
+        skill_rows = SkillRow.load(Skill.objects(is_active=True).order_by("name"), category_names=category_names)
+
+        cases = (
+            ("public/projects.html", "projects", "project-card", list(projects), ProjectCard.load(projects)),
+            ("public/blog_list.html", "blogs", "blog-card", list(blogs), BlogCard.load(blogs)),
+        )
+        for template_name, name, fragment, documents, cards in cases:
+            with self.subTest(template=template_name):
+                rendered = self._render(template_name, {name: Paginator(documents, 6).get_page(1)})
+                self.assertIn(documents[-1].title, rendered)
+                self.assertEqual(rendered, self._render(template_name, {name: Paginator(cards, 6).get_page(1)}))
+                self.assertEqual(fragment_key(f"{name}-grid", documents), fragment_key(f"{name}-grid", cards))
+                for document, card in zip(documents, cards):
+                    self.assertEqual(fragment_key(fragment, document), fragment_key(fragment, card))
+
+        with self.subTest(template="public/skills.html"):
+            rendered = self._render("public/skills.html", {"skills_by_category": {"Languages": skills}})
+            self.assertIn("100%", rendered)
+            self.assertEqual(rendered, self._render("public/skills.html", {"skills_by_category": {"Languages": skill_rows}}))
+            for document, row in zip(skills, skill_rows):
+                self.assertEqual(
+                    fragment_key("skill-card", document, "Languages", document.display_proficiency),
+                    fragment_key("skill-card", row, "Languages", row.display_proficiency),
+                )
+
+
+class ContactRollupTests(MongoTestCase):
+    def _submission(self, submitted_at, email="ada@example.com", is_read=False):
+        submission = ContactSubmission(name="Ada", email=email, submitted_at=submitted_at, is_read=is_read)
+        submission.save()
+        return submission
+
+    def _day(self, day):
+        row = ContactDailyRollup.objects(day=day).first()
+        return (row.submissions, row.read, row.unread, row.distinct_emails)
+
+    def test_saves_and_deletes_keep_daily_counts(self):
+        first = self._submission(datetime(2024, 3, 1, 9))
+        self._submission(datetime(2024, 3, 1, 10), email=" ADA@example.com")
+        self._submission(datetime(2024, 3, 1, 11), email="bob@example.com")
+
+        first.is_read = True
+        first.save()
+        self.assertEqual(self._day(day_key(first.submitted_at)), (3, 1, 2, 2))
+
+        first.delete()
+        self.assertEqual(self._day(day_key(first.submitted_at)), (3, 0, 2, 2))
+
+    def test_update_deltas_only_count_submissions_that_change(self):
+        read = self._submission(datetime(2024, 3, 1, 9), is_read=True)
+        unread = self._submission(datetime(2024, 3, 2, 9))
+        raw_filter = {"_id": {"$in": [read.id, unread.id]}}
+
+        self.assertEqual(update_rollup_deltas(raw_filter, {"is_read": True}), {
+            day_key(unread.submitted_at): {"read": 1, "unread": -1},
+        })
+        self.assertEqual(update_rollup_deltas(raw_filter, {"notes": "x"}), {})
+
+    def test_bulk_paths_match_rebuild(self):
+        for hour in range(4):
+            self._submission(datetime(2024, 3, 1, hour), email=f"user{hour}@example.com")
+        self._submission(datetime(2024, 3, 5, 12))
+        queryset = ContactSubmission.objects(submitted_at__lt=datetime(2024, 3, 1, 2))
+
+        apply_deltas(update_rollup_deltas(queryset._query, {"is_read": True}))
+        queryset.update(set__is_read=True)
+        apply_deltas(delete_rollup_deltas({"submitted_at": {"$gte": datetime(2024, 3, 5)}}))
+        ContactSubmission.objects(submitted_at__gte=datetime(2024, 3, 5)).delete()
+        maintained = {row.day: self._day(row.day)[1:3] for row in ContactDailyRollup.objects}
+
+        rebuild()
+
+        self.assertEqual({row.day: self._day(row.day)[1:3] for row in ContactDailyRollup.objects if row.submissions}, {
+            day: counts for day, counts in maintained.items() if any(counts)
+        })
+
+    def test_rebuild_repairs_days_in_place_and_drops_empty_ones(self):
+        submission = self._submission(datetime(2024, 3, 1, 12))
+        day = day_key(submission.submitted_at)
+        ContactDailyRollup.objects(day=day).update_one(inc__unread=5)
+        ContactDailyRollup(day="2020-01-01", submissions=2, unread=2).save()
+        collection = ContactDailyRollup._get_collection()
+        delete_many = collection.delete_many
+
+        def checked_delete_many(query):
+            # The repaired day is already in place when stale days are removed.
+            self.assertEqual(self._day(day), (1, 0, 1, 1))
+            return delete_many(query)
+
+        with mock.patch.object(collection, "delete_many", side_effect=checked_delete_many):
+            self.assertEqual(rebuild(), 1)
+
+        self.assertEqual([row.day for row in ContactDailyRollup.objects], [day])
+
+    def test_daily_activity_fills_missing_days(self):
+        self._submission(datetime(2024, 3, 2, 12))
+
+        activity = daily_activity(days=3, today=date(2024, 3, 3))
+
+        self.assertEqual([row["day"] for row in activity], [date(2024, 3, 1), date(2024, 3, 2), date(2024, 3, 3)])
+        self.assertEqual([row["submissions"] for row in activity], [0, 1, 0])
+
+
+class PageViewTests(MongoTestCase):
+    def _views(self, counter_id):
+        counter = PageViewCounter.objects(id=counter_id).first()
+        return counter.views if counter else 0
+
+    def test_flush_writes_all_time_and_daily_counters(self):
+        today = timezone.localdate()
+        yesterday = (today - timedelta(days=1)).isoformat()
+        today = today.isoformat()
+        buffer = ViewBuffer()
+        for _ in range(3):
+            buffer.add("blog", "a", day=yesterday)
+        buffer.add("blog", "a", day=today)
+        buffer.add("project", "b", day=today)
+
+        self.assertEqual(flush(buffer), 5)
+        buffer.add("blog", "a", day=today)
+        self.assertEqual(flush(buffer), 1)
+
+        self.assertEqual(self._views("blog:a"), 5)
+        self.assertEqual(self._views(f"blog:a:{yesterday}"), 3)
+        self.assertEqual(self._views(f"blog:a:{today}"), 2)
+        self.assertEqual(self._views("project:b"), 1)
+        self.assertEqual(
+            PageViewCounter.objects.get(id=f"blog:a:{today}").expires_at,
+            datetime.combine(timezone.localdate(), datetime.min.time()) + timedelta(days=DAY_BUCKET_DAYS),
+        )
+        self.assertEqual(len(buffer), 0)
+        self.assertEqual(flush(buffer), 0)
+
+    def test_failed_flush_drops_the_batch(self):
+        buffer = ViewBuffer()
+        buffer.add("blog", "a")
+        with mock.patch.object(PageViewCounter, "_get_collection") as get_collection:
+            get_collection.return_value.bulk_write.side_effect = PyMongoError("down")
+            with self.assertLogs("apps.public.pageviews", "ERROR"):
+                self.assertEqual(flush(buffer), 0)
+
+        self.assertEqual(len(buffer), 0)
+        self.assertEqual(self._views("blog:a"), 0)
+
+    def test_most_read_rankings(self):
+        buffer = ViewBuffer()
+        today = timezone.localdate()
+        for object_id, views, days_ago in (("a", 5, 10), ("b", 3, 0), ("c", 2, 1)):
+            for _ in range(views):
+                buffer.add("blog", object_id, day=(today - timedelta(days=days_ago)).isoformat())
+        flush(buffer)
+
+        self.assertEqual(most_read("blog", "all"), [("a", 5), ("b", 3), ("c", 2)])
+        self.assertEqual(most_read("blog", "week"), [("b", 3), ("c", 2)])
+        with self.assertRaises(ValueError):
+            most_read("blog", "month")
+
+    def test_only_anonymous_human_gets_are_counted(self):
+        factory = RequestFactory()
+        browser = factory.get("/blog/post/", HTTP_USER_AGENT="Mozilla/5.0")
+        browser.user = AnonymousUser()
+        crawler = factory.get("/blog/post/", HTTP_USER_AGENT="Googlebot/2.1")
+        crawler.user = AnonymousUser()
+        post = factory.post("/blog/post/", HTTP_USER_AGENT="Mozilla/5.0")
+        post.user = AnonymousUser()
+
+        self.assertTrue(is_countable(browser))
+        self.assertFalse(is_countable(crawler))
+        self.assertFalse(is_countable(post))
+
+
+class CompressionTests(SimpleTestCase):
+    BODY = b"<p>" + b"portfolio " * 100 + b"</p>"
+
+    def setUp(self):
+        super().setUp()
+        caches["compressed"].clear()
+
+    def _respond(self, accept_encoding="gzip", **headers):
+        def view(request):
+            response = HttpResponse(self.BODY, content_type="text/html; charset=utf-8")
+            for name, value in headers.items():
+                response[name] = value
+            return response
+
+        request = RequestFactory().get("/", HTTP_ACCEPT_ENCODING=accept_encoding)
+        return CompressedResponseMiddleware(view)(request)
+
+    def test_negotiation(self):
+        both = ("br", "gzip")
+        self.assertEqual(negotiate_encoding("gzip, deflate, br", both), "br")
+        self.assertEqual(negotiate_encoding("br;q=0.5, gzip", both), "gzip")
+        self.assertEqual(negotiate_encoding("br;q=0, gzip;q=0", both), None)
+        self.assertEqual(negotiate_encoding("*;q=0.2, br;q=0", both), "gzip")
+        self.assertEqual(negotiate_encoding("identity", both), None)
+        self.assertEqual(negotiate_encoding("br", ("gzip",)), None)
+
+    def test_shared_responses_are_compressed_once(self):
+        with mock.patch("apps.public.compression.compress", wraps=compress) as compressed:
+            first = self._respond()
+            second = self._respond()
+
+        self.assertEqual(compressed.call_count, 1)
+        self.assertEqual(first["Content-Encoding"], "gzip")
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(gzip.decompress(second.content), self.BODY)
+        self.assertIn("Accept-Encoding", second["Vary"])
+
+    def test_per_user_responses_are_not_cached(self):
+        for headers in ({"Set-Cookie": "sessionid=abc"}, {"Vary": "Cookie"}):
+            with self.subTest(headers=headers):
+                response = self._respond(accept_encoding="br, gzip", **headers)
+
+                self.assertEqual(response["Content-Encoding"], "gzip")
+                self.assertEqual(gzip.decompress(response.content), self.BODY)
+        with mock.patch("apps.public.compression.compress", wraps=compress) as compressed:
+            self._respond(Vary="Cookie")
+        compressed.assert_not_called()
+
+    def test_strong_etag_is_weakened(self):
+        self.assertEqual(self._respond(ETag='"abc"')["ETag"], 'W/"abc"')
+        self.assertEqual(self._respond(ETag='W/"abc"')["ETag"], 'W/"abc"')
+        self.assertEqual(self._respond(accept_encoding="identity", ETag='"abc"')["ETag"], '"abc"')
+
+
+class FragmentKeyTests(SimpleTestCase):
+    def test_presigned_urls_roll_the_fragment_key(self):
+        storage = S3Storage(bucket="media", url_expire=3600)
+        public = S3Storage(bucket="media", public_url="https://cdn.example.com")
+
+        with mock.patch("apps.public.fragments.default_storage", public):
+            stable = fragment_key("card", "a")
+        with mock.patch("apps.public.fragments.default_storage", storage):
+            with mock.patch("apps.public.object_storage.time.time", return_value=1800 * 10):
+                first = fragment_key("card", "a")
+            with mock.patch("apps.public.object_storage.time.time", return_value=1800 * 10 + 1799):
+                self.assertEqual(fragment_key("card", "a"), first)
+            with mock.patch("apps.public.object_storage.time.time", return_value=1800 * 11):
+                self.assertNotEqual(fragment_key("card", "a"), first)
+
+        self.assertNotEqual(first, stable)
+        self.assertTrue(stable.startswith("fragment:card:") and stable.count(":") == 2)
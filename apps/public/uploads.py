@@ -0,0 +1,175 @@
+# apps/public/uploads.py
+
+import io
+import os
+import posixpath
+
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.utils.text import get_valid_filename
+
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+UPLOAD_STAGING_PREFIX = "uploads/partial"
+
+# Unfinished or unclaimed sessions (and their staged chunks) expire after this long.
+UPLOAD_SESSION_TTL = 24 * 60 * 60
+
+# How long a presigned direct-to-bucket upload form stays valid.
+DIRECT_UPLOAD_TTL = 10 * 60
+
+# Leading bytes of each accepted content type, checked on the first chunk.
+SIGNATURES = {
+    "image/png": (b"\x89PNG\r\n\x1a\n",),
+    "image/jpeg": (b"\xff\xd8\xff",),
+    "image/gif": (b"GIF87a", b"GIF89a"),
+    "image/webp": (b"RIFF",),
+    "application/pdf": (b"%PDF-",),
+    "application/msword": (b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1",),
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document": (b"PK\x03\x04",),
+}
+
+IMAGE_TYPES = ("image/png", "image/jpeg", "image/gif", "image/webp")
+RESUME_TYPES = (
+    "application/pdf",
+    "application/msword",
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+)
+
+
+class UploadRule:
+    def __init__(self, upload_to, max_bytes, content_types):
+        self.upload_to = upload_to
+        self.max_bytes = max_bytes
+        self.content_types = content_types
+
+
+# Form field key -> limits. `upload_to` matches the field's FileFieldDescriptor.
+UPLOAD_RULES = {
+    "blog_cover": UploadRule("blogs", 5 * 1024 * 1024, IMAGE_TYPES),
+    "project_image": UploadRule("projects", 5 * 1024 * 1024, IMAGE_TYPES),
+    "profile_image": UploadRule("profiles", 5 * 1024 * 1024, IMAGE_TYPES),
+    "profile_resume": UploadRule("resumes", 5 * 1024 * 1024, RESUME_TYPES),
+}
+
+
+class UploadRejected(Exception):
+    """The upload breaks its field's limits; `status` is the HTTP status to answer with."""
+
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+
+def check_declared(rule_key, filename, size, content_type):
+    """Validate what the client declares before any byte is accepted; returns the rule."""
+
+    rule = UPLOAD_RULES.get(rule_key)
+    if rule is None:
+        raise UploadRejected("Unknown upload field.")
+    if not filename:
+        raise UploadRejected("A filename is required.")
+    if not isinstance(size, int) or size <= 0:
+        raise UploadRejected("A positive size is required.")
+    if size > rule.max_bytes:
+        raise UploadRejected(f"File is too large (max {rule.max_bytes // (1024 * 1024)} MB).", status=413)
+    if content_type not in rule.content_types:
+        raise UploadRejected("This file type is not allowed here.", status=415)
+    return rule
+
+
+def check_signature(content_type, head):
+    """Reject content whose leading bytes do not match the declared type."""
+
+    if not any(head.startswith(signature) for signature in SIGNATURES.get(content_type, ())):
+        raise UploadRejected("File contents do not match its type.", status=415)
+    if content_type == "image/webp" and head[8:12] != b"WEBP":
+        raise UploadRejected("File contents do not match its type.", status=415)
+
+
+def check_uploaded_file(rule_key, uploaded):
+    """Apply the same limits to a classic multipart `UploadedFile` before it is stored."""
+
+    rule = check_declared(rule_key, uploaded.name, uploaded.size, uploaded.content_type)
+    head = uploaded.read(16)
+    uploaded.seek(0)
+    check_signature(uploaded.content_type, head)
+    return rule
+
+
+def final_name(rule, filename):
+    name = get_valid_filename(os.path.basename(filename)) or "upload"
+    return posixpath.join(rule.upload_to, name)
+
+
+def direct_upload_name(rule, filename, storage=None):
+    """A fresh name for a direct upload, reserved before any byte arrives.
+
+    Uses the storage's alternative-name suffix unconditionally, as two browsers may
+    upload the same filename at once and neither file exists yet to be checked.
+    """
+
+    storage = storage or default_storage
+    root, ext = posixpath.splitext(final_name(rule, filename))
+    return storage.get_alternative_name(root, ext)
+
+
+class ChunkReader(io.RawIOBase):
+    """Read-only stream over staged chunk files, opened one at a time."""
+
+    def __init__(self, paths, size, storage=None):
+        self.paths = list(paths)
+        self.size = size
+        self.storage = storage or default_storage
+        self._index = 0
+        self._current = None
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        # Storages rewind before copying; only a rewind to the start is supported.
+        if offset != 0 or whence != io.SEEK_SET:
+            raise io.UnsupportedOperation("ChunkReader can only rewind.")
+        self._close_current()
+        self._index = 0
+        return 0
+
+    def readinto(self, buffer):
+        while self._index < len(self.paths):
+            if self._current is None:
+                self._current = self.storage.open(self.paths[self._index], "rb")
+            data = self._current.read(len(buffer))
+            if data:
+                buffer[: len(data)] = data
+                return len(data)
+            self._close_current()
+            self._index += 1
+        return 0
+
+    def _close_current(self):
+        if self._current is not None:
+            self._current.close()
+            self._current = None
+
+    def close(self):
+        self._close_current()
+        super().close()
+
+
+def assemble(rule, filename, chunk_paths, size, storage=None):
+    """Stream the staged chunks into their final storage path and drop them; returns the path."""
+
+    storage = storage or default_storage
+    reader = ChunkReader(chunk_paths, size, storage)
+    try:
+        path = storage.save(final_name(rule, filename), File(reader, name=filename))
+    finally:
+        reader.close()
+    for chunk_path in chunk_paths:
+        storage.delete(chunk_path)
+    return path.replace(os.sep, "/")
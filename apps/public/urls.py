@@ -8,8 +8,10 @@ urlpatterns = [
     path('about/', views.about, name='about'),
     path('skills/', views.skills, name='skills'),
     path('projects/', views.projects, name='projects'),
-    path('projects/<str:id>/', views.project_detail, name='project_detail'),
+    path('projects/<str:slug>/', views.project_detail, name='project_detail'),
     path('blog/', views.blog_list, name='blogs'),
-    path('blog/<str:id>/', views.blog_detail, name='blog_detail'),
+    path('blog/feed/', views.blog_feed, name='blog_feed'),
+    path('blog/<str:slug>/', views.blog_detail, name='blog_detail'),
     path('contact/', views.contact, name='contact'),
+    path('sitemap.xml', views.sitemap, name='sitemap'),
 ]
@@ -2,16 +2,31 @@
 
 from django.contrib import messages
 from django.core.paginator import Paginator
-from django.http import JsonResponse
+from django.http import HttpResponse, HttpResponseNotModified, JsonResponse
 from django.shortcuts import render, redirect
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+from django.views.decorators.http import require_safe
 
 from mongoengine.queryset.visitor import Q
 
 from apps.common_utils import (
+    etag_matches,
     get_active_skill_categories,
-    get_document_or_404,
+    get_document_by_slug_or_404,
     skill_sort_key,
 )
+from .counters import get_site_counters
+from .feeds import (
+    FEED_COLLECTIONS,
+    SITEMAP_COLLECTIONS,
+    build_atom_feed,
+    build_sitemap,
+    cached_document,
+    feed_etag,
+)
+from .invalidation import cached_first
+from .pageviews import most_read_documents, record_view
 from .models import (
     AboutPage,
     Blog,
@@ -29,17 +44,19 @@ from .models import (
     ResearchEntry,
     Skill,
 )
+from .ratelimit import post_field, rate_limit
+from .readmodels import BlogCard, ProjectCard, SkillRow
 
 
 def home(request):
     """Home page view"""
     try:
-        profile = Profile.objects.first()
+        profile = cached_first(Profile)
     except:
         profile = None
     
     try:
-        home_page = HomePage.objects.first()
+        home_page = cached_first(HomePage)
     except:
         home_page = None
 
@@ -51,8 +68,9 @@ def home(request):
     }
     
     # Get counts
-    projects_count = Project.objects.filter(is_active=True).count()
-    blogs_count = Blog.objects.filter(status='published', is_active=True).count()
+    counters = get_site_counters()
+    projects_count = counters.projects_active
+    blogs_count = counters.blogs_live
     
     # Featured skills (top 4)
     active_categories = get_active_skill_categories()
@@ -69,6 +87,12 @@ def home(request):
     # Latest blogs (top 3)
     latest_blogs = Blog.objects.filter(status='published', is_active=True).order_by('-published_date')[:3]
     
+    # Most read blogs this week, or of all time while the week is quiet
+    popular_blogs = (
+        most_read_documents(Blog, 'blog', 'week', limit=5, status='published', is_active=True)
+        or most_read_documents(Blog, 'blog', 'all', limit=5, status='published', is_active=True)
+    )
+    
     context = {
         'profile': profile,
         'home_page': home_page,
@@ -78,6 +102,7 @@ def home(request):
         'featured_skills': featured_skills,
         'featured_projects': featured_projects,
         'latest_blogs': latest_blogs,
+        'popular_blogs': popular_blogs,
         'typing_texts': typing_texts,
     }
     return render(request, 'public/home.html', context)
@@ -86,17 +111,18 @@ def home(request):
 def about(request):
     """About page view"""
     try:
-        profile = Profile.objects.first()
+        profile = cached_first(Profile)
     except:
         profile = None
     
     try:
-        about_page = AboutPage.objects.first()
+        about_page = cached_first(AboutPage)
     except:
         about_page = None
     
-    projects_count = Project.objects.filter(is_active=True).count()
-    blogs_count = Blog.objects.filter(status='published', is_active=True).count()
+    counters = get_site_counters()
+    projects_count = counters.projects_active
+    blogs_count = counters.blogs_live
     
     # Get education entries
     education = Education.objects.all()
@@ -113,10 +139,8 @@ def about(request):
     achievements = Achievement.objects.filter(is_active=True).order_by("order", "-created_at")
     
     latest_education = Education.objects.filter(order=0).order_by('-created_at').first()
-    skill_count = Skill.objects.filter(is_active=True).count()
-    research_count = ResearchEntry.objects.filter(
-        Q(is_active=True) | Q(is_active__exists=False)
-    ).count()
+    skill_count = counters.skills_active
+    research_count = counters.research_active
     hero_stats = [
         {
             'icon': 'bi bi-mortarboard',
@@ -176,10 +200,8 @@ def skills(request):
     active_categories = get_active_skill_categories()
     category_filter = {"category__in": active_categories} if active_categories else {"category__in": []}
     all_skills_qs = Skill.objects.filter(is_active=True, **category_filter)
-    all_skills = sorted(all_skills_qs, key=skill_sort_key)
-    
-    for skill in all_skills:
-        skill.display_proficiency = skill.proficiency_percent
+    category_names = {category.id: category.name for category in active_categories}
+    all_skills = sorted(SkillRow.load(all_skills_qs, category_names=category_names), key=skill_sort_key)
 
     # Group skills by category
     skills_by_category = {}
@@ -196,9 +218,12 @@ def skills(request):
         "web-technologies": "bi bi-browser-chrome",
         "tools-frameworks": "bi bi-gear",
     }
+    skill_counts = {}
+    for skill in all_skills:
+        skill_counts[skill.category] = skill_counts.get(skill.category, 0) + 1
     skill_summaries = []
     for category in active_categories:
-        count = Skill.objects.filter(category=category, is_active=True).count()
+        count = skill_counts.get(category.id, 0)
         skill_summaries.append({
             "name": category.name,
             "count": count,
@@ -206,7 +231,7 @@ def skills(request):
             "icon": ICON_MAP.get(category.slug, "bi bi-star"),
         })
 
-    home_page = HomePage.objects.first()
+    home_page = cached_first(HomePage)
     context = {
         'skills_by_category': skills_by_category,
         'all_skills': all_skills,
@@ -232,10 +257,11 @@ def projects(request):
             Q(description__icontains=search_query)
         )
     
-    # Pagination
-    paginator = Paginator(all_projects, 6)  # 6 projects per page
+    # Pagination (cards are built from raw rows of the current page only)
+    paginator = Paginator(ProjectCard.rows(all_projects), 6)  # 6 projects per page
     page_number = request.GET.get('page')
     projects_page = paginator.get_page(page_number)
+    projects_page.object_list = ProjectCard.build(projects_page.object_list)
     
     context = {
         'projects': projects_page,
@@ -244,12 +270,18 @@ def projects(request):
     return render(request, 'public/projects.html', context)
 
 
-def project_detail(request, id):
+def project_detail(request, slug):
     """Single project detail page view"""
-    project = get_document_or_404(Project, id=id, is_active=True)
+    project = get_document_by_slug_or_404(Project, slug, is_active=True)
+    if project.slug and project.slug != slug:
+        return redirect('project_detail', slug=project.slug, permanent=True)
+    record_view(request, 'project', project.id)
     
-    # Get related projects (same tech stack or recent)
-    related_projects = Project.objects.filter(is_active=True).filter(id__ne=id).order_by('-created_at')[:3]
+    # Get related projects (same tech stack, topped up with recent ones)
+    related_projects = project.related_documents(
+        limit=3,
+        fallback=Project.objects.filter(is_active=True).order_by('-created_at'),
+    )
     
     context = {
         'project': project,
@@ -274,18 +306,16 @@ def blog_list(request):
     # Filter by tag
     tag_filter = request.GET.get('tag', '')
     if tag_filter:
-        all_blogs = [blog for blog in all_blogs if tag_filter in blog.tags]
+        all_blogs = all_blogs.filter(tags=tag_filter)
     
-    # Pagination
-    paginator = Paginator(all_blogs, 6)  # 6 blogs per page
+    # Pagination (cards are built from raw rows of the current page only)
+    paginator = Paginator(BlogCard.rows(all_blogs), 6)  # 6 blogs per page
     page_number = request.GET.get('page')
     blogs_page = paginator.get_page(page_number)
+    blogs_page.object_list = BlogCard.build(blogs_page.object_list)
     
     # Get all unique tags
-    all_tags = set()
-    for blog in Blog.objects.filter(status='published', is_active=True):
-        if blog.tags:
-            all_tags.update(blog.tags)
+    all_tags = set(Blog.objects.filter(status='published', is_active=True).distinct('tags'))
     
     context = {
         'blogs': blogs_page,
@@ -296,19 +326,28 @@ def blog_list(request):
     return render(request, 'public/blog_list.html', context)
 
 
-def blog_detail(request, id):
+def blog_detail(request, slug):
     """Single blog detail page view"""
-    blog = get_document_or_404(Blog, id=id, status='published', is_active=True)
+    blog = get_document_by_slug_or_404(Blog, slug, status='published', is_active=True)
+    if blog.slug and blog.slug != slug:
+        return redirect('blog_detail', slug=blog.slug, permanent=True)
+    record_view(request, 'blog', blog.id)
     
-    # Get related blogs (same tags or recent)
-    related_blogs = Blog.objects.filter(
-        status='published',
-        is_active=True
-    ).filter(id__ne=id).order_by('-published_date')[:3]
+    # Get related blogs (same tags/keywords, topped up with recent ones)
+    related_blogs = blog.related_documents(
+        limit=3,
+        fallback=Blog.objects.filter(status='published', is_active=True).order_by('-published_date'),
+    )
+    
+    # Most read this week, for the sidebar
+    popular_blogs = most_read_documents(
+        Blog, 'blog', 'week', limit=5, exclude=blog.id, status='published', is_active=True,
+    )
     
     context = {
         'blog': blog,
         'related_blogs': related_blogs,
+        'popular_blogs': popular_blogs,
     }
     return render(request, 'public/blog_detail.html', context)
 
@@ -331,15 +370,17 @@ def blog_detail(request, id):
 #     }
 #     return render(request, 'public/contact.html', context)
 
+@rate_limit("contact-ip", "5/10m")
+@rate_limit("contact-email", "3/h", key=post_field("email"))
 def contact(request):
     """Contact page view"""
     try:
-        profile = Profile.objects.first()
+        profile = cached_first(Profile)
     except:
         profile = None
     
     try:
-        contact_page = ContactPage.objects.first()
+        contact_page = cached_first(ContactPage)
     except:
         contact_page = None
     
@@ -395,3 +436,37 @@ def contact(request):
     }
     return render(request, 'public/contact.html', context)
 
+
+def _cached_xml(request, name, collections, build, content_type):
+    """Serve a cached XML document with ETag/Last-Modified, answering 304 when current.
+
+    A matching If-None-Match is answered before the cache is consulted, so pollers that
+    send it back cost one counters lookup.
+    """
+    base_url = f"{request.scheme}://{request.get_host()}"
+    etag = feed_etag(name, base_url, collections)
+    if etag_matches(request, etag):
+        response = HttpResponseNotModified()
+    else:
+        document = cached_document(name, etag, base_url, build)
+        last_modified = int(document.last_modified.timestamp()) if document.last_modified else None
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            response = HttpResponse(document.content, content_type=content_type)
+            if last_modified:
+                response['Last-Modified'] = http_date(last_modified)
+    response['ETag'] = etag
+    patch_cache_control(response, public=True, max_age=300)
+    return response
+
+
+@require_safe
+def sitemap(request):
+    """sitemap.xml for the public pages, projects and blogs"""
+    return _cached_xml(request, 'sitemap', SITEMAP_COLLECTIONS, build_sitemap, 'application/xml')
+
+
+@require_safe
+def blog_feed(request):
+    """Atom feed of the latest published blogs"""
+    return _cached_xml(request, 'atom', FEED_COLLECTIONS, build_atom_feed, 'application/atom+xml; charset=utf-8')
@@ -0,0 +1,142 @@
+# apps/public/warmup.py
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from urllib.parse import urlencode
+from wsgiref.util import setup_testing_defaults
+
+from django.conf import settings
+from django.urls import reverse
+
+from .models import Blog, Project
+
+
+logger = logging.getLogger(__name__)
+
+# Sent with every warm-up request so the compressed-response cache is filled too.
+WARM_ACCEPT_ENCODING = "br, gzip"
+
+_ready = threading.Event()
+
+
+def is_ready():
+    return _ready.is_set()
+
+
+def warm_urls(limit=None):
+    """Public paths worth pre-rendering: the fixed pages, every active project, every
+    published blog and each blog tag page, most recent content first."""
+
+    limit = settings.WARMUP_MAX_URLS if limit is None else limit
+    paths = [reverse(name) for name in ("home", "about", "skills", "projects", "blogs", "contact")]
+
+    projects = Project.objects(is_active=True).order_by("-created_at").only("id", "slug").as_pymongo()
+    paths.extend(reverse("project_detail", args=[row.get("slug") or row["_id"]]) for row in projects)
+
+    tags = set()
+    blogs = Blog.objects(status="published", is_active=True).order_by("-published_date")
+    for row in blogs.only("id", "slug", "tags").as_pymongo():
+        paths.append(reverse("blog_detail", args=[row.get("slug") or row["_id"]]))
+        tags.update(row.get("tags") or ())
+    blog_list = reverse("blogs")
+    paths.extend(f"{blog_list}?{urlencode({'tag': tag})}" for tag in sorted(tags))
+    return paths[:limit] if limit else paths
+
+
+def _host():
+    hosts = [host for host in settings.ALLOWED_HOSTS if host and "*" not in host]
+    return hosts[0].lstrip(".") if hosts else "localhost"
+
+
+def fetch(application, path, host=None):
+    """GET `path` through the WSGI `application` in this process; returns (status, seconds).
+
+    Going through the real handler runs the full middleware stack, so whatever it
+    caches (templates, fragments, compressed bodies, singletons) ends up in this worker.
+    """
+
+    path_info, _, query = path.partition("?")
+    environ = {
+        "REQUEST_METHOD": "GET",
+        "PATH_INFO": path_info,
+        "QUERY_STRING": query,
+        "HTTP_HOST": host or _host(),
+        "HTTP_ACCEPT_ENCODING": WARM_ACCEPT_ENCODING,
+        "wsgi.input": BytesIO(),
+    }
+    if settings.SECURE_PROXY_SSL_HEADER:
+        # Look like a request the proxy terminated TLS for, so SSL redirects don't apply.
+        header, value = settings.SECURE_PROXY_SSL_HEADER
+        environ[header] = value
+        environ["wsgi.url_scheme"] = "https"
+    setup_testing_defaults(environ)
+    status = []
+
+    def start_response(status_line, headers, exc_info=None):
+        status.append(int(status_line.split(" ", 1)[0]))
+
+    start = time.perf_counter()
+    response = application(environ, start_response)
+    try:
+        for _ in response:
+            pass
+    finally:
+        close = getattr(response, "close", None)
+        if close:
+            close()
+    return status[0], time.perf_counter() - start
+
+
+def warm(application, paths=None, concurrency=None):
+    """Request `paths` (default: `warm_urls()`) with at most `concurrency` in flight.
+
+    Returns a list of (path, status, seconds); a failing page is logged with status 0
+    and never stops the rest.
+    """
+
+    paths = warm_urls() if paths is None else paths
+    concurrency = concurrency or settings.WARMUP_CONCURRENCY
+
+    def run(path):
+        try:
+            status, seconds = fetch(application, path)
+        except Exception:
+            logger.exception("Warm-up request for %s failed", path)
+            status, seconds = 0, 0.0
+        return path, status, seconds
+
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="warmup") as pool:
+        return list(pool.map(run, paths))
+
+
+def start_warmup(application):
+    """Warm this worker in the background; `/readyz` answers 200 once it is done.
+
+    The worker serves traffic meanwhile, so readiness only steers the load balancer.
+    Readiness is set even if warming fails: a cold worker beats an unready one.
+    """
+
+    def run():
+        start = time.perf_counter()
+        try:
+            results = warm(application)
+            errors = sum(1 for _, status, _ in results if status >= 500 or status == 0)
+            logger.info(
+                "Warmed %d page(s) in %.1f ms (%d failed)",
+                len(results), (time.perf_counter() - start) * 1000, errors,
+            )
+        except Exception:
+            logger.exception("Cache warm-up failed")
+        finally:
+            _ready.set()
+
+    thread = threading.Thread(target=run, name="cache-warmup", daemon=True)
+    thread.start()
+    return thread
+
+
+def mark_ready():
+    _ready.set()
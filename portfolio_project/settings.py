@@ -70,6 +70,9 @@ else:
     CSRF_COOKIE_SECURE = True
     SECURE_PROXY_SSL_HEADER = ("HTTP_X_FORWARDED_PROTO", "https")
 
+# Platform health checks probe over plain HTTP; a redirect would always look healthy.
+SECURE_REDIRECT_EXEMPT = [r"^healthz$", r"^readyz$"]
+
 SECURE_HSTS_SECONDS = config("SECURE_HSTS_SECONDS", default=0, cast=int)
 SECURE_HSTS_INCLUDE_SUBDOMAINS = config(
     "SECURE_HSTS_INCLUDE_SUBDOMAINS", default=False, cast=bool
@@ -91,11 +94,13 @@ INSTALLED_APPS = [
     "apps.public.apps.PublicConfig",
     "apps.admin_panel.apps.AdminPanelConfig",
     "apps.accounts.apps.AccountsConfig",
+    "apps.api.apps.ApiConfig",
 ]
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
+    "apps.public.compression.CompressedResponseMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -114,8 +119,18 @@ TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
         "DIRS": [BASE_DIR / "templates"],
-        "APP_DIRS": True,
         "OPTIONS": {
+            # Compiled templates are kept per worker (and warmed in wsgi.py); the
+            # wrapper also records compile/render timings per template.
+            "loaders": [
+                (
+                    "apps.public.template_loading.Loader",
+                    [
+                        "django.template.loaders.filesystem.Loader",
+                        "django.template.loaders.app_directories.Loader",
+                    ],
+                ),
+            ],
             "context_processors": [
                 "django.template.context_processors.debug",
                 "django.template.context_processors.request",
@@ -132,7 +147,7 @@ WSGI_APPLICATION = "portfolio_project.wsgi.application"
 
 
 # --------------------------------------------------
-# Database (SQLite for Django auth/admin only)
+# Database (SQLite for Django admin bookkeeping only; users and sessions live in MongoDB)
 # --------------------------------------------------
 DATABASES = {
     "default": {
@@ -142,6 +157,76 @@ DATABASES = {
 }
 
 
+# --------------------------------------------------
+# Caches
+# --------------------------------------------------
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "portfolio-default",
+    },
+    # Brotli/gzip bodies keyed by a hash of the uncompressed response.
+    "compressed": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "portfolio-compressed",
+        "OPTIONS": {"MAX_ENTRIES": 500},
+    },
+    # Rendered template fragments keyed on the documents they show (see fragmentcache).
+    "fragments": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "portfolio-fragments",
+        "TIMEOUT": 24 * 60 * 60,
+        "OPTIONS": {"MAX_ENTRIES": 2000},
+    },
+}
+
+# In-process content caches (apps.public.invalidation.local_cache) are only used while
+# the worker tails the cache_invalidations capped collection for other workers' changes.
+CACHE_INVALIDATION_BUS = config("CACHE_INVALIDATION_BUS", default=True, cast=bool)
+
+# Each worker pre-renders the public pages in the background at start; /readyz answers
+# 503 until it has finished.
+WARMUP_ON_START = config("WARMUP_ON_START", default=True, cast=bool)
+WARMUP_CONCURRENCY = config("WARMUP_CONCURRENCY", default=4, cast=int)
+WARMUP_MAX_URLS = config("WARMUP_MAX_URLS", default=200, cast=int)
+
+# Blog/project views are counted in memory and written to page_views every
+# PAGEVIEW_FLUSH_INTERVAL seconds (or once PAGEVIEW_MAX_PENDING documents are pending).
+PAGEVIEWS_ENABLED = config("PAGEVIEWS_ENABLED", default=True, cast=bool)
+PAGEVIEW_FLUSH_INTERVAL = config("PAGEVIEW_FLUSH_INTERVAL", default=30, cast=int)
+PAGEVIEW_MAX_PENDING = config("PAGEVIEW_MAX_PENDING", default=1000, cast=int)
+PAGEVIEW_RANKING_TIMEOUT = config("PAGEVIEW_RANKING_TIMEOUT", default=300, cast=int)
+
+
+# --------------------------------------------------
+# Sessions & authentication (MongoDB; SQLite is not touched per request)
+# --------------------------------------------------
+SESSION_ENGINE = "apps.accounts.sessions"
+AUTHENTICATION_BACKENDS = ["apps.accounts.backends.MongoUserBackend"]
+
+
+# --------------------------------------------------
+# Rate limiting (contact form, admin login)
+# --------------------------------------------------
+RATELIMIT_ENABLED = config("RATELIMIT_ENABLED", default=True, cast=bool)
+# "memory" counts per worker; "mongo" shares counters through the rate_limits collection.
+RATELIMIT_BACKEND = config("RATELIMIT_BACKEND", default="memory")
+# Proxies in front of the app whose X-Forwarded-For entries can be trusted (Render: 1).
+# Production already trusts one proxy for X-Forwarded-Proto, so it defaults to 1 there;
+# with 0 behind a proxy every visitor would share the proxy's address and one bucket.
+RATELIMIT_PROXY_COUNT = config(
+    "RATELIMIT_PROXY_COUNT", default=1 if SECURE_PROXY_SSL_HEADER else 0, cast=int
+)
+
+
+# --------------------------------------------------
+# Contact submission retention
+# --------------------------------------------------
+# Read submissions older than this move to the compressed contact_archive collection
+# when `manage.py archive_submissions` runs.
+CONTACT_ARCHIVE_AFTER_DAYS = config("CONTACT_ARCHIVE_AFTER_DAYS", default=180, cast=int)
+
+
 # --------------------------------------------------
 # Password validation
 # --------------------------------------------------
@@ -181,6 +266,28 @@ STATICFILES_STORAGE = "whitenoise.storage.CompressedManifestStaticFilesStorage"
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
 
+# "local" keeps uploads under MEDIA_ROOT. "s3" stores them in an S3-compatible bucket
+# (AWS S3, Cloudflare R2, MinIO...) that survives redeploys, and the admin uploads
+# straight to it with presigned POSTs; the bucket's CORS rules must allow POST from
+# the admin's origin.
+MEDIA_STORAGE = config("MEDIA_STORAGE", default="local")
+if MEDIA_STORAGE == "s3":
+    DEFAULT_FILE_STORAGE = "apps.public.object_storage.S3Storage"
+S3_BUCKET = config("S3_BUCKET", default="")
+# Leave empty for AWS; e.g. http://localhost:9000 for a local MinIO.
+S3_ENDPOINT_URL = config("S3_ENDPOINT_URL", default="")
+S3_REGION = config("S3_REGION", default="us-east-1")
+# Empty keys fall back to boto3's usual credential chain (environment, instance role).
+S3_ACCESS_KEY_ID = config("S3_ACCESS_KEY_ID", default="")
+S3_SECRET_ACCESS_KEY = config("S3_SECRET_ACCESS_KEY", default="")
+# Key prefix inside the bucket.
+S3_LOCATION = config("S3_LOCATION", default="")
+# Base URL of a public bucket or CDN; when empty, media URLs are presigned for S3_URL_EXPIRE seconds.
+S3_PUBLIC_URL = config("S3_PUBLIC_URL", default="")
+S3_URL_EXPIRE = config("S3_URL_EXPIRE", default=3600, cast=int)
+# "path" for MinIO and most self-hosted services.
+S3_ADDRESSING_STYLE = config("S3_ADDRESSING_STYLE", default="auto")
+
 
 # --------------------------------------------------
 # Misc
@@ -4,15 +4,25 @@ from django.conf import settings
 from django.conf.urls.static import static
 from django.http import HttpResponse
 
+from apps.public.warmup import is_ready
+
 def healthz(request):
     return HttpResponse("OK")
 
+def readyz(request):
+    """200 once this worker has warmed its caches (see apps.public.warmup), 503 before."""
+    if is_ready():
+        return HttpResponse("OK")
+    return HttpResponse("Warming up", status=503, headers={"Retry-After": "5"})
+
 urlpatterns = [
     path("healthz", healthz),
+    path("readyz", readyz),
     path("django-admin/", admin.site.urls),
     path("", include("apps.public.urls")),
     path("admin/", include("apps.admin_panel.urls")),
     path("accounts/", include("apps.accounts.urls")),
+    path("api/v1/", include("apps.api.urls")),
 ]
 
 # Serve media files in development only
@@ -14,3 +14,32 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'portfolio_project.settings')
 
 application = get_wsgi_application()
+
+# Compile every project template before this worker accepts traffic.
+from apps.public.template_loading import warm_templates  # noqa: E402
+
+warm_templates()
+
+# Tail the cache invalidation bus so this worker drops content other workers change.
+from django.conf import settings  # noqa: E402
+
+if settings.CACHE_INVALIDATION_BUS:
+    from apps.public.invalidation import start_listener  # noqa: E402
+
+    start_listener()
+
+# Write buffered page views periodically instead of once per request.
+if settings.PAGEVIEWS_ENABLED:
+    from apps.public.pageviews import start_flusher  # noqa: E402
+
+    start_flusher()
+
+# Pre-render the public pages into this worker's caches; /readyz reports when done.
+if settings.WARMUP_ON_START:
+    from apps.public.warmup import start_warmup  # noqa: E402
+
+    start_warmup(application)
+else:
+    from apps.public.warmup import mark_ready  # noqa: E402
+
+    mark_ready()
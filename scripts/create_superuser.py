@@ -16,7 +16,7 @@ def main() -> None:
     import django
 
     django.setup()
-    from django.contrib.auth import get_user_model
+    from apps.accounts.models import MongoUser
 
     username = os.environ.get("DJANGO_SUPERUSER_USERNAME")
     password = os.environ.get("DJANGO_SUPERUSER_PASSWORD")
@@ -25,12 +25,13 @@ def main() -> None:
     if not username or not password:
         return
 
-    User = get_user_model()
-    user, _ = User.objects.get_or_create(username=username, defaults={"email": email})
+    user = MongoUser.objects(username=username).first() or MongoUser(username=username, email=email)
     user.email = email or user.email
     user.is_staff = True
     user.is_superuser = True
-    user.set_password(password)
+    # Re-hashing on every boot would change the session auth hash and log everyone out.
+    if not user.password or not user.check_password(password):
+        user.set_password(password)
     user.save()
 
 